@@ -0,0 +1,90 @@
+import contextlib
+import json
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.services.matchers.matchers_benchmark_services import (
+    BENCHMARK_SCALES,
+    run_matching_benchmark,
+)
+
+MATCHING_ENGINES = ("python", "numpy", "parallel")
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark matching engine secara offline dengan data user/job sintetis "
+        "dari ontology.ttl, hasil berupa JSON"
+    )
+    # Tidak perlu memuat URLconf/view (dan dependency scraper) untuk benchmark
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scales",
+            default=",".join(str(scale) for scale in BENCHMARK_SCALES),
+            help="Jumlah user per skala, dipisah koma (default: 100,1000,10000)",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--jobs-per-user",
+            type=float,
+            default=1.0,
+            help="Rasio jumlah job terhadap jumlah user",
+        )
+        parser.add_argument(
+            "--engines",
+            default="python,numpy",
+            help=f"Engine matching, dipisah koma: {', '.join(MATCHING_ENGINES)}",
+        )
+        parser.add_argument("--workers", type=int, default=2)
+        parser.add_argument("--single-user-samples", type=int, default=3)
+        parser.add_argument(
+            "--reference-pair-budget",
+            type=int,
+            default=1_000_000,
+            help="Lewati engine python/SPARQL jika jumlah pair melebihi batas ini",
+        )
+        parser.add_argument(
+            "--trace-memory",
+            action="store_true",
+            help="Ukur peak memory per stage dengan tracemalloc (lebih lambat)",
+        )
+        parser.add_argument(
+            "--output",
+            default="-",
+            help="Path file JSON hasil benchmark (default: stdout)",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            scales = [int(scale) for scale in options["scales"].split(",") if scale]
+        except ValueError:
+            raise CommandError("--scales harus berupa angka dipisah koma")
+
+        engines = [engine for engine in options["engines"].split(",") if engine]
+        unknown_engines = set(engines) - set(MATCHING_ENGINES)
+        if unknown_engines:
+            raise CommandError(f"Unknown engines: {', '.join(sorted(unknown_engines))}")
+
+        # Log service matching diarahkan ke stderr agar stdout hanya berisi JSON
+        with contextlib.redirect_stdout(sys.stderr):
+            report = run_matching_benchmark(
+                scales=scales,
+                seed=options["seed"],
+                jobs_per_user=options["jobs_per_user"],
+                engines=engines,
+                workers=options["workers"],
+                single_user_samples=options["single_user_samples"],
+                reference_pair_budget=options["reference_pair_budget"],
+                trace_memory=options["trace_memory"],
+            )
+
+        report_json = json.dumps(report, indent=2)
+        if options["output"] == "-":
+            self.stdout.write(report_json)
+        else:
+            with open(options["output"], "w", encoding="utf-8") as report_file:
+                report_file.write(report_json)
+            self.stderr.write(f"Benchmark report written to {options['output']}")
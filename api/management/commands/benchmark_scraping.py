@@ -0,0 +1,60 @@
+import contextlib
+import json
+import os
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from api.services.admin.scrapers.scraper_benchmark_services import (
+    run_scraping_benchmark,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark scraper secara offline: replay corpus rekaman "
+        "(SCRAPING_CORPUS_MODE=record) lewat scrape_all_websites, hasil berupa JSON"
+    )
+    # Tidak perlu memuat URLconf/view untuk benchmark
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--corpus",
+            default=settings.SCRAPING_CORPUS_DIR,
+            help="Folder corpus rekaman (default: SCRAPING_CORPUS_DIR)",
+        )
+        parser.add_argument("--http-workers", type=int, default=4)
+        parser.add_argument(
+            "--min-interval",
+            type=float,
+            default=0.0,
+            help="Jarak minimal antar request per domain saat replay (detik)",
+        )
+        parser.add_argument(
+            "--output",
+            default="-",
+            help="Path file JSON hasil benchmark (default: stdout)",
+        )
+
+    def handle(self, *args, **options):
+        corpus_dir = options["corpus"]
+        if not os.path.isdir(corpus_dir):
+            raise CommandError(f"Corpus tidak ditemukan: {corpus_dir}")
+
+        # Log scraper diarahkan ke stderr agar stdout hanya berisi JSON
+        with contextlib.redirect_stdout(sys.stderr):
+            report = run_scraping_benchmark(
+                corpus_dir,
+                min_interval=options["min_interval"],
+                http_workers=options["http_workers"],
+            )
+
+        report_json = json.dumps(report, indent=2)
+        if options["output"] == "-":
+            self.stdout.write(report_json)
+        else:
+            with open(options["output"], "w", encoding="utf-8") as report_file:
+                report_file.write(report_json)
+            self.stderr.write(f"Benchmark report written to {options['output']}")
@@ -0,0 +1,142 @@
+import contextlib
+import json
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.services.matchers.matchers_benchmark_services import (
+    generate_benchmark_dataset,
+)
+from api.services.matchers.matchers_parity_services import (
+    PARITY_ENGINE_FAMILIES,
+    get_engine_family,
+    load_parity_dataset,
+    run_matching_parity,
+    snapshot_parity_dataset_from_neo4j,
+)
+
+PARITY_ENGINES = [
+    engine for engines in PARITY_ENGINE_FAMILIES.values() for engine in engines
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Bandingkan engine matching kandidat dengan engine referensi pada input "
+        "yang sama (delta score, beda kategori, speedup), hasil berupa JSON. "
+        "Exit dengan error jika hasil tidak identik"
+    )
+    # Tidak perlu memuat URLconf/view (dan dependency scraper) untuk parity check
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--candidate",
+            required=True,
+            choices=PARITY_ENGINES,
+            help="Engine yang diuji",
+        )
+        parser.add_argument(
+            "--reference",
+            choices=PARITY_ENGINES,
+            help="Engine referensi (default: baseline / single_user_baseline)",
+        )
+        parser.add_argument("--tolerance", type=float, default=1e-6)
+        parser.add_argument(
+            "--max-excluded-ratio",
+            type=float,
+            help=(
+                "Batas rasio pair yang tidak dibandingkan karena resolusi lexicon "
+                "(default: tanpa batas, hanya skill tidak terduga yang gagal)"
+            ),
+        )
+
+        source = parser.add_mutually_exclusive_group(required=True)
+        source.add_argument(
+            "--fixture",
+            help='File JSON {"users_data": [...], "jobs_data": [...]}',
+        )
+        source.add_argument(
+            "--from-neo4j",
+            action="store_true",
+            help="Pakai get_users_from_neo4j / get_jobs_from_neo4j",
+        )
+        source.add_argument(
+            "--generate",
+            metavar="USERS,JOBS",
+            help="Dataset sintetis dari ontology.ttl, contoh: 200,200",
+        )
+        parser.add_argument(
+            "--save-snapshot",
+            help="Simpan data --from-neo4j ke file JSON untuk dipakai ulang",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--workers", type=int, default=2)
+        parser.add_argument("--single-user-samples", type=int, default=20)
+        parser.add_argument(
+            "--samples",
+            type=int,
+            default=20,
+            help="Jumlah contoh pair yang berbeda di laporan",
+        )
+        parser.add_argument(
+            "--output",
+            default="-",
+            help="Path file JSON hasil parity check (default: stdout)",
+        )
+
+    def handle(self, *args, **options):
+        candidate = options["candidate"]
+        reference = options["reference"]
+        if reference and get_engine_family(reference) != get_engine_family(candidate):
+            raise CommandError(
+                f"{reference} dan {candidate} memakai rumus similarity yang berbeda"
+            )
+
+        # Log service matching diarahkan ke stderr agar stdout hanya berisi JSON
+        with contextlib.redirect_stdout(sys.stderr):
+            if options["fixture"]:
+                dataset = load_parity_dataset(options["fixture"])
+            elif options["from_neo4j"]:
+                dataset = snapshot_parity_dataset_from_neo4j(options["save_snapshot"])
+            else:
+                try:
+                    user_count, job_count = (
+                        int(count) for count in options["generate"].split(",")
+                    )
+                except ValueError:
+                    raise CommandError("--generate harus berformat USERS,JOBS")
+                dataset = generate_benchmark_dataset(
+                    user_count, job_count, options["seed"]
+                )
+
+            report = run_matching_parity(
+                dataset,
+                candidate,
+                reference=reference,
+                tolerance=options["tolerance"],
+                workers=options["workers"],
+                single_user_samples=options["single_user_samples"],
+                sample_size=options["samples"],
+                max_excluded_ratio=options["max_excluded_ratio"],
+            )
+
+        report_json = json.dumps(report, indent=2)
+        if options["output"] == "-":
+            self.stdout.write(report_json)
+        else:
+            with open(options["output"], "w", encoding="utf-8") as report_file:
+                report_file.write(report_json)
+            self.stderr.write(f"Parity report written to {options['output']}")
+
+        if not report["parity"]:
+            excluded = report["dataset"]["excluded_by_lexicon"]
+            raise CommandError(
+                f"{candidate} tidak identik dengan {report['reference']}: "
+                f"{report['missing_pairs']} missing, {report['extra_pairs']} extra, "
+                f"{report['pairs_over_tolerance']} pair di atas tolerance, "
+                f"{report['category_disagreements']} beda kategori, "
+                f"{excluded['pairs']} pair dikecualikan lexicon "
+                f"(rasio {excluded['ratio']:.3f}, "
+                f"{excluded['unexpected_skills']} skill tidak terduga)"
+            )
@@ -80,6 +80,8 @@ class User(StructuredNode):
 
 class Job(StructuredNode):
     jobUrl = StringProperty(required=True, unique_index=True)
+    # Hash jobUrl, lihat build_job_key
+    jobKey = StringProperty(index=True, default=None)
     imageUrl = StringProperty(required=True)
     jobTitle = StringProperty(required=True)
     companyName = StringProperty(required=True)
@@ -0,0 +1,217 @@
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from urllib.parse import urlparse
+
+from django.conf import settings
+
+from api.services.admin.scrapers.helper import (
+    add_cookie_safely,
+    close_driver,
+    get_driver,
+    is_task_cancelled,
+    load_page,
+    update_task_progress,
+)
+
+# uc.Chrome mem-patch binary chromedriver saat start, jadi dibuat satu per satu
+_driver_creation_lock = threading.Lock()
+# Interval thread pemanggil mengecek progress worker (detik)
+PROGRESS_POLL_INTERVAL = 0.5
+
+
+def open_authenticated_driver(start_url: str, cookies: list[dict]):
+    """Buat driver baru lalu pasang cookies dari sesi yang sudah login"""
+    with _driver_creation_lock:
+        driver = get_driver()
+
+    if driver is None:
+        return None
+
+    try:
+        load_page(driver, start_url)
+        for cookie in cookies:
+            add_cookie_safely(driver, cookie)
+        driver.refresh()
+        return driver
+    except Exception as e:
+        print(f"[DRIVER_POOL_ERROR] Failed to open session on {start_url}: {str(e)}")
+        close_driver(driver)
+        return None
+
+
+def get_url_domain(url: str) -> str:
+    return urlparse(url).netloc.lower()
+
+
+def create_domain_politeness(max_concurrency: int, min_interval: float) -> dict:
+    """State politeness per domain yang dibagi semua worker"""
+    return {
+        "lock": threading.Lock(),
+        "max_concurrency": max(1, max_concurrency),
+        "min_interval": max(0.0, min_interval),
+        "semaphores": {},
+        "next_request_at": {},
+    }
+
+
+def acquire_domain_slot(politeness, domain: str, stop_event) -> bool:
+    """
+    Tunggu slot request untuk domain: maksimal max_concurrency request bersamaan
+    dan jarak minimal min_interval detik antar request. False jika dibatalkan.
+    """
+    with politeness["lock"]:
+        semaphore = politeness["semaphores"].setdefault(
+            domain, threading.BoundedSemaphore(politeness["max_concurrency"])
+        )
+
+    while not semaphore.acquire(timeout=0.5):
+        if stop_event.is_set():
+            return False
+
+    with politeness["lock"]:
+        now = time.monotonic()
+        request_at = max(now, politeness["next_request_at"].get(domain, now))
+        politeness["next_request_at"][domain] = request_at + politeness["min_interval"]
+
+    if stop_event.wait(request_at - now):
+        semaphore.release()
+        return False
+
+    return True
+
+
+def release_domain_slot(politeness, domain: str) -> None:
+    politeness["semaphores"][domain].release()
+
+
+def wait_and_report_progress(
+    futures,
+    progress_lock,
+    task_id: str,
+    state: str,
+    progress_data: dict[str, any],
+    update_state_func=None,
+) -> None:
+    """
+    Tunggu semua future sambil push progress dari thread pemanggil.
+    update_state Celery hanya jalan di thread task (request.id kosong di thread
+    lain), jadi worker hanya mengubah progress_data di bawah progress_lock.
+    """
+    # Future bisa sudah selesai sebelum fungsi ini dipanggil, jadi poll pertama
+    # selalu push progress
+    reported_jobs = None
+    pending = set(futures)
+    while pending:
+        done, pending = wait(pending, timeout=PROGRESS_POLL_INTERVAL)
+        for future in done:
+            future.result()
+
+        with progress_lock:
+            if progress_data["scraped_jobs"] == reported_jobs:
+                continue
+            reported_jobs = progress_data["scraped_jobs"]
+            progress_snapshot = dict(progress_data)
+
+        update_task_progress(task_id, state, progress_snapshot, update_state_func)
+
+
+def scrape_job_details_in_parallel(
+    task_id: str,
+    job_urls: list[str],
+    extract_job_details,
+    driver,
+    cookies: list[dict],
+    start_url: str,
+    state: str,
+    progress_data: dict[str, any],
+    update_state_func=None,
+    workers: int | None = None,
+) -> list[dict[str, any]]:
+    """
+    Scrape detail job dengan beberapa driver sekaligus. Driver yang sudah login
+    dipakai worker pertama, worker lain membuka driver baru dengan cookies yang
+    sama. Progress scraped_jobs dijumlahkan dari semua worker dan di-push dari
+    thread pemanggil, hasil tetap urut sesuai job_urls.
+    """
+    workers = max(1, min(workers or settings.SCRAPING_WORKERS, len(job_urls)))
+    politeness = create_domain_politeness(
+        settings.SCRAPING_DOMAIN_MAX_CONCURRENCY,
+        settings.SCRAPING_DOMAIN_MIN_INTERVAL,
+    )
+
+    pending_urls = queue.Queue()
+    for position, job_url in enumerate(job_urls):
+        pending_urls.put((position, job_url))
+
+    stop_event = threading.Event()
+    progress_lock = threading.Lock()
+    job_details = {}
+
+    def run_worker(worker_id: int) -> None:
+        worker_driver = driver
+        if worker_id > 0:
+            if stop_event.is_set() or pending_urls.empty():
+                return
+            worker_driver = open_authenticated_driver(start_url, cookies)
+            if worker_driver is None:
+                print(f"[DRIVER_POOL_WARNING] Worker {worker_id} has no driver")
+                return
+
+        try:
+            while not stop_event.is_set():
+                try:
+                    position, job_url = pending_urls.get_nowait()
+                except queue.Empty:
+                    break
+
+                if is_task_cancelled(task_id):
+                    stop_event.set()
+                    break
+
+                domain = get_url_domain(job_url)
+                if not acquire_domain_slot(politeness, domain, stop_event):
+                    break
+
+                try:
+                    job_detail = extract_job_details(worker_driver, job_url, task_id)
+                except Exception as e:
+                    print(f"[DRIVER_POOL_ERROR] Error processing {job_url}: {str(e)}")
+                    job_detail = None
+                finally:
+                    release_domain_slot(politeness, domain)
+
+                if not job_detail:
+                    print(
+                        f"[DRIVER_POOL_SKIP] Skipping job {position + 1}/{len(job_urls)}: "
+                        "No details extracted"
+                    )
+                    continue
+
+                with progress_lock:
+                    job_details[position] = job_detail
+                    progress_data["scraped_jobs"] += 1
+        finally:
+            if worker_id > 0:
+                close_driver(worker_driver)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        wait_and_report_progress(
+            [executor.submit(run_worker, worker_id) for worker_id in range(workers)],
+            progress_lock,
+            task_id,
+            state,
+            progress_data,
+            update_state_func,
+        )
+
+    print(
+        f"[DRIVER_POOL_INFO] Scraped {len(job_details)}/{len(job_urls)} jobs "
+        f"with {workers} drivers"
+    )
+
+    if stop_event.is_set():
+        return []
+
+    return [job_details[position] for position in sorted(job_details)]
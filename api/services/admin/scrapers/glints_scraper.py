@@ -2,18 +2,43 @@ import datetime
 import random
 import re
 import time
+from urllib.parse import urljoin
 
+from django.conf import settings
 from django.core.cache import cache
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.wait import WebDriverWait
 
+from api.services.admin.scrapers.driver_pool import (
+    open_authenticated_driver,
+    scrape_job_details_in_parallel,
+)
 from api.services.admin.scrapers.helper import (
     close_driver,
+    find_first,
     get_driver,
+    get_inner_html,
+    get_text_content,
     is_task_cancelled,
+    load_page,
+    parse_page_source,
     random_sleep,
     update_task_progress,
+    wait_for_page_ready,
+)
+from api.services.admin.scrapers.http_scraper import (
+    create_http_session,
+    fetch_page_source,
+    scrape_job_details_http_first,
+)
+from api.services.admin.scrapers.scraper_corpus import (
+    is_recording_corpus,
+    is_replaying_corpus,
+    load_corpus_cookies,
+    record_cookies,
+    record_driver_page,
+    record_page,
 )
 
 
@@ -84,6 +109,10 @@ def authenticate_to_glints(task_id: str) -> tuple:
 # ===== URL COLLECTION FUNCTIONS =====
 
 
+GLINTS_HOME_URL = "https://glints.com/id"
+GLINTS_JOB_CATEGORY_URL = "https://glints.com/id/job-category/computer-technology"
+
+
 def get_max_page_number(driver, task_id: str) -> int:
     """Mendapatkan jumlah maksimal halaman"""
     try:
@@ -125,10 +154,7 @@ def collect_job_urls(driver, max_page: int, task_id: str) -> list[str]:
             if is_task_cancelled(task_id):
                 break
 
-            url = f"https://glints.com/id/job-category/computer-technology"
-            url = f"{url}?page={page}" if page > 1 else url
-
-            driver.get(url)
+            load_page(driver, get_listing_page_url(page))
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
             random_sleep(2, 3)
 
@@ -144,6 +170,7 @@ def collect_job_urls(driver, max_page: int, task_id: str) -> list[str]:
             if is_task_cancelled(task_id):
                 break
 
+            record_driver_page(driver, get_listing_page_url(page))
             for job_title_tag in job_title_tags:
                 job_urls.append(job_title_tag.get_attribute("href"))
 
@@ -159,353 +186,289 @@ def collect_job_urls(driver, max_page: int, task_id: str) -> list[str]:
     return job_urls
 
 
-def extract_company_logo(driver, task_id) -> str | None:
-    """Ekstrak URL logo perusahaan"""
-    if is_task_cancelled(task_id):
-        return None
+def get_listing_page_url(page: int) -> str:
+    return (
+        f"{GLINTS_JOB_CATEGORY_URL}?page={page}"
+        if page > 1
+        else GLINTS_JOB_CATEGORY_URL
+    )
 
-    try:
-        img_tag = WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located(
-                (
-                    By.XPATH,
-                    "/html/body/div[2]/div/div[1]/div[2]/div[2]/div[2]/div/main/div[1]/div[1]/img",
-                )
-            )
-        )
 
-        srcset = img_tag.get_attribute("srcset")
-        urls = [item.strip().split(" ") for item in srcset.split(",")]
-        url_dict = {int(size[:-1]): url for url, size in urls}
-        return url_dict[max(url_dict.keys())]
-    except Exception:
-        return "https://img.icons8.com/?size=720&id=53373&format=png&color=000000"
+def parse_max_page_number(page_source: str) -> int:
+    """Jumlah halaman dari HTML listing, sama dengan get_max_page_number"""
+    max_page = 1  # Default jika hanya ada 1 halaman
+    for button in parse_page_source(page_source).xpath(
+        "//button[contains(@class, 'AnchorPaginationsc__Number')]"
+    ):
+        try:
+            max_page = max(max_page, int(get_text_content(button)))
+        except ValueError:
+            continue
 
+    return max_page
 
-def extract_job_title(driver, task_id) -> str | None:
-    """Ekstrak judul pekerjaan"""
-    if is_task_cancelled(task_id):
-        return None
 
-    try:
-        title_tag = WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located(
-                (
-                    By.XPATH,
-                    "/html/body/div[2]/div/div[1]/div[2]/div[2]/div[2]/div/main/div[1]/div[2]/div/div[1]/h1",
-                )
-            )
+def parse_job_urls(page_source: str, page_url: str) -> list[str]:
+    """URL detail job dari HTML listing"""
+    return [
+        urljoin(page_url, href)
+        for href in parse_page_source(page_source).xpath(
+            "//h2/a[starts-with(@href, '/id/opportunities/jobs/')]/@href"
         )
-        return title_tag.get_attribute("textContent").strip()
-    except Exception:
-        return None
+    ]
 
 
-def extract_company_name(driver, task_id) -> str | None:
-    """Ekstrak nama perusahaan"""
-    if is_task_cancelled(task_id):
-        return None
+def collect_job_urls_over_http(session, task_id: str) -> list[str]:
+    """Kumpulkan URL pekerjaan dari halaman listing lewat HTTP"""
+    first_page_source = fetch_page_source(session, GLINTS_JOB_CATEGORY_URL)
+    if not first_page_source:
+        return []
 
-    try:
-        company_tag = WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located(
-                (
-                    By.XPATH,
-                    "/html/body/div[2]/div/div[1]/div[2]/div[2]/div[2]/div/main/div[1]/div[2]/div/div[2]/div/a",
-                )
-            )
+    job_urls = []
+    max_page = parse_max_page_number(first_page_source)
+    for page in range(1, max_page + 1):
+        if is_task_cancelled(task_id):
+            return []
+
+        page_url = get_listing_page_url(page)
+        page_source = (
+            first_page_source if page == 1 else fetch_page_source(session, page_url)
         )
-        return company_tag.get_attribute("textContent").strip()
-    except Exception:
-        return None
+        if page_source:
+            job_urls.extend(parse_job_urls(page_source, page_url))
 
+    return job_urls
 
-def extract_location(driver, task_id) -> dict[str, str | None] | None:
-    """Ekstrak informasi lokasi"""
-    if is_task_cancelled(task_id):
-        return None
 
-    location = {"subdistrict": None, "city": None, "province": None}
+# ===== JOB DETAIL EXTRACTION =====
 
-    # Ekstrak kecamatan
-    try:
-        subdistrict_tag = WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located(
-                (
-                    By.XPATH,
-                    "/html/body/div[2]/div/div[1]/div[2]/div[2]/div[1]/div/label[5]/a",
-                )
-            )
-        )
-        location["subdistrict"] = subdistrict_tag.get_attribute("textContent").strip()
-    except Exception:
-        pass
 
-    if is_task_cancelled(task_id):
-        return None
+GLINTS_DETAIL_MAIN_XPATH = "/html/body/div[2]/div/div[1]/div[2]/div[2]/div[2]/div/main"
+GLINTS_DETAIL_BREADCRUMB_XPATH = "/html/body/div[2]/div/div[1]/div[2]/div[2]/div[1]/div"
+GLINTS_DETAIL_TITLE_XPATH = f"{GLINTS_DETAIL_MAIN_XPATH}/div[1]/div[2]/div/div[1]/h1"
+GLINTS_DEFAULT_LOGO_URL = (
+    "https://img.icons8.com/?size=720&id=53373&format=png&color=000000"
+)
 
-    # Ekstrak kota
+
+def extract_company_logo(tree) -> str | None:
+    """Ekstrak URL logo perusahaan"""
     try:
-        city_tag = WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located(
-                (
-                    By.XPATH,
-                    "/html/body/div[2]/div/div[1]/div[2]/div[2]/div[1]/div/label[4]/a",
-                )
-            )
-        )
-        location["city"] = city_tag.get_attribute("textContent").strip()
+        img_tag = find_first(tree, f"{GLINTS_DETAIL_MAIN_XPATH}/div[1]/div[1]/img")
+        srcset = img_tag.get("srcset")
+        urls = [item.strip().split(" ") for item in srcset.split(",")]
+        url_dict = {int(size[:-1]): url for url, size in urls}
+        return url_dict[max(url_dict.keys())]
     except Exception:
-        pass
+        return GLINTS_DEFAULT_LOGO_URL
 
-    if is_task_cancelled(task_id):
-        return None
 
-    # Ekstrak provinsi
-    try:
-        province_tag = WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located(
-                (
-                    By.XPATH,
-                    "/html/body/div[2]/div/div[1]/div[2]/div[2]/div[1]/div/label[3]/a",
-                )
-            )
-        )
-        location["province"] = province_tag.get_attribute("textContent").strip()
-    except Exception:
-        pass
+def extract_job_title(tree) -> str | None:
+    """Ekstrak judul pekerjaan"""
+    return get_text_content(find_first(tree, GLINTS_DETAIL_TITLE_XPATH))
 
-    return location
 
+def extract_company_name(tree) -> str | None:
+    """Ekstrak nama perusahaan"""
+    return get_text_content(
+        find_first(tree, f"{GLINTS_DETAIL_MAIN_XPATH}/div[1]/div[2]/div/div[2]/div/a")
+    )
 
-def extract_salary(driver, task_id) -> str | None:
-    """Ekstrak informasi gaji"""
-    if is_task_cancelled(task_id):
-        return None
 
-    try:
-        salary_tag = WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located(
-                (
-                    By.XPATH,
-                    "/html/body/div[2]/div/div[1]/div[2]/div[2]/div[2]/div/main/div[3]/div[1]/div/span",
-                )
-            )
-        )
-        salary = salary_tag.get_attribute("textContent").strip()
-        return salary if len(re.findall(r"[\d\.]+", salary)) > 0 else None
-    except Exception:
-        if is_task_cancelled(task_id):
-            return None
+def extract_location(tree) -> dict[str, str | None]:
+    """Ekstrak informasi lokasi"""
+    return {
+        "subdistrict": get_text_content(
+            find_first(tree, f"{GLINTS_DETAIL_BREADCRUMB_XPATH}/label[5]/a")
+        ),
+        "city": get_text_content(
+            find_first(tree, f"{GLINTS_DETAIL_BREADCRUMB_XPATH}/label[4]/a")
+        ),
+        "province": get_text_content(
+            find_first(tree, f"{GLINTS_DETAIL_BREADCRUMB_XPATH}/label[3]/a")
+        ),
+    }
+
+
+def extract_salary(tree) -> str | None:
+    """Ekstrak informasi gaji"""
+    salary_tag = find_first(tree, f"{GLINTS_DETAIL_MAIN_XPATH}/div[3]/div[1]/div/span")
+    if salary_tag is None:
+        # Coba dengan XPath alternatif
+        salary_tag = find_first(tree, f"{GLINTS_DETAIL_MAIN_XPATH}/div[3]/div[1]")
 
-        try:
-            # Coba dengan XPath alternatif
-            salary_tag = WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located(
-                    (
-                        By.XPATH,
-                        "/html/body/div[2]/div/div[1]/div[2]/div[2]/div[2]/div/main/div[3]/div[1]",
-                    )
-                )
-            )
-            salary = salary_tag.get_attribute("textContent").strip()
-            return salary if len(re.findall(r"[\d\.]+", salary)) > 0 else None
-        except Exception:
-            return None
+    salary = get_text_content(salary_tag)
+    return salary if salary and len(re.findall(r"[\d\.]+", salary)) > 0 else None
 
 
-def extract_employment_details(driver, task_id) -> dict[str, str | None] | None:
+def extract_employment_details(tree) -> dict[str, str | None]:
     """Ekstrak jenis pekerjaan dan cara kerja"""
-    if is_task_cancelled(task_id):
-        return None
-
     result = {"employment_type": None, "work_setup": None}
 
-    try:
-        details_tag = WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located(
-                (
-                    By.XPATH,
-                    "/html/body/div[2]/div/div[1]/div[2]/div[2]/div[2]/div/main/div[3]/div[3]",
-                )
-            )
-        )
-
-        details_text = details_tag.get_attribute("textContent").strip()
-        if " · " in details_text:
-            parts = details_text.split(" · ")
-            result["employment_type"] = parts[0]
-            result["work_setup"] = parts[1]
-    except Exception:
-        pass
+    details_text = get_text_content(
+        find_first(tree, f"{GLINTS_DETAIL_MAIN_XPATH}/div[3]/div[3]")
+    )
+    if details_text and " · " in details_text:
+        parts = details_text.split(" · ")
+        result["employment_type"] = parts[0]
+        result["work_setup"] = parts[1]
 
     return result
 
 
-def extract_education(driver, task_id) -> str | None:
+def extract_education(tree) -> str | None:
     """Ekstrak pendidikan minimum"""
-    if is_task_cancelled(task_id):
-        return None
-
-    try:
-        education_tag = WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located(
-                (
-                    By.XPATH,
-                    "/html/body/div[2]/div/div[1]/div[2]/div[2]/div[2]/div/main/div[3]/div[4]",
-                )
-            )
-        )
-        return education_tag.get_attribute("textContent").strip()
-    except Exception:
-        return None
+    return get_text_content(
+        find_first(tree, f"{GLINTS_DETAIL_MAIN_XPATH}/div[3]/div[4]")
+    )
 
 
-def extract_experience(driver, task_id) -> str | None:
+def extract_experience(tree) -> str | None:
     """Ekstrak pengalaman minimum"""
-    if is_task_cancelled(task_id):
-        return None
-
-    try:
-        experience_tag = WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located(
-                (
-                    By.XPATH,
-                    "/html/body/div[2]/div/div[1]/div[2]/div[2]/div[2]/div/main/div[3]/div[5]",
-                )
-            )
-        )
-        experience = experience_tag.get_attribute("textContent").strip()
-        return experience if "pengalaman" in experience.lower() else None
-    except Exception:
-        return None
+    experience = get_text_content(
+        find_first(tree, f"{GLINTS_DETAIL_MAIN_XPATH}/div[3]/div[5]")
+    )
+    return experience if experience and "pengalaman" in experience.lower() else None
 
 
-def extract_skills(driver, task_id) -> list[str] | None:
+def extract_skills(tree) -> list[str]:
     """Ekstrak skill yang dibutuhkan"""
-    if is_task_cancelled(task_id):
-        return None
-
-    try:
-        skills_container = WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located(
-                (
-                    By.XPATH,
-                    "//div[contains(@class, 'Opportunitysc__SkillsContainer-sc-gb4ubh-10 jccjri')]",
-                )
-            )
-        )
-
-        skill_tags = skills_container.find_elements(By.TAG_NAME, "label")
-        return [tag.get_attribute("textContent").strip() for tag in skill_tags]
-    except Exception:
+    skills_container = find_first(
+        tree,
+        "//div[contains(@class, 'Opportunitysc__SkillsContainer-sc-gb4ubh-10 jccjri')]",
+    )
+    if skills_container is None:
         return []
 
+    return [get_text_content(tag) for tag in skills_container.iter("label")]
 
-def extract_description(driver, task_id) -> str | None:
-    """Ekstrak deskripsi pekerjaan"""
-    if is_task_cancelled(task_id):
-        return None
 
-    try:
-        description_container = WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located(
-                (
-                    By.XPATH,
-                    "//div[contains(@class, 'DraftjsReadersc__ContentContainer-sc-zm0o3p-0 pVRwR')]",
-                )
-            )
+def extract_description(tree) -> str | None:
+    """Ekstrak deskripsi pekerjaan"""
+    return get_inner_html(
+        find_first(
+            tree,
+            "//div[contains(@class, 'DraftjsReadersc__ContentContainer-sc-zm0o3p-0 pVRwR')]",
         )
-        return description_container.get_attribute("innerHTML")
-    except Exception:
-        return None
+    )
+
+
+def parse_job_details(page_source: str, job_url: str) -> dict[str, any]:
+    """
+    Ekstrak semua field detail pekerjaan dari HTML halaman dalam satu pass.
+    Field yang tidak ada di halaman langsung bernilai None.
+    """
+    tree = parse_page_source(page_source)
+    location = extract_location(tree)
+    employment_details = extract_employment_details(tree)
+
+    return {
+        "job_url": job_url,
+        "image_url": extract_company_logo(tree),
+        "job_title": extract_job_title(tree),
+        "company_name": extract_company_name(tree),
+        "subdistrict": location["subdistrict"],
+        "city": location["city"],
+        "province": location["province"],
+        "salary": extract_salary(tree),
+        "employment_type": employment_details["employment_type"],
+        "work_setup": employment_details["work_setup"],
+        "minimum_education": extract_education(tree),
+        "minimum_experience": extract_experience(tree),
+        "required_skills": extract_skills(tree),
+        "job_description": extract_description(tree),
+        "scraped_at": datetime.datetime.now().isoformat(),
+    }
 
 
 def extract_job_details(driver, job_url: str, task_id: str) -> dict[str, any] | None:
-    """Ekstrak semua detail pekerjaan dari URL"""
+    """Buka halaman detail, tunggu sekali, lalu parse page_source"""
     if is_task_cancelled(task_id):
         return None
     try:
-        driver.get(job_url)
+        load_page(driver, job_url)
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
         random_sleep(1, 2)
 
         if is_task_cancelled(task_id):
             return None
 
-        img_url = extract_company_logo(driver, task_id)
+        if not wait_for_page_ready(driver, GLINTS_DETAIL_TITLE_XPATH):
+            print(f"[GLINTS_JOB_DETAILS_WARNING] Page not ready in time: {job_url}")
 
-        if is_task_cancelled(task_id):
-            return None
-
-        title = extract_job_title(driver, task_id)
-
-        if is_task_cancelled(task_id):
-            return None
-
-        company_name = extract_company_name(driver, task_id)
-
-        if is_task_cancelled(task_id):
-            return None
-
-        location = extract_location(driver, task_id)
-
-        if is_task_cancelled(task_id):
-            return None
+        page_source = driver.page_source
+        if is_recording_corpus():
+            record_page(job_url, page_source)
 
-        salary = extract_salary(driver, task_id)
+        return parse_job_details(page_source, job_url)
+    except Exception as e:
+        print(
+            f"[GLINTS_JOB_DETAILS_ERROR] Failed to extract job details from {job_url}: {str(e)}"
+        )
+        return None
 
-        if is_task_cancelled(task_id):
-            return None
 
-        employment_details = extract_employment_details(driver, task_id)
+def scrape_glints_jobs_over_http(
+    task_id: str, cookies: list[dict], progress_data: dict, update_state_func=None
+) -> list[dict[str, any]] | None:
+    """
+    Scraping Glints lewat HTTP dengan cookies login, detail yang gagal diulang
+    dengan Selenium. None jika listing tidak bisa diambil lewat HTTP.
+    """
+    session = create_http_session(cookies)
+    fallback_drivers = []
 
-        if is_task_cancelled(task_id):
+    def open_fallback_driver():
+        if is_replaying_corpus():
             return None
 
-        education = extract_education(driver, task_id)
+        driver = open_authenticated_driver(GLINTS_HOME_URL, cookies)
+        fallback_drivers.append(driver)
+        return driver
 
-        if is_task_cancelled(task_id):
-            return None
-
-        experience = extract_experience(driver, task_id)
+    try:
+        update_task_progress(
+            task_id, "COLLECT_GLINTS_JOB_URLS", progress_data, update_state_func
+        )
+        job_urls = collect_job_urls_over_http(session, task_id)
 
         if is_task_cancelled(task_id):
-            return None
-
-        skills = extract_skills(driver, task_id)
+            return []
 
-        if is_task_cancelled(task_id):
+        if not job_urls:
+            print(
+                "[GLINTS_HTTP_WARNING] No job URLs over HTTP, falling back to Selenium"
+            )
             return None
 
-        description = extract_description(driver, task_id)
-
-        if is_task_cancelled(task_id):
-            return None
+        progress_data = {"scraped_jobs": 0}
+        update_task_progress(
+            task_id,
+            "SCRAPING_COLLECTED_GLINTS_JOB_DETAIL",
+            progress_data,
+            update_state_func,
+        )
 
-        # Gabungkan hasil
-        return {
-            "job_url": job_url,
-            "image_url": img_url,
-            "job_title": title,
-            "company_name": company_name,
-            "subdistrict": location["subdistrict"],
-            "city": location["city"],
-            "province": location["province"],
-            "salary": salary,
-            "employment_type": employment_details["employment_type"],
-            "work_setup": employment_details["work_setup"],
-            "minimum_education": education,
-            "minimum_experience": experience,
-            "required_skills": skills,
-            "job_description": description,
-            "scraped_at": datetime.datetime.now().isoformat(),
-        }
-    except Exception as e:
-        print(
-            f"[GLINTS_JOB_DETAILS_ERROR] Failed to extract job details from {job_url}: {str(e)}"
+        return scrape_job_details_http_first(
+            task_id,
+            session,
+            job_urls[:10],
+            parse_job_details,
+            extract_job_details,
+            open_fallback_driver,
+            cookies,
+            GLINTS_HOME_URL,
+            "SCRAPING_COLLECTED_GLINTS_JOB_DETAIL",
+            progress_data,
+            update_state_func,
         )
+    except Exception as e:
+        print(f"[GLINTS_HTTP_ERROR] Fatal error in Glints HTTP scraping: {str(e)}")
         return None
+    finally:
+        for driver in fallback_drivers:
+            close_driver(driver)
+        session.close()
 
 
 def scrape_glints_jobs(
@@ -521,15 +484,28 @@ def scrape_glints_jobs(
     update_task_progress(
         task_id, "GETTING_GLINTS_AUTH_DATA", progress_data, update_state_func
     )
-    cookies, auth_error = authenticate_to_glints(task_id)
-
-    if auth_error or not cookies:
+    if is_replaying_corpus():
+        # Replay corpus: pakai cookies rekaman, tanpa login browser
+        cookies, auth_error = load_corpus_cookies("glints"), None
+    else:
+        cookies, auth_error = authenticate_to_glints(task_id)
+        record_cookies("glints", cookies)
+
+    if auth_error or (not cookies and not is_replaying_corpus()):
         print(f"[GLINTS_MAIN_ERROR] Authentication error: {auth_error}")
         return []
 
     if is_task_cancelled(task_id):
         return []
 
+    # Mode HTTP: browser hanya dipakai untuk fallback
+    if settings.SCRAPING_BACKEND == "http" or is_replaying_corpus():
+        job_data = scrape_glints_jobs_over_http(
+            task_id, cookies, progress_data, update_state_func
+        )
+        if job_data is not None or is_replaying_corpus():
+            return job_data or []
+
     # 2. Inisialisasi driver baru dengan cookies
     driver = get_driver()
     if driver is None:
@@ -541,7 +517,7 @@ def scrape_glints_jobs(
         )
 
         # Set cookies
-        driver.get("https://glints.com/id")
+        load_page(driver, GLINTS_HOME_URL)
         for cookie in cookies:
             try:
                 driver.add_cookie(cookie)
@@ -554,7 +530,7 @@ def scrape_glints_jobs(
         # Refresh dan navigasi
         driver.refresh()
         random_sleep(2, 3)
-        driver.get("https://glints.com/id/job-category/computer-technology")
+        load_page(driver, GLINTS_JOB_CATEGORY_URL)
 
         update_task_progress(
             task_id, "GET_GLINTS_MAX_PAGE", progress_data, update_state_func
@@ -591,37 +567,17 @@ def scrape_glints_jobs(
             update_state_func,
         )
 
-        job_data = []
-        for i, job_url in enumerate(job_urls[:10]):
-            if is_task_cancelled(task_id):
-                break
-
-            try:
-                job_detail = extract_job_details(driver, job_url, task_id)
-
-                if job_detail is None:
-                    print(
-                        f"[GLINTS_JOB_SKIP] Skipping job {i+1}/{len(job_urls[:10])}: No details extracted"
-                    )
-                    continue
-
-                job_data.append(job_detail)
-
-                progress_data["scraped_jobs"] = len(job_data)
-                update_task_progress(
-                    task_id,
-                    "SCRAPING_COLLECTED_GLINTS_JOB_DETAIL",
-                    progress_data,
-                    update_state_func,
-                )
-
-            except Exception as e:
-                print(
-                    f"[GLINTS_JOB_ERROR] Error processing job {i+1}/{len(job_urls[:10])} ({job_url}): {str(e)}"
-                )
-                continue
-
-        return job_data
+        return scrape_job_details_in_parallel(
+            task_id,
+            job_urls[:10],
+            extract_job_details,
+            driver,
+            cookies,
+            GLINTS_HOME_URL,
+            "SCRAPING_COLLECTED_GLINTS_JOB_DETAIL",
+            progress_data,
+            update_state_func,
+        )
 
     except Exception as e:
         print(f"[GLINTS_MAIN_ERROR] Fatal error in Glints scraping: {str(e)}")
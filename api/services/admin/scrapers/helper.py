@@ -1,16 +1,112 @@
+import threading
+import time
+from urllib.parse import urlparse
+from xml.sax.saxutils import escape
+
 import undetected_chromedriver as uc
+from django.conf import settings
 from django.core.cache import cache
 from fake_useragent import UserAgent
+from lxml import html
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.wait import WebDriverWait
 from selenium_stealth import stealth
 
+# Pola URL yang diblokir lewat DevTools pada lean browser: gambar, media, font,
+# analytics dan iklan. Logo tetap terbaca karena srcset hanya atribut di DOM.
+LEAN_BROWSER_BLOCKED_URLS = [
+    "*.png*",
+    "*.jpg*",
+    "*.jpeg*",
+    "*.gif*",
+    "*.webp*",
+    "*.avif*",
+    "*.svg*",
+    "*.ico*",
+    "*.mp4*",
+    "*.webm*",
+    "*.mp3*",
+    "*.woff*",
+    "*.woff2*",
+    "*.ttf*",
+    "*.otf*",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*googleadservices.com*",
+    "*googlesyndication.com*",
+    "*doubleclick.net*",
+    "*connect.facebook.net*",
+    "*analytics.tiktok.com*",
+    "*hotjar.com*",
+    "*clarity.ms*",
+    "*segment.io*",
+    "*mixpanel.com*",
+    "*amplitude.com*",
+    "*sentry.io*",
+]
+LEAN_BROWSER_ARGUMENTS = [
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-notifications",
+    "--mute-audio",
+    "--blink-settings=imagesEnabled=false",
+]
+LEAN_BROWSER_DISABLED_FEATURES = [
+    "Translate",
+    "MediaRouter",
+    "OptimizationHints",
+    "AutofillServerCommunication",
+]
+
+_page_load_lock = threading.Lock()
+_page_load_timings = {}
+
 
 def get_fake_user_agent() -> str:
     ua = UserAgent()
     return ua.random
 
 
+def get_browser_profile() -> str:
+    return "lean" if settings.SCRAPING_LEAN_BROWSER else "full"
+
+
+def apply_lean_browser_options(chrome_options) -> None:
+    """Page load eager, tanpa gambar dan fitur Chrome yang tidak dipakai"""
+    chrome_options.page_load_strategy = "eager"
+    for argument in LEAN_BROWSER_ARGUMENTS:
+        chrome_options.add_argument(argument)
+    chrome_options.add_experimental_option(
+        "prefs",
+        {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        },
+    )
+
+
+def block_unneeded_requests(driver) -> None:
+    """Blokir request gambar, media, font, analytics dan iklan lewat DevTools"""
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd(
+            "Network.setBlockedURLs", {"urls": LEAN_BROWSER_BLOCKED_URLS}
+        )
+    except Exception as e:
+        print(f"[DRIVER_WARNING] Failed to block requests: {str(e)}")
+
+
 def get_driver() -> uc.Chrome | None:
     try:
+        lean_browser = settings.SCRAPING_LEAN_BROWSER
+        disabled_features = ["VizDisplayCompositor"]
+        if lean_browser:
+            disabled_features += LEAN_BROWSER_DISABLED_FEATURES
+
         chrome_options: uc.ChromeOptions = uc.ChromeOptions()
         chrome_options.add_argument("--headless=new")
         chrome_options.add_argument("--disable-dev-shm-usage")
@@ -20,12 +116,15 @@ def get_driver() -> uc.Chrome | None:
         chrome_options.add_argument("--start-maximized")
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
         chrome_options.add_argument("--disable-web-security")
-        chrome_options.add_argument("--disable-features=VizDisplayCompositor")
+        chrome_options.add_argument(f"--disable-features={','.join(disabled_features)}")
         chrome_options.add_argument("--ignore-certificate-errors")
         chrome_options.add_argument("--ignore-ssl-errors")
         chrome_options.add_argument("--ignore-certificate-errors-spki-list")
         chrome_options.add_argument("--ignore-ssl-errors-list")
         chrome_options.add_argument(f"user-agent={get_fake_user_agent()}")
+        if lean_browser:
+            apply_lean_browser_options(chrome_options)
+
         driver: uc.Chrome = uc.Chrome(
             options=chrome_options,
             version_main=136,
@@ -40,6 +139,9 @@ def get_driver() -> uc.Chrome | None:
             renderer="Intel Iris OpenGL Engine",
             fix_hairline=True,
         )
+        if lean_browser:
+            block_unneeded_requests(driver)
+
         return driver
     except Exception as e:
         print(f"Error in Driver: {e}")
@@ -54,6 +156,52 @@ def close_driver(driver) -> None:
             print(f"Error saat menutup driver: {e}")
 
 
+def load_page(driver, url: str) -> None:
+    """driver.get yang mencatat durasi page load per domain dan profil browser"""
+    started_at = time.perf_counter()
+    try:
+        driver.get(url)
+    finally:
+        seconds = time.perf_counter() - started_at
+        key = (get_browser_profile(), urlparse(url).netloc.lower())
+        with _page_load_lock:
+            timing = _page_load_timings.setdefault(
+                key, {"loads": 0, "seconds": 0.0, "max_seconds": 0.0}
+            )
+            timing["loads"] += 1
+            timing["seconds"] += seconds
+            timing["max_seconds"] = max(timing["max_seconds"], seconds)
+
+
+def reset_page_load_timings() -> None:
+    with _page_load_lock:
+        _page_load_timings.clear()
+
+
+def get_page_load_timings() -> list[dict[str, any]]:
+    """Ringkasan page load per (profil, domain), untuk banding full vs lean"""
+    with _page_load_lock:
+        return [
+            {
+                "profile": profile,
+                "domain": domain,
+                "loads": timing["loads"],
+                "avg_seconds": round(timing["seconds"] / timing["loads"], 3),
+                "max_seconds": round(timing["max_seconds"], 3),
+            }
+            for (profile, domain), timing in sorted(_page_load_timings.items())
+        ]
+
+
+def log_page_load_timings() -> None:
+    for timing in get_page_load_timings():
+        print(
+            f"[SCRAPER_PAGE_LOAD] {timing['domain']} ({timing['profile']}): "
+            f"{timing['loads']} loads, avg {timing['avg_seconds']}s, "
+            f"max {timing['max_seconds']}s"
+        )
+
+
 def is_task_cancelled(task_id: str) -> bool:
     return cache.get(f"scraping_cancel_{task_id}") == True
 
@@ -98,3 +246,45 @@ def random_sleep(min_seconds: int = 1, max_seconds: int = 3) -> None:
 
     sleep_time = random.uniform(min_seconds, max_seconds)
     time.sleep(sleep_time)
+
+
+def wait_for_page_ready(driver, xpath: str, timeout: int = 15) -> bool:
+    """Tunggu sekali sampai elemen penanda halaman muncul, False jika timeout"""
+    try:
+        WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located((By.XPATH, xpath))
+        )
+        return True
+    except Exception:
+        return False
+
+
+def parse_page_source(page_source: str):
+    """Parse HTML halaman sekali untuk semua extractor XPath"""
+    return html.fromstring(page_source or "<html></html>")
+
+
+def find_first(tree, xpath: str):
+    """Elemen pertama yang cocok dengan XPath, None jika tidak ada"""
+    elements = tree.xpath(xpath)
+    return elements[0] if elements else None
+
+
+def get_text_content(element) -> str | None:
+    """Sama dengan get_attribute("textContent").strip()"""
+    return element.text_content().strip() if element is not None else None
+
+
+def get_visible_text(element) -> str | None:
+    """Pendekatan WebElement.text: whitespace dirapikan jadi satu spasi"""
+    return " ".join(element.text_content().split()) if element is not None else None
+
+
+def get_inner_html(element) -> str | None:
+    """Sama dengan get_attribute("innerHTML")"""
+    if element is None:
+        return None
+
+    return escape(element.text or "") + "".join(
+        html.tostring(child, encoding="unicode") for child in element
+    )
@@ -0,0 +1,246 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from api.services.admin.scrapers.driver_pool import (
+    acquire_domain_slot,
+    create_domain_politeness,
+    get_url_domain,
+    release_domain_slot,
+    scrape_job_details_in_parallel,
+    wait_and_report_progress,
+)
+from api.services.admin.scrapers.helper import get_fake_user_agent, is_task_cancelled
+from api.services.admin.scrapers.scraper_corpus import (
+    get_replay_base_url,
+    is_recording_corpus,
+    is_replaying_corpus,
+    record_page,
+)
+
+HTTP_REQUEST_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "id-ID,id;q=0.9,en-US;q=0.8,en;q=0.7",
+}
+
+
+def create_http_session(cookies: list[dict] | None = None) -> requests.Session:
+    """
+    Session requests dengan connection pool dan retry, memakai cookies login
+    dari Selenium (driver.get_cookies()).
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=max(settings.SCRAPING_HTTP_WORKERS, 1),
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET",),
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update(
+        {**HTTP_REQUEST_HEADERS, "User-Agent": get_fake_user_agent()}
+    )
+
+    for cookie in cookies or []:
+        try:
+            session.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain", ""),
+                path=cookie.get("path", "/"),
+            )
+        except Exception as e:
+            print(f"[HTTP_SCRAPER_COOKIE_ERROR] Failed to set cookie: {str(e)}")
+
+    return session
+
+
+def resolve_http_url(url: str) -> str:
+    """
+    Arahkan request ke server lokal jika SCRAPING_HTTP_BASE_URL diisi atau
+    mode replay aktif, https://glints.com/id/x menjadi {base}/glints.com/id/x
+    """
+    base_url = settings.SCRAPING_HTTP_BASE_URL
+    if is_replaying_corpus():
+        # Replay tidak pernah ke website asli, tanpa base URL server corpus
+        # lokal dijalankan otomatis
+        base_url = get_replay_base_url()
+
+    if not base_url:
+        return url
+
+    parsed_url = urlparse(url)
+    path = parsed_url.path or "/"
+    query = f"?{parsed_url.query}" if parsed_url.query else ""
+    return f"{base_url.rstrip('/')}/{parsed_url.netloc}{path}{query}"
+
+
+def fetch_page_source(session, url: str) -> str | None:
+    """GET halaman dan return HTML, None jika gagal"""
+    try:
+        response = session.get(
+            resolve_http_url(url), timeout=settings.SCRAPING_HTTP_TIMEOUT
+        )
+        if response.status_code != 200:
+            print(f"[HTTP_SCRAPER_WARNING] {url} returned {response.status_code}")
+            return None
+
+        if is_recording_corpus():
+            record_page(url, response.text)
+
+        return response.text
+    except Exception as e:
+        print(f"[HTTP_SCRAPER_ERROR] Failed to fetch {url}: {str(e)}")
+        return None
+
+
+def fetch_job_details_over_http(
+    task_id: str,
+    session,
+    job_urls: list[str],
+    parse_job_details,
+    state: str,
+    progress_data: dict[str, any],
+    update_state_func=None,
+) -> tuple[dict[int, dict], list[int]]:
+    """
+    Fetch dan parse detail job lewat HTTP secara paralel. Halaman tanpa judul
+    job dianggap gagal (misal butuh render JavaScript). Progress di-push dari
+    thread pemanggil, seperti scrape_job_details_in_parallel.
+    Return (detail per posisi, posisi yang gagal).
+    """
+    politeness = create_domain_politeness(
+        settings.SCRAPING_DOMAIN_MAX_CONCURRENCY,
+        settings.SCRAPING_DOMAIN_MIN_INTERVAL,
+    )
+    stop_event = threading.Event()
+    progress_lock = threading.Lock()
+    job_details = {}
+    failed_positions = []
+
+    def fetch_job(position: int, job_url: str) -> None:
+        if stop_event.is_set():
+            return
+        if is_task_cancelled(task_id):
+            stop_event.set()
+            return
+
+        domain = get_url_domain(job_url)
+        if not acquire_domain_slot(politeness, domain, stop_event):
+            return
+
+        try:
+            page_source = fetch_page_source(session, job_url)
+        finally:
+            release_domain_slot(politeness, domain)
+
+        job_detail = None
+        if page_source:
+            try:
+                job_detail = parse_job_details(page_source, job_url)
+            except Exception as e:
+                print(f"[HTTP_SCRAPER_ERROR] Failed to parse {job_url}: {str(e)}")
+
+        with progress_lock:
+            if not job_detail or not job_detail.get("job_title"):
+                failed_positions.append(position)
+                return
+
+            job_details[position] = job_detail
+            progress_data["scraped_jobs"] += 1
+
+    with ThreadPoolExecutor(max_workers=settings.SCRAPING_HTTP_WORKERS) as executor:
+        wait_and_report_progress(
+            [
+                executor.submit(fetch_job, position, job_url)
+                for position, job_url in enumerate(job_urls)
+            ],
+            progress_lock,
+            task_id,
+            state,
+            progress_data,
+            update_state_func,
+        )
+
+    if stop_event.is_set():
+        return {}, []
+
+    return job_details, sorted(failed_positions)
+
+
+def scrape_job_details_http_first(
+    task_id: str,
+    session,
+    job_urls: list[str],
+    parse_job_details,
+    extract_job_details,
+    open_driver,
+    cookies: list[dict],
+    start_url: str,
+    state: str,
+    progress_data: dict[str, any],
+    update_state_func=None,
+) -> list[dict[str, any]]:
+    """
+    Scrape detail job lewat HTTP, URL yang gagal diulang dengan driver pool
+    Selenium. open_driver dipanggil hanya jika ada URL yang perlu fallback.
+    """
+    started_at = time.perf_counter()
+    job_details, failed_positions = fetch_job_details_over_http(
+        task_id,
+        session,
+        job_urls,
+        parse_job_details,
+        state,
+        progress_data,
+        update_state_func,
+    )
+    print(
+        f"[HTTP_SCRAPER_INFO] Fetched {len(job_details)}/{len(job_urls)} jobs over HTTP "
+        f"in {time.perf_counter() - started_at:.2f}s"
+    )
+
+    if is_task_cancelled(task_id):
+        return []
+
+    if failed_positions:
+        print(
+            f"[HTTP_SCRAPER_INFO] Falling back to Selenium for {len(failed_positions)} jobs"
+        )
+        driver = open_driver()
+        if driver is None:
+            print("[HTTP_SCRAPER_ERROR] No driver available for Selenium fallback")
+        else:
+            fallback_details = scrape_job_details_in_parallel(
+                task_id,
+                [job_urls[position] for position in failed_positions],
+                extract_job_details,
+                driver,
+                cookies,
+                start_url,
+                state,
+                progress_data,
+                update_state_func,
+            )
+            fallback_by_url = {
+                job_detail["job_url"]: job_detail for job_detail in fallback_details
+            }
+            for position in failed_positions:
+                if job_urls[position] in fallback_by_url:
+                    job_details[position] = fallback_by_url[job_urls[position]]
+
+    if is_task_cancelled(task_id):
+        return []
+
+    return [job_details[position] for position in sorted(job_details)]
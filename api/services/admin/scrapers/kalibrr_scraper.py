@@ -3,19 +3,46 @@ import math
 import random
 import re
 import time
+from urllib.parse import urljoin
 
+from django.conf import settings
 from django.core.cache import cache
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.wait import WebDriverWait
 
+from api.services.admin.scrapers.driver_pool import scrape_job_details_in_parallel
 from api.services.admin.scrapers.helper import (
     add_cookie_safely,
     close_driver,
+    find_first,
     get_driver,
+    get_inner_html,
+    get_text_content,
+    get_visible_text,
     is_task_cancelled,
+    load_page,
+    parse_page_source,
     random_sleep,
     update_task_progress,
+    wait_for_page_ready,
+)
+from api.services.admin.scrapers.http_scraper import (
+    create_http_session,
+    fetch_page_source,
+    scrape_job_details_http_first,
+)
+from api.services.admin.scrapers.scraper_corpus import (
+    is_recording_corpus,
+    is_replaying_corpus,
+    load_corpus_cookies,
+    record_cookies,
+    record_driver_page,
+    record_page,
+)
+
+KALIBRR_JOB_BOARD_URL = (
+    "https://jobseeker.kalibrr.com/job-board/i/it-and-software/1?sort=Freshness"
 )
 
 
@@ -61,9 +88,7 @@ def authenticate_to_kalibrr(task_id: str) -> tuple:
         if is_task_cancelled(task_id):
             return None, "Task cancelled"
 
-        driver.get(
-            "https://jobseeker.kalibrr.com/job-board/i/it-and-software/1?sort=Freshness"
-        )
+        load_page(driver, KALIBRR_JOB_BOARD_URL)
 
         random_sleep(2, 3)
 
@@ -80,6 +105,83 @@ def authenticate_to_kalibrr(task_id: str) -> tuple:
 # ===== URL COLLECTION FUNCTIONS =====
 
 
+KALIBRR_PAGINATION_XPATH = "/html/body/kb-app-root/div/main/div/kb-job-board/div/div/div[1]/div[2]/kb-job-board-pagination/div/span"
+KALIBRR_JOB_LINK_XPATH = "//a[contains(@href, '/c/') and contains(@href, '/jobs/') and contains(@class, 'k-font-bold')]"
+
+
+def get_listing_page_url(page: int) -> str:
+    return f"https://jobseeker.kalibrr.com/job-board/i/it-and-software/{page}?sort=Freshness"
+
+
+def calculate_max_page(pagination_text: str) -> int:
+    """Jumlah halaman dari teks pagination (15 job per halaman)"""
+    # Cari angka terakhir setelah "of" menggunakan regex
+    # Pattern untuk menangkap angka setelah "of"
+    match = re.search(r"of\s+(\d+)", pagination_text)
+
+    if match:
+        total_jobs = int(match.group(1))
+
+        # Hitung max page (total jobs dibagi 15, lalu ceil)
+        return math.ceil(total_jobs / 15)
+
+    # Fallback: coba cari semua angka dan ambil yang terbesar
+    numbers = re.findall(r"\d+", pagination_text)
+    if numbers:
+        total_jobs = int(numbers[-1])  # Ambil angka terakhir
+        return math.ceil(total_jobs / 15)
+
+    return 1
+
+
+def add_unique_job_url(job_urls: list[str], seen_urls: set, page_urls: set, href):
+    """Tambah URL job jika belum ada (dibandingkan tanpa query parameters)"""
+    if not href:
+        return
+
+    # Bersihkan URL dari query parameters
+    clean_url = href.split("?")[0]
+
+    # Cek apakah URL sudah ada di set
+    if clean_url not in seen_urls and clean_url not in page_urls:
+        job_urls.append(href)
+        seen_urls.add(clean_url)
+        page_urls.add(clean_url)
+
+
+def collect_job_urls_over_http(session, task_id: str) -> list[str]:
+    """Kumpulkan URL pekerjaan dari halaman listing lewat HTTP"""
+    first_page_source = fetch_page_source(session, get_listing_page_url(1))
+    if not first_page_source:
+        return []
+
+    pagination_text = get_visible_text(
+        find_first(parse_page_source(first_page_source), KALIBRR_PAGINATION_XPATH)
+    )
+    max_page = calculate_max_page(pagination_text) if pagination_text else 1
+
+    job_urls = []
+    seen_urls = set()
+    for page in range(1, max_page + 1):
+        if is_task_cancelled(task_id):
+            return []
+
+        page_url = get_listing_page_url(page)
+        page_source = (
+            first_page_source if page == 1 else fetch_page_source(session, page_url)
+        )
+        if not page_source:
+            continue
+
+        page_urls = set()  # Track URLs untuk halaman ini
+        for href in parse_page_source(page_source).xpath(
+            f"{KALIBRR_JOB_LINK_XPATH}/@href"
+        ):
+            add_unique_job_url(job_urls, seen_urls, page_urls, urljoin(page_url, href))
+
+    return job_urls
+
+
 def get_max_page_number(driver, task_id: str) -> int:
     """Mendapatkan jumlah maksimal halaman"""
     try:
@@ -87,10 +189,7 @@ def get_max_page_number(driver, task_id: str) -> int:
             return 0
 
         # Cari elemen pagination
-        page_span_element = driver.find_element(
-            By.XPATH,
-            "/html/body/kb-app-root/div/main/div/kb-job-board/div/div/div[1]/div[2]/kb-job-board-pagination/div/span",
-        )
+        page_span_element = driver.find_element(By.XPATH, KALIBRR_PAGINATION_XPATH)
 
         if is_task_cancelled(task_id):
             return 0
@@ -99,23 +198,7 @@ def get_max_page_number(driver, task_id: str) -> int:
 
         if page_span_element:
             # Ambil teks dari elemen span
-            pagination_text = page_span_element.text.strip()
-
-            # Cari angka terakhir setelah "of" menggunakan regex
-            # Pattern untuk menangkap angka setelah "of"
-            match = re.search(r"of\s+(\d+)", pagination_text)
-
-            if match:
-                total_jobs = int(match.group(1))
-
-                # Hitung max page (total jobs dibagi 15, lalu ceil)
-                max_page = math.ceil(total_jobs / 15)
-            else:
-                # Fallback: coba cari semua angka dan ambil yang terbesar
-                numbers = re.findall(r"\d+", pagination_text)
-                if numbers:
-                    total_jobs = int(numbers[-1])  # Ambil angka terakhir
-                    max_page = math.ceil(total_jobs / 15)
+            max_page = calculate_max_page(page_span_element.text.strip())
 
         if is_task_cancelled(task_id):
             return 0
@@ -141,9 +224,7 @@ def collect_job_urls(
             if is_task_cancelled(task_id):
                 break
 
-            url = f"https://jobseeker.kalibrr.com/job-board/i/it-and-software/{page}?sort=Freshness"
-
-            driver.get(url)
+            load_page(driver, get_listing_page_url(page))
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
             random_sleep(2, 3)
 
@@ -151,29 +232,21 @@ def collect_job_urls(
                 break
 
             job_link_elements = WebDriverWait(driver, 15).until(
-                EC.presence_of_all_elements_located(
-                    (
-                        By.XPATH,
-                        "//a[contains(@href, '/c/') and contains(@href, '/jobs/') and contains(@class, 'k-font-bold')]",
-                    )
-                )
+                EC.presence_of_all_elements_located((By.XPATH, KALIBRR_JOB_LINK_XPATH))
             )
 
             if is_task_cancelled(task_id):
                 break
 
+            record_driver_page(driver, get_listing_page_url(page))
             page_urls = set()  # Track URLs untuk halaman ini
             for job_link_element in job_link_elements:
-                href = job_link_element.get_attribute("href")
-                if href:
-                    # Bersihkan URL dari query parameters
-                    clean_url = href.split("?")[0]
-
-                    # Cek apakah URL sudah ada di set
-                    if clean_url not in seen_urls and clean_url not in page_urls:
-                        job_urls.append(href)
-                        seen_urls.add(clean_url)
-                        page_urls.add(clean_url)
+                add_unique_job_url(
+                    job_urls,
+                    seen_urls,
+                    page_urls,
+                    job_link_element.get_attribute("href"),
+                )
 
         except Exception as e:
             print(
@@ -187,329 +260,230 @@ def collect_job_urls(
     return job_urls
 
 
-def extract_company_logo(driver, task_id) -> str | None:
-    """Ekstrak URL logo perusahaan"""
-    if is_task_cancelled(task_id):
-        return None
+# ===== JOB DETAIL EXTRACTION =====
 
-    try:
-        img_tag = WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located(
-                (
-                    By.XPATH,
-                    "/html/body/kb-app-root/div/main/div/kb-job-full-page/div/div/kb-job-page/div/div/div[1]/div[1]/kb-company-logo/a/div/img",
-                )
-            )
-        )
 
-        return img_tag.get_attribute("src")
+KALIBRR_DETAIL_HEADER_XPATH = "/html/body/kb-app-root/div/main/div/kb-job-full-page/div/div/kb-job-page/div/div/div[1]/div[1]"
+KALIBRR_DETAIL_TITLE_XPATH = f"{KALIBRR_DETAIL_HEADER_XPATH}/h1"
+KALIBRR_DEFAULT_LOGO_URL = (
+    "https://img.icons8.com/?size=720&id=53373&format=png&color=000000"
+)
+
 
-    except Exception:
-        return "https://img.icons8.com/?size=720&id=53373&format=png&color=000000"
+def extract_company_logo(tree, job_url: str) -> str | None:
+    """Ekstrak URL logo perusahaan"""
+    img_tag = find_first(
+        tree, f"{KALIBRR_DETAIL_HEADER_XPATH}/kb-company-logo/a/div/img"
+    )
+    if img_tag is None or not img_tag.get("src"):
+        return KALIBRR_DEFAULT_LOGO_URL
 
+    # get_attribute("src") selalu mengembalikan URL absolut
+    return urljoin(job_url, img_tag.get("src"))
 
-def extract_job_title(driver, task_id) -> str | None:
-    """Ekstrak judul pekerjaan"""
-    if is_task_cancelled(task_id):
-        return None
 
-    try:
-        title_tag = WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located(
-                (
-                    By.XPATH,
-                    "/html/body/kb-app-root/div/main/div/kb-job-full-page/div/div/kb-job-page/div/div/div[1]/div[1]/h1",
-                )
-            )
-        )
-        return title_tag.get_attribute("textContent").strip()
-    except Exception:
-        return None
+def extract_job_title(tree) -> str | None:
+    """Ekstrak judul pekerjaan"""
+    return get_text_content(find_first(tree, KALIBRR_DETAIL_TITLE_XPATH))
 
 
-def extract_company_name(driver, task_id) -> str | None:
+def extract_company_name(tree) -> str | None:
     """Ekstrak nama perusahaan"""
-    if is_task_cancelled(task_id):
-        return None
-
-    try:
-        company_tag = WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located(
-                (
-                    By.XPATH,
-                    "/html/body/kb-app-root/div/main/div/kb-job-full-page/div/div/kb-job-page/div/div/div[1]/div[1]/span/a/h2",
-                )
-            )
-        )
-        return company_tag.get_attribute("textContent").strip()
-    except Exception:
-        return None
+    return get_text_content(
+        find_first(tree, f"{KALIBRR_DETAIL_HEADER_XPATH}/span/a/h2")
+    )
 
 
-def extract_location(driver, task_id) -> dict[str, str | None] | None:
+def extract_location(tree) -> dict[str, str | None]:
     """Ekstrak informasi lokasi"""
-    if is_task_cancelled(task_id):
-        return None
-
-    location = {"city": None}
-
-    # Ekstrak kota
-    try:
-        location_tag = WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located(
-                (
-                    By.XPATH,
-                    "/html/body/kb-app-root/div/main/div/kb-job-full-page/div/div/kb-job-page/div/div/div[1]/div[1]/ul/li[1]/a",
-                )
+    # Kota ada di span itemprop="addressLocality" pada item lokasi
+    return {
+        "city": get_visible_text(
+            find_first(
+                tree,
+                f"{KALIBRR_DETAIL_HEADER_XPATH}/ul/li[1]/a//span[@itemprop='addressLocality']",
             )
         )
+    }
 
-        # Cari elemen span dengan itemprop="addressLocality" untuk mendapatkan kota
-        city_span = location_tag.find_element(
-            By.XPATH, ".//span[@itemprop='addressLocality']"
-        )
-
-        location["city"] = city_span.text.strip()
-    except Exception:
-        pass
-
-    if is_task_cancelled(task_id):
-        return None
-
-    return location
 
-
-def extract_salary(driver, task_id) -> str | None:
+def extract_salary(tree) -> str | None:
     """Ekstrak informasi gaji"""
-    if is_task_cancelled(task_id):
-        return None
-
-    try:
-        # Cari elemen ul yang berisi informasi gaji
-        ul_element = WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located(
-                (
-                    By.XPATH,
-                    "/html/body/kb-app-root/div/main/div/kb-job-full-page/div/div/kb-job-page/div/div/div[1]/div[1]/ul",
-                )
-            )
-        )
-
-        # Cari elemen kb-salary-range di dalam ul
-        salary_element = ul_element.find_element(
-            By.XPATH, ".//a[contains(@href, '/job-board/sgt/')]"
+    salary_text = get_visible_text(
+        find_first(
+            tree,
+            f"{KALIBRR_DETAIL_HEADER_XPATH}/ul//a[contains(@href, '/job-board/sgt/')]",
         )
+    )
 
-        # Ambil text dari elemen salary
-        salary_text = salary_element.text.strip()
-
-        # Validasi apakah ada angka dalam text gaji
-        if salary_text and len(re.findall(r"[\d\.,]+", salary_text)) > 0:
-            return salary_text
-        else:
-            return None
-
-    except Exception:
-        return None
+    # Validasi apakah ada angka dalam text gaji
+    if salary_text and len(re.findall(r"[\d\.,]+", salary_text)) > 0:
+        return salary_text
+    return None
 
 
-def extract_employment_details(driver, task_id) -> dict[str, str | None] | None:
+def extract_employment_details(tree) -> dict[str, str | None]:
     """Ekstrak jenis pekerjaan dan cara kerja"""
-    if is_task_cancelled(task_id):
-        return None
-
     result = {"employment_type": None, "work_setup": "Kerja di kantor"}
 
-    try:
-        # Cari elemen ul yang berisi informasi employment details
-        ul_element = WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located(
-                (
-                    By.XPATH,
-                    "/html/body/kb-app-root/div/main/div/kb-job-full-page/div/div/kb-job-page/div/div/div[1]/div[1]/ul",
-                )
-            )
-        )
-
-        # Ekstrak employment type (Penuh waktu, Kontrak, dll.)
-        try:
-            employment_type_element = ul_element.find_element(
-                By.XPATH, ".//a[contains(@href, '/job-board/t/')]"
-            )
-            result["employment_type"] = employment_type_element.text.strip()
-        except Exception:
-            pass
+    ul_element = find_first(tree, f"{KALIBRR_DETAIL_HEADER_XPATH}/ul")
+    if ul_element is None:
+        return result
 
-        # Ekstrak work setup (Hibrida, Jarak jauh, dll.)
-        try:
-            work_setup_element = ul_element.find_element(
-                By.XPATH, ".//a[contains(@href, '/y/')]"
-            )
-            work_setup_spans = work_setup_element.find_elements(By.TAG_NAME, "span")
-            work_setup_text = (
-                work_setup_spans[1].get_attribute("textContent").strip()
-                if len(work_setup_spans) > 1
-                else ""
-            )
-            result["work_setup"] = work_setup_text
-        except Exception:
-            pass
+    # Ekstrak employment type (Penuh waktu, Kontrak, dll.)
+    employment_type_element = find_first(
+        ul_element, ".//a[contains(@href, '/job-board/t/')]"
+    )
+    if employment_type_element is not None:
+        result["employment_type"] = get_visible_text(employment_type_element)
+
+    # Ekstrak work setup (Hibrida, Jarak jauh, dll.)
+    work_setup_element = find_first(ul_element, ".//a[contains(@href, '/y/')]")
+    if work_setup_element is not None:
+        work_setup_spans = work_setup_element.xpath(".//span")
+        result["work_setup"] = (
+            get_text_content(work_setup_spans[1]) if len(work_setup_spans) > 1 else ""
+        )
 
-        return result
-    except Exception:
-        return result
+    return result
 
 
-def extract_education(driver, task_id) -> str | None:
+def extract_education(tree) -> str | None:
     """Ekstrak pendidikan minimum"""
-    if is_task_cancelled(task_id):
-        return None
-
-    try:
-        education_tag = WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located(
-                (
-                    By.XPATH,
-                    "//a[contains(@href, '/job-board/e/')]",
-                )
-            )
-        )
-        return education_tag.get_attribute("textContent").strip()
-    except Exception as e:
-        return None
+    return get_text_content(find_first(tree, "//a[contains(@href, '/job-board/e/')]"))
 
 
-def extract_description(driver, task_id) -> str | None:
+def extract_description(tree) -> str | None:
     """Ekstrak deskripsi pekerjaan"""
-    if is_task_cancelled(task_id):
+    # Cari container utama yang berisi semua konten job description
+    main_container = find_first(
+        tree, "//div[contains(@class, 'md:k-w-full md:k-pr-4 k-p-space')]"
+    )
+    if main_container is None:
         return None
 
-    try:
-        # Cari container utama yang berisi semua konten job description
-        main_container = WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located(
-                (
-                    By.XPATH,
-                    "//div[contains(@class, 'md:k-w-full md:k-pr-4 k-p-space')]",
-                )
-            )
+    description_parts = []
+    for section_title in ("Deskripsi Pekerjaan", "Kualifikasi Minimum"):
+        # Ambil div yang mengikuti header section
+        section_content = find_first(
+            main_container,
+            f".//h2[contains(text(), '{section_title}')]/following-sibling::div[1]",
         )
-
-        description_parts = []
-
-        # Ekstrak "Deskripsi Pekerjaan"
-        try:
-            job_desc_header = main_container.find_element(
-                By.XPATH, ".//h2[contains(text(), 'Deskripsi Pekerjaan')]"
-            )
-            # Ambil div yang mengikuti header deskripsi pekerjaan
-            job_desc_content = job_desc_header.find_element(
-                By.XPATH, "./following-sibling::div[1]"
-            )
-            description_parts.append(f"<h2>Deskripsi Pekerjaan</h2>")
-            description_parts.append(job_desc_content.get_attribute("innerHTML"))
-        except Exception:
-            pass
-
-        # Ekstrak "Kualifikasi Minimum"
-        try:
-            qual_header = main_container.find_element(
-                By.XPATH, ".//h2[contains(text(), 'Kualifikasi Minimum')]"
-            )
-            # Ambil div yang mengikuti header kualifikasi minimum
-            qual_content = qual_header.find_element(
-                By.XPATH, "./following-sibling::div[1]"
-            )
-            description_parts.append(f"<h2>Kualifikasi Minimum</h2>")
-            description_parts.append(qual_content.get_attribute("innerHTML"))
-        except Exception:
-            pass
-
-        # Gabungkan semua bagian
-        if description_parts:
-            full_description = "".join(description_parts)
-            return full_description
-        else:
-            return None
-
-    except Exception:
-        return None
+        if section_content is not None:
+            description_parts.append(f"<h2>{section_title}</h2>")
+            description_parts.append(get_inner_html(section_content))
+
+    # Gabungkan semua bagian
+    return "".join(description_parts) if description_parts else None
+
+
+def parse_job_details(page_source: str, job_url: str) -> dict[str, any]:
+    """
+    Ekstrak semua field detail pekerjaan dari HTML halaman dalam satu pass.
+    Field yang tidak ada di halaman langsung bernilai None.
+    """
+    tree = parse_page_source(page_source)
+    employment_details = extract_employment_details(tree)
+
+    return {
+        "job_url": job_url,
+        "image_url": extract_company_logo(tree, job_url),
+        "job_title": extract_job_title(tree),
+        "company_name": extract_company_name(tree),
+        "subdistrict": None,
+        "city": extract_location(tree)["city"],
+        "province": None,
+        "salary": extract_salary(tree),
+        "employment_type": employment_details["employment_type"],
+        "work_setup": employment_details["work_setup"],
+        "minimum_education": extract_education(tree),
+        "minimum_experience": None,
+        "required_skills": None,
+        "job_description": extract_description(tree),
+        "scraped_at": datetime.datetime.now().isoformat(),
+    }
 
 
 def extract_job_details(driver, job_url: str, task_id: str) -> dict[str, any] | None:
-    """Ekstrak semua detail pekerjaan dari URL"""
+    """Buka halaman detail, tunggu sekali, lalu parse page_source"""
     if is_task_cancelled(task_id):
         return None
 
     try:
-        driver.get(job_url)
+        load_page(driver, job_url)
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
         random_sleep(1, 2)
 
         if is_task_cancelled(task_id):
             return None
 
-        img_url = extract_company_logo(driver, task_id)
-
-        if is_task_cancelled(task_id):
-            return None
-
-        title = extract_job_title(driver, task_id)
-
-        if is_task_cancelled(task_id):
-            return None
-
-        company_name = extract_company_name(driver, task_id)
-
-        if is_task_cancelled(task_id):
-            return None
+        if not wait_for_page_ready(driver, KALIBRR_DETAIL_TITLE_XPATH):
+            print(f"[KALIBRR_JOB_DETAIL_WARNING] Page not ready in time: {job_url}")
 
-        location = extract_location(driver, task_id)
+        page_source = driver.page_source
+        if is_recording_corpus():
+            record_page(job_url, page_source)
 
-        if is_task_cancelled(task_id):
-            return None
+        return parse_job_details(page_source, job_url)
+    except Exception as e:
+        print(f"[KALIBRR_JOB_DETAIL_ERROR] Error extracting job details: {str(e)}")
+        return None
 
-        salary = extract_salary(driver, task_id)
 
-        if is_task_cancelled(task_id):
-            return None
+def scrape_kalibrr_jobs_over_http(
+    task_id: str,
+    driver,
+    cookies: list[dict],
+    progress_data: dict,
+    update_state_func=None,
+) -> list[dict[str, any]] | None:
+    """
+    Scraping Kalibrr lewat HTTP dengan cookies dari driver yang sudah login,
+    detail yang gagal diulang dengan Selenium (jika ada driver). None jika
+    listing tidak bisa diambil lewat HTTP.
+    """
+    session = create_http_session(cookies)
 
-        employment_details = extract_employment_details(driver, task_id)
+    try:
+        update_task_progress(
+            task_id, "COLLECT_KALIBRR_JOB_URLS", progress_data, update_state_func
+        )
+        job_urls = collect_job_urls_over_http(session, task_id)
 
         if is_task_cancelled(task_id):
-            return None
-
-        education = extract_education(driver, task_id)
+            return []
 
-        if is_task_cancelled(task_id):
+        if not job_urls:
+            print(
+                "[KALIBRR_HTTP_WARNING] No job URLs over HTTP, falling back to Selenium"
+            )
             return None
 
-        description = extract_description(driver, task_id)
+        update_task_progress(
+            task_id,
+            "SCRAPING_COLLECTED_KALIBRR_JOB_DETAIL",
+            progress_data,
+            update_state_func,
+        )
 
-        if is_task_cancelled(task_id):
-            return {}
-
-        # Gabungkan hasil
-        return {
-            "job_url": job_url,
-            "image_url": img_url,
-            "job_title": title,
-            "company_name": company_name,
-            "subdistrict": None,
-            "city": location["city"],
-            "province": None,
-            "salary": salary,
-            "employment_type": employment_details["employment_type"],
-            "work_setup": employment_details["work_setup"],
-            "minimum_education": education,
-            "minimum_experience": None,
-            "required_skills": None,
-            "job_description": description,
-            "scraped_at": datetime.datetime.now().isoformat(),
-        }
+        return scrape_job_details_http_first(
+            task_id,
+            session,
+            job_urls[:10],
+            parse_job_details,
+            extract_job_details,
+            lambda: driver,
+            cookies,
+            KALIBRR_JOB_BOARD_URL,
+            "SCRAPING_COLLECTED_KALIBRR_JOB_DETAIL",
+            progress_data,
+            update_state_func,
+        )
     except Exception as e:
-        print(f"[KALIBRR_JOB_DETAIL_ERROR] Error extracting job details: {str(e)}")
+        print(f"[KALIBRR_HTTP_ERROR] Fatal error in Kalibrr HTTP scraping: {str(e)}")
         return None
+    finally:
+        session.close()
 
 
 def scrape_kalibrr_jobs(
@@ -527,7 +501,11 @@ def scrape_kalibrr_jobs(
     update_task_progress(
         task_id, "GETTING_KALIBRR_AUTH_DATA", progress_data, update_state_func
     )
-    driver, auth_error = authenticate_to_kalibrr(task_id)
+    if is_replaying_corpus():
+        # Replay corpus: pakai cookies rekaman, tanpa login browser
+        driver, auth_error = None, None
+    else:
+        driver, auth_error = authenticate_to_kalibrr(task_id)
 
     if auth_error:
         return []
@@ -539,6 +517,20 @@ def scrape_kalibrr_jobs(
         if is_task_cancelled(task_id):
             return []
 
+        if driver is None:
+            cookies = load_corpus_cookies("kalibrr")
+        else:
+            cookies = driver.get_cookies()
+            record_cookies("kalibrr", cookies)
+
+        # Mode HTTP: driver yang sudah login hanya dipakai untuk fallback
+        if settings.SCRAPING_BACKEND == "http" or driver is None:
+            job_data = scrape_kalibrr_jobs_over_http(
+                task_id, driver, cookies, progress_data, update_state_func
+            )
+            if job_data is not None or driver is None:
+                return job_data or []
+
         update_task_progress(
             task_id, "GET_KALIBRR_MAX_PAGE", progress_data, update_state_func
         )
@@ -567,35 +559,18 @@ def scrape_kalibrr_jobs(
             update_state_func,
         )
 
-        job_data = []
-        for i, job_url in enumerate(job_urls[:10]):
-            if is_task_cancelled(task_id):
-                break
-
-            try:
-                job_detail = extract_job_details(driver, job_url, task_id)
-
-                if job_detail is None:
-                    print(
-                        f"[KALIBRR_JOB_SKIP] Skipping job {i+1}/{len(job_urls[:10])}: No details extracted"
-                    )
-                    break
-
-                job_data.append(job_detail)
-
-                progress_data["scraped_jobs"] += 1
-                update_task_progress(
-                    task_id,
-                    "SCRAPING_COLLECTED_KALIBRR_JOB_DETAIL",
-                    progress_data,
-                    update_state_func,
-                )
-
-            except Exception as e:
-                print(
-                    f"[KALIBRR_JOB_ERROR] Error processing job {i+1}/{len(job_urls[:10])} ({job_url}): {str(e)}"
-                )
-                continue
+        # Worker lain memakai cookies dari sesi driver yang sudah login
+        job_data = scrape_job_details_in_parallel(
+            task_id,
+            job_urls[:10],
+            extract_job_details,
+            driver,
+            driver.get_cookies(),
+            KALIBRR_JOB_BOARD_URL,
+            "SCRAPING_COLLECTED_KALIBRR_JOB_DETAIL",
+            progress_data,
+            update_state_func,
+        )
 
         if is_task_cancelled(task_id):
             return []
@@ -0,0 +1,188 @@
+import contextlib
+import datetime
+import functools
+import threading
+import time
+import uuid
+
+from django.test.utils import override_settings
+
+from api.services.admin.scrapers import (
+    driver_pool,
+    glints_scraper,
+    http_scraper,
+    kalibrr_scraper,
+    scraper_services,
+)
+from api.services.admin.scrapers.scraper_corpus import (
+    load_corpus_manifest,
+    start_corpus_server,
+)
+
+# Fungsi per website yang diukur durasinya
+SCRAPER_EXTRACTORS = [
+    "extract_company_logo",
+    "extract_job_title",
+    "extract_company_name",
+    "extract_location",
+    "extract_salary",
+    "extract_employment_details",
+    "extract_education",
+    "extract_experience",
+    "extract_skills",
+    "extract_description",
+    "parse_job_details",
+    "collect_job_urls_over_http",
+]
+SCRAPER_MODULES = {"glints": glints_scraper, "kalibrr": kalibrr_scraper}
+SCRAPER_SLEEP_FUNCTIONS = ["random_sleep"]
+SCRAPER_WAIT_FUNCTIONS = ["wait_for_page_ready", "acquire_domain_slot"]
+# Fase NER di scrape_all_websites, dipisah dari waktu scraping
+NER_FUNCTIONS = ["load_ner_model", "process_job_data_with_ner"]
+
+
+def timed_function(func, name, timings, lock):
+    """Bungkus fungsi untuk menjumlahkan jumlah panggilan dan durasinya"""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        started_at = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            seconds = time.perf_counter() - started_at
+            with lock:
+                timing = timings.setdefault(name, {"calls": 0, "seconds": 0.0})
+                timing["calls"] += 1
+                timing["seconds"] += seconds
+
+    return wrapper
+
+
+def get_instrumented_targets() -> list[tuple]:
+    """(module, nama atribut, nama di laporan, kategori) yang diukur"""
+    targets = []
+    for site, module in SCRAPER_MODULES.items():
+        for name in SCRAPER_EXTRACTORS:
+            if hasattr(module, name):
+                targets.append((module, name, f"{site}.{name}", "extractors"))
+        for name in SCRAPER_SLEEP_FUNCTIONS:
+            targets.append((module, name, f"{site}.{name}", "sleeps"))
+        for name in SCRAPER_WAIT_FUNCTIONS:
+            if hasattr(module, name):
+                targets.append((module, name, f"{site}.{name}", "waits"))
+        targets.append(
+            (module, "fetch_page_source", f"{site}.fetch_page_source", "fetch")
+        )
+
+    targets.append(
+        (http_scraper, "fetch_page_source", "http.fetch_page_source", "fetch")
+    )
+    for module, label in ((http_scraper, "http"), (driver_pool, "driver_pool")):
+        targets.append(
+            (module, "acquire_domain_slot", f"{label}.acquire_domain_slot", "waits")
+        )
+    for name in NER_FUNCTIONS:
+        targets.append((scraper_services, name, name, "ner"))
+
+    return targets
+
+
+@contextlib.contextmanager
+def instrument_scrapers():
+    """Ganti sementara fungsi scraper dengan versi yang mencatat durasi"""
+    timings = {"extractors": {}, "sleeps": {}, "waits": {}, "fetch": {}, "ner": {}}
+    lock = threading.Lock()
+    originals = []
+
+    for module, name, label, category in get_instrumented_targets():
+        original = getattr(module, name)
+        originals.append((module, name, original))
+        setattr(module, name, timed_function(original, label, timings[category], lock))
+
+    try:
+        yield timings
+    finally:
+        for module, name, original in reversed(originals):
+            setattr(module, name, original)
+
+
+def summarize_timings(timings) -> dict[str, any]:
+    """Rapikan angka timing dan hitung total per kategori"""
+    summary = {}
+    for category, functions in timings.items():
+        summary[category] = {
+            name: {
+                "calls": timing["calls"],
+                "seconds": round(timing["seconds"], 6),
+                "ms_per_call": round(timing["seconds"] / timing["calls"] * 1000, 3),
+            }
+            for name, timing in sorted(functions.items())
+        }
+        summary[f"{category}_seconds"] = round(
+            sum(timing["seconds"] for timing in functions.values()), 6
+        )
+
+    return summary
+
+
+def run_scraping_benchmark(
+    corpus_dir: str, min_interval: float = 0.0, http_workers: int = 4
+) -> dict[str, any]:
+    """
+    Jalankan scrape_all_websites end-to-end terhadap corpus rekaman (replay lewat
+    server lokal dan backend HTTP), tanpa login dan tanpa website asli.
+    Throughput dihitung dari fase scraping saja, tanpa load model dan proses NER.
+    """
+    manifest = load_corpus_manifest(corpus_dir)
+    server, base_url = start_corpus_server(corpus_dir)
+    task_id = f"benchmark-{uuid.uuid4().hex[:8]}"
+
+    try:
+        with override_settings(
+            SCRAPING_BACKEND="http",
+            SCRAPING_CORPUS_MODE="replay",
+            SCRAPING_CORPUS_DIR=corpus_dir,
+            SCRAPING_HTTP_BASE_URL=base_url,
+            SCRAPING_HTTP_WORKERS=http_workers,
+            SCRAPING_DOMAIN_MIN_INTERVAL=min_interval,
+            # Cache lokal agar is_task_cancelled/progress tidak butuh Redis
+            CACHES={
+                "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+            },
+        ), instrument_scrapers() as timings:
+            started_at = time.perf_counter()
+            job_data = scraper_services.scrape_all_websites(task_id)
+            seconds = time.perf_counter() - started_at
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    summary = summarize_timings(timings)
+    pages_fetched = sum(timing["calls"] for timing in summary["fetch"].values())
+    scrape_seconds = max(0.0, seconds - summary["ner_seconds"])
+    jobs = len(job_data or [])
+
+    return {
+        "created_at": datetime.datetime.now().isoformat(),
+        "corpus": {
+            "dir": corpus_dir,
+            "pages": len(manifest["pages"]),
+            "cookies": sorted(manifest["cookies"]),
+        },
+        "config": {
+            "http_workers": http_workers,
+            "domain_min_interval": min_interval,
+        },
+        "total_seconds": round(seconds, 6),
+        "scrape_seconds": round(scrape_seconds, 6),
+        "jobs": jobs,
+        "pages_fetched": pages_fetched,
+        "pages_per_second": (
+            round(pages_fetched / scrape_seconds, 2) if scrape_seconds > 0 else None
+        ),
+        "jobs_per_second": (
+            round(jobs / scrape_seconds, 2) if scrape_seconds > 0 else None
+        ),
+        **summary,
+    }
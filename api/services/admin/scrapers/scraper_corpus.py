@@ -0,0 +1,182 @@
+import datetime
+import gzip
+import hashlib
+import json
+import os
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from django.conf import settings
+
+CORPUS_FORMAT_VERSION = 1
+CORPUS_MANIFEST_NAME = "manifest.json"
+
+_corpus_lock = threading.Lock()
+# Server corpus lokal per corpus_dir untuk replay tanpa SCRAPING_HTTP_BASE_URL
+_replay_servers = {}
+
+
+def is_recording_corpus() -> bool:
+    return settings.SCRAPING_CORPUS_MODE == "record"
+
+
+def is_replaying_corpus() -> bool:
+    return settings.SCRAPING_CORPUS_MODE == "replay"
+
+
+def get_corpus_dir(corpus_dir: str | None = None) -> str:
+    return corpus_dir or settings.SCRAPING_CORPUS_DIR
+
+
+def get_page_file_name(url: str) -> str:
+    """Nama file halaman dari hash URL yang diminta"""
+    return f"pages/{hashlib.sha256(url.encode('utf-8')).hexdigest()[:32]}.html.gz"
+
+
+def load_corpus_manifest(corpus_dir: str | None = None) -> dict[str, any]:
+    """Load manifest corpus, manifest kosong jika belum ada"""
+    manifest_path = os.path.join(get_corpus_dir(corpus_dir), CORPUS_MANIFEST_NAME)
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as manifest_file:
+            return json.load(manifest_file)
+    except (OSError, ValueError):
+        return {"version": CORPUS_FORMAT_VERSION, "pages": {}, "cookies": {}}
+
+
+def write_corpus_manifest(corpus_dir: str, manifest: dict[str, any]) -> None:
+    """Tulis manifest secara atomic (file sementara lalu rename)"""
+    manifest_path = os.path.join(corpus_dir, CORPUS_MANIFEST_NAME)
+    temp_path = f"{manifest_path}.{uuid.uuid4().hex}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as manifest_file:
+        json.dump(manifest, manifest_file, indent=2)
+    os.replace(temp_path, manifest_path)
+
+
+def write_corpus_file(corpus_dir: str, file_name: str, content: str) -> None:
+    file_path = os.path.join(corpus_dir, file_name)
+    os.makedirs(os.path.dirname(file_path), mode=0o700, exist_ok=True)
+    with gzip.open(file_path, "wt", encoding="utf-8") as corpus_file:
+        corpus_file.write(content)
+    os.chmod(file_path, 0o600)
+
+
+def read_corpus_file(corpus_dir: str, file_name: str) -> str | None:
+    try:
+        with gzip.open(
+            os.path.join(corpus_dir, file_name), "rt", encoding="utf-8"
+        ) as corpus_file:
+            return corpus_file.read()
+    except OSError:
+        return None
+
+
+def record_page(url: str, page_source: str, corpus_dir: str | None = None) -> None:
+    """Simpan HTML halaman ke corpus dengan key URL yang diminta"""
+    corpus_dir = get_corpus_dir(corpus_dir)
+    file_name = get_page_file_name(url)
+
+    with _corpus_lock:
+        write_corpus_file(corpus_dir, file_name, page_source or "")
+        manifest = load_corpus_manifest(corpus_dir)
+        manifest["pages"][url] = {
+            "file": file_name,
+            "bytes": len((page_source or "").encode("utf-8")),
+            "recorded_at": datetime.datetime.now().isoformat(),
+        }
+        write_corpus_manifest(corpus_dir, manifest)
+
+
+def record_driver_page(driver, url: str) -> None:
+    """Simpan driver.page_source jika mode record aktif"""
+    if not is_recording_corpus():
+        return
+
+    try:
+        record_page(url, driver.page_source)
+    except Exception as e:
+        print(f"[SCRAPER_CORPUS_ERROR] Failed to record {url}: {str(e)}")
+
+
+def record_cookies(site: str, cookies: list[dict] | None) -> None:
+    """Simpan cookies login per website jika mode record aktif"""
+    if not is_recording_corpus() or not cookies:
+        return
+
+    corpus_dir = get_corpus_dir()
+    file_name = f"cookies/{site}.json.gz"
+
+    with _corpus_lock:
+        write_corpus_file(corpus_dir, file_name, json.dumps(cookies))
+        manifest = load_corpus_manifest(corpus_dir)
+        manifest["cookies"][site] = file_name
+        write_corpus_manifest(corpus_dir, manifest)
+
+
+def load_corpus_page(url: str, corpus_dir: str | None = None) -> str | None:
+    return read_corpus_file(get_corpus_dir(corpus_dir), get_page_file_name(url))
+
+
+def load_corpus_cookies(site: str, corpus_dir: str | None = None) -> list[dict]:
+    """Cookies login hasil rekaman, pengganti login browser saat replay"""
+    cookies = read_corpus_file(get_corpus_dir(corpus_dir), f"cookies/{site}.json.gz")
+    return json.loads(cookies) if cookies else []
+
+
+def start_corpus_server(
+    corpus_dir: str | None = None, host: str = "127.0.0.1", port: int = 0
+) -> tuple[ThreadingHTTPServer, str]:
+    """
+    Sajikan corpus lewat HTTP di thread terpisah. Path /glints.com/id/x?page=2
+    menjadi halaman rekaman https://glints.com/id/x?page=2, cocok dengan
+    SCRAPING_HTTP_BASE_URL. Return (server, base_url).
+    """
+    corpus_dir = get_corpus_dir(corpus_dir)
+
+    class CorpusRequestHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            request_url = urlsplit(self.path)
+            host, _, path = request_url.path.lstrip("/").partition("/")
+            query = f"?{request_url.query}" if request_url.query else ""
+            page_source = load_corpus_page(f"https://{host}/{path}{query}", corpus_dir)
+
+            if page_source is None:
+                self.send_error(404)
+                return
+
+            body = page_source.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), CorpusRequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def get_replay_base_url(corpus_dir: str | None = None) -> str:
+    """
+    Base URL server corpus lokal untuk replay. Jika SCRAPING_HTTP_BASE_URL
+    kosong, server dijalankan sekali per proses agar replay tidak pernah
+    mengakses website asli.
+    """
+    if settings.SCRAPING_HTTP_BASE_URL:
+        return settings.SCRAPING_HTTP_BASE_URL
+
+    corpus_dir = get_corpus_dir(corpus_dir)
+    with _corpus_lock:
+        if corpus_dir not in _replay_servers:
+            _replay_servers[corpus_dir] = start_corpus_server(corpus_dir)
+            print(
+                f"[SCRAPER_CORPUS_INFO] Serving {corpus_dir} for replay at "
+                f"{_replay_servers[corpus_dir][1]}"
+            )
+
+    return _replay_servers[corpus_dir][1]
@@ -1,5 +1,9 @@
 from api.services.admin.scrapers.glints_scraper import scrape_glints_jobs
-from api.services.admin.scrapers.helper import is_task_cancelled
+from api.services.admin.scrapers.helper import (
+    is_task_cancelled,
+    log_page_load_timings,
+    reset_page_load_timings,
+)
 from api.services.admin.scrapers.kalibrr_scraper import scrape_kalibrr_jobs
 from api.services.admin.scrapers.ner_services import (
     load_ner_model,
@@ -19,6 +23,7 @@ def scrape_all_websites(task_id: str, update_state_func=None):
             update_state_func(task_id, "LOADING_NER_MODEL", {})
 
         ner_model = load_ner_model()
+        reset_page_load_timings()
 
         # Initialize job data list
         all_job_data = {
@@ -62,6 +67,7 @@ def scrape_all_websites(task_id: str, update_state_func=None):
             return []
 
         scraped_jobs += len(kalibrr_job_data)
+        log_page_load_timings()
 
         all_job_data["kalibrr"] = kalibrr_job_data
 
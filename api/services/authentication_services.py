@@ -18,12 +18,7 @@ from api.services.matchers.matchers_neo4j_services import (
     get_jobs_from_neo4j,
 )
 from api.services.matchers.matchers_ontology_services import (
-    add_user_job_matches_to_ontology,
-    apply_dynamic_categorization_pipeline,
-    build_temp_graph_for_user,
-    calculate_user_job_similarity_for_specific_user,
-    extract_categorized_matches_for_user,
-    load_base_ontology,
+    calculate_categorized_matches_for_user_skills,
 )
 
 
@@ -95,22 +90,12 @@ def register_user_and_match(request_data: dict[str, any]) -> dict[str, str] | No
     user_email = attrs["email"]
     user_skills = attrs["skills"]
 
-    base_graph = load_base_ontology()
-
     jobs_data = get_jobs_from_neo4j()
 
-    temp_graph, user_uri = build_temp_graph_for_user(
-        base_graph, jobs_data, user_email, user_skills
+    categorized_matches = calculate_categorized_matches_for_user_skills(
+        user_skills, jobs_data
     )
 
-    new_matches = calculate_user_job_similarity_for_specific_user(temp_graph, user_uri)
-
-    temp_graph = add_user_job_matches_to_ontology(temp_graph, new_matches)
-
-    temp_graph = apply_dynamic_categorization_pipeline(temp_graph)
-
-    categorized_matches = extract_categorized_matches_for_user(temp_graph, user_uri)
-
     filepath = None
     profile_picture = attrs.get("profile_picture", None)
     if profile_picture:
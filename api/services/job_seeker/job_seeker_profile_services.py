@@ -17,12 +17,7 @@ from api.services.matchers.matchers_neo4j_services import (
     update_neo4j_for_specific_user,
 )
 from api.services.matchers.matchers_ontology_services import (
-    add_user_job_matches_to_ontology,
-    apply_dynamic_categorization_pipeline,
-    build_temp_graph_for_user,
-    calculate_user_job_similarity_for_specific_user,
-    extract_categorized_matches_for_user,
-    load_base_ontology,
+    calculate_categorized_matches_for_user_skills,
 )
 
 
@@ -109,22 +104,12 @@ def change_profile_and_match(pk, request_data: dict[str, any]) -> dict[str, str]
             "skills": new_skills,
         }
 
-    base_graph = load_base_ontology()
-
     jobs_data = get_jobs_from_neo4j()
 
-    temp_graph, user_uri = build_temp_graph_for_user(
-        base_graph, jobs_data, user_email, new_skills
+    categorized_matches = calculate_categorized_matches_for_user_skills(
+        new_skills, jobs_data
     )
 
-    new_matches = calculate_user_job_similarity_for_specific_user(temp_graph, user_uri)
-
-    temp_graph = add_user_job_matches_to_ontology(temp_graph, new_matches)
-
-    temp_graph = apply_dynamic_categorization_pipeline(temp_graph)
-
-    categorized_matches = extract_categorized_matches_for_user(temp_graph, user_uri)
-
     update_neo4j_for_specific_user(user_email, new_skills, categorized_matches)
 
     return {
@@ -1,3 +1,5 @@
+import hashlib
+
 from django.core.cache import cache
 
 
@@ -15,3 +17,11 @@ def update_task_progress(
     cache.set(f"matching_progress_{task_id}", progress_data, timeout=None)
     if update_state_func:
         update_state_func(state=state, meta=progress_data)
+
+
+def build_job_key(job_url: str) -> str:
+    """
+    Identitas Job yang stabil: hash dari job_url persis seperti disimpan di
+    Job.jobUrl (unique), sehingga dua jobUrl berbeda tidak pernah berbagi jobKey
+    """
+    return hashlib.sha256(str(job_url).encode("utf-8")).hexdigest()[:32]
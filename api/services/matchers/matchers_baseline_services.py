@@ -0,0 +1,323 @@
+"""
+Jalur matching asli (sebelum taxonomy index, similarity matrix dan lexicon):
+lookup skill lewat SPARQL, ancestor lewat get_limited_ancestors dan Sánchez per
+pair skill. Hanya dipakai sebagai referensi parity dan benchmark.
+"""
+
+import uuid
+
+from rdflib import RDF, Graph, Literal
+from rdflib.namespace import XSD
+
+from api.constants import TALENT_NAMESPACE
+from api.services.matchers.matchers_ontology_services import (
+    add_job_individual,
+    build_job_uri,
+    categorize_similarity_score,
+    extract_equivalent_class_rules_from_ontology,
+    load_base_ontology,
+    pop_top_k_matches,
+    push_top_k_match,
+    sanchez_similarity,
+)
+
+BASELINE_SKILL_SPECIAL_CASES = {
+    "c#": "cs",
+    "ci/cd": "ci_cd",
+    "pl/sql": "pl_sql",
+}
+
+
+def get_baseline_ontology_skills(graph) -> dict[str, tuple]:
+    """{nama skill lowercase: (nama skill, URI skill)} lewat SPARQL subClassOf+"""
+    all_skills_query = """
+    SELECT ?skill
+    WHERE {
+        ?skill rdfs:subClassOf+ <http://www.semanticweb.org/kota203/ontologies/2025/3/talent-matching-ontology/Skills> .
+    }
+    """
+
+    ontology_skills = {}
+    for row in graph.query(all_skills_query):
+        skill_uri = row[0]
+        skill_name = str(skill_uri).split("/")[-1].replace("_", " ")
+        ontology_skills[skill_name.lower()] = (skill_name, skill_uri)
+
+    return ontology_skills
+
+
+def resolve_baseline_skill_uris(ontology_skills, skill_names) -> list:
+    """Lookup nama skill seperti importer asli: lowercase lalu special cases"""
+    skill_uris = []
+    for skill in skill_names or []:
+        skill_lower = skill.lower()
+
+        if skill_lower in BASELINE_SKILL_SPECIAL_CASES:
+            mapped_skill = BASELINE_SKILL_SPECIAL_CASES[skill_lower]
+            if mapped_skill in ontology_skills:
+                skill_uris.append(ontology_skills[mapped_skill][1])
+                continue
+
+        if skill_lower in ontology_skills:
+            skill_uris.append(ontology_skills[skill_lower][1])
+
+    return skill_uris
+
+
+def import_jobs_to_baseline_graph(graph, jobs_data):
+    """Import job dengan lookup skill asli (URI job sama dengan importer sekarang)"""
+    ontology_skills = get_baseline_ontology_skills(graph)
+
+    for job in jobs_data:
+        if "job_url" not in job:
+            continue
+
+        job_uri = add_job_individual(graph, job["job_url"])
+        for skill_uri in resolve_baseline_skill_uris(
+            ontology_skills, job.get("required_skills")
+        ):
+            graph.add((job_uri, TALENT_NAMESPACE["REQUIRED_SKILL"], skill_uri))
+
+    return graph
+
+
+def import_users_to_baseline_graph(graph, users_data):
+    """Import user dengan lookup skill asli, return (graph, {email: URI user})"""
+    ontology_skills = get_baseline_ontology_skills(graph)
+    user_uris = {}
+
+    for user in users_data or []:
+        user_uuid = user.get("uuid") or str(uuid.uuid4())
+        user_uri = TALENT_NAMESPACE[f"User_{user_uuid}"]
+        graph.add((user_uri, RDF.type, TALENT_NAMESPACE["User"]))
+        graph.add(
+            (
+                user_uri,
+                TALENT_NAMESPACE["email"],
+                Literal(user["email"], datatype=XSD.string),
+            )
+        )
+        for skill_uri in resolve_baseline_skill_uris(
+            ontology_skills, user.get("skills")
+        ):
+            graph.add((user_uri, TALENT_NAMESPACE["HAS_SKILL"], skill_uri))
+
+        user_uris[user["email"]] = user_uri
+
+    return graph, user_uris
+
+
+def build_baseline_graph(jobs_data, users_data):
+    """Salinan base ontology berisi job dan user hasil importer asli"""
+    graph = Graph()
+    for triple in load_base_ontology():
+        graph.add(triple)
+    graph.bind("talent", TALENT_NAMESPACE)
+
+    graph = import_jobs_to_baseline_graph(graph, jobs_data)
+    return import_users_to_baseline_graph(graph, users_data)
+
+
+def get_limited_ancestors(graph, skill_uri, max_levels=5):
+    """Get skill and its ancestors (up to 3 levels), stopping at Skills node"""
+    ancestors = set()
+    ancestors.add(str(skill_uri))
+
+    # Define Skills top-level node
+    SKILLS_NODE = "http://www.semanticweb.org/kota203/ontologies/2025/3/talent-matching-ontology/Skills"
+
+    current_level = [skill_uri]
+    level = 0
+
+    while current_level and level < max_levels:
+        next_level = []
+        for node in current_level:
+            query = f"""
+            SELECT ?parent
+            WHERE {{
+                <{node}> rdfs:subClassOf ?parent .
+                FILTER(?parent != <{node}>)
+            }}
+            """
+
+            for row in graph.query(query):
+                parent = row[0]
+                parent_str = str(parent)
+
+                if parent_str == SKILLS_NODE:
+                    current_level = max_levels
+                    level = max_levels
+                    continue
+
+                if parent_str not in ancestors:
+                    ancestors.add(parent_str)
+                    next_level.append(parent)
+
+        current_level = next_level
+        level += 1
+
+    return ancestors
+
+
+def get_baseline_skill_uris(graph, subject_uri, predicate) -> list:
+    skills_query = f"""
+    SELECT ?skill
+    WHERE {{
+        <{subject_uri}> <{TALENT_NAMESPACE[predicate]}> ?skill .
+    }}
+    """
+    return [row[0] for row in graph.query(skills_query)]
+
+
+def get_baseline_jobs(graph) -> list:
+    jobs_query = """
+    SELECT ?job
+    WHERE {
+        ?job rdf:type <http://www.semanticweb.org/kota203/ontologies/2025/3/talent-matching-ontology/Job> .
+    }
+    """
+    return [row[0] for row in graph.query(jobs_query)]
+
+
+def calculate_baseline_skill_similarities(graph, user_skills, job_skills, ancestors):
+    """Best Sánchez similarity per skill user terhadap semua skill job"""
+    skill_similarities = []
+    for user_skill in user_skills:
+        if user_skill not in ancestors:
+            ancestors[user_skill] = get_limited_ancestors(graph, user_skill)
+        max_skill_similarity = 0
+
+        for job_skill in job_skills:
+            if job_skill not in ancestors:
+                ancestors[job_skill] = get_limited_ancestors(graph, job_skill)
+            skill_similarity = sanchez_similarity(
+                ancestors[user_skill], ancestors[job_skill]
+            )
+            if skill_similarity > max_skill_similarity:
+                max_skill_similarity = skill_similarity
+
+        skill_similarities.append(max_skill_similarity)
+
+    return skill_similarities
+
+
+def calculate_baseline_user_similarities(
+    graph, user_email, user_uri, single_user=False
+) -> list[dict]:
+    """
+    Score satu user terhadap semua job dengan rumus asli: all-users memakai
+    rata-rata per skill user, single-user memakai top len(job skills).
+    """
+    user_skills = get_baseline_skill_uris(graph, user_uri, "HAS_SKILL")
+    if not user_skills:
+        return []
+
+    # Ancestor tetap dihitung lewat SPARQL, hanya tidak diulang per pair
+    ancestors = {}
+    match_results = []
+    for job_uri in get_baseline_jobs(graph):
+        job_skills = get_baseline_skill_uris(graph, job_uri, "REQUIRED_SKILL")
+        if not job_skills:
+            continue
+
+        skill_similarities = calculate_baseline_skill_similarities(
+            graph, user_skills, job_skills, ancestors
+        )
+        if single_user:
+            skill_similarities = sorted(skill_similarities, reverse=True)
+            overall_similarity = sum(skill_similarities[0 : len(job_skills)]) / len(
+                job_skills
+            )
+        else:
+            overall_similarity = sum(skill_similarities) / len(skill_similarities)
+
+        if overall_similarity > 0:
+            match_results.append(
+                {
+                    "user": str(user_uri),
+                    "user_email": user_email,
+                    "job": str(job_uri),
+                    "similarity": overall_similarity,
+                }
+            )
+
+    return match_results
+
+
+def categorize_baseline_matches(graph, match_results) -> list[dict]:
+    """Kategori per score dengan rule ontology yang dievaluasi satu per satu"""
+    rules = extract_equivalent_class_rules_from_ontology(graph)
+    for match in match_results:
+        match["category"] = categorize_similarity_score(match["similarity"], rules)
+
+    return match_results
+
+
+def prune_baseline_matches(match_results, jobs_data, top_k=0, min_score=0.0):
+    """
+    Terapkan MATCHING_MIN_SCORE dan top-K per user setelah scoring (jalur asli
+    menyimpan semua pair). Tie-break sesuai urutan jobs_data.
+    """
+    job_positions = {}
+    for job in jobs_data:
+        if "job_url" in job:
+            job_positions.setdefault(
+                str(build_job_uri(job["job_url"])), len(job_positions)
+            )
+
+    top_matches_by_user = {}
+    for match in match_results:
+        if match["similarity"] < min_score:
+            continue
+        push_top_k_match(
+            top_matches_by_user.setdefault(match["user"], []),
+            top_k,
+            match["similarity"],
+            job_positions[match["job"]],
+            match,
+        )
+
+    return [
+        match
+        for top_matches in top_matches_by_user.values()
+        for match in pop_top_k_matches(top_matches)
+    ]
+
+
+def calculate_baseline_all_user_job_similarities(
+    jobs_data, users_data, top_k=0, min_score=0.0
+) -> list[dict]:
+    """Semua user x semua job dengan jalur asli, hasil sudah berkategori"""
+    graph, user_uris = build_baseline_graph(jobs_data, users_data)
+
+    match_results = []
+    for user_email, user_uri in user_uris.items():
+        match_results.extend(
+            calculate_baseline_user_similarities(graph, user_email, user_uri)
+        )
+
+    return categorize_baseline_matches(
+        graph, prune_baseline_matches(match_results, jobs_data, top_k, min_score)
+    )
+
+
+def calculate_baseline_matches_for_user(
+    jobs_data, user, top_k=0, min_score=0.0
+) -> list[dict]:
+    """
+    Jalur single-user asli: temp graph (base ontology + semua job + user ini),
+    score, kategorisasi, lalu hanya match yang berkategori.
+    """
+    graph, user_uris = build_baseline_graph(jobs_data, [user])
+    match_results = categorize_baseline_matches(
+        graph,
+        calculate_baseline_user_similarities(
+            graph, user["email"], user_uris[user["email"]], single_user=True
+        ),
+    )
+    return prune_baseline_matches(
+        [match for match in match_results if match["category"] is not None],
+        jobs_data,
+        top_k,
+        min_score,
+    )
@@ -0,0 +1,413 @@
+import datetime
+import math
+import os
+import platform
+import random
+import resource
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+from django.conf import settings
+from django.test.utils import override_settings
+
+from api.services.matchers.matchers_baseline_services import (
+    calculate_baseline_matches_for_user,
+)
+from api.services.matchers.matchers_ontology_services import (
+    calculate_all_user_job_similarities,
+    calculate_categorized_matches_for_user_skills,
+    categorize_match_results,
+    get_match_category_bins,
+    import_all_jobs_to_ontology,
+    import_all_users_to_ontology,
+    load_base_ontology,
+)
+from api.services.matchers.matchers_parallel_services import (
+    calculate_all_user_job_similarities_parallel,
+)
+from api.services.matchers.matchers_skill_lexicon_services import get_skill_lexicon
+from api.services.matchers.matchers_skill_similarity_services import (
+    get_skill_similarity_matrix,
+)
+from api.services.matchers.matchers_skill_taxonomy_services import get_skill_name
+from api.services.matchers.matchers_vectorized_services import (
+    score_users_against_jobs,
+)
+
+BENCHMARK_SCALES = [100, 1000, 10000]
+
+# Distribusi jumlah skill (lognormal, dibatasi min/max) untuk user dan job
+USER_SKILL_COUNT = {"median": 6, "sigma": 0.5, "min": 1, "max": 20}
+JOB_SKILL_COUNT = {"median": 5, "sigma": 0.45, "min": 1, "max": 15}
+# Proporsi skill job yang tidak ada di ontology (menjadi AdditionalSkill)
+JOB_UNKNOWN_SKILL_RATE = 0.1
+# Kemiringan distribusi Zipf popularitas skill
+SKILL_POPULARITY_EXPONENT = 1.1
+
+
+def get_ontology_skill_names() -> list[str]:
+    """Nama semua skill di ontology.ttl, urut seperti skill id taxonomy"""
+    return [
+        get_skill_name(skill_uri) for skill_uri in get_skill_lexicon()["skill_uris"]
+    ]
+
+
+def sample_skill_count(rng, distribution) -> int:
+    """Jumlah skill acak dari distribusi lognormal yang dibatasi"""
+    count = round(
+        rng.lognormvariate(math.log(distribution["median"]), distribution["sigma"])
+    )
+    return min(max(count, distribution["min"]), distribution["max"])
+
+
+def sample_skills(rng, skill_names, weights, count) -> list[str]:
+    """Ambil count skill unik, skill populer lebih sering terpilih"""
+    count = min(count, len(skill_names))
+    skills = []
+    while len(skills) < count:
+        for skill_name in rng.choices(skill_names, weights, k=count - len(skills)):
+            if skill_name not in skills:
+                skills.append(skill_name)
+
+    return skills
+
+
+def vary_skill_name(rng, skill_name) -> str:
+    """Variasi penulisan seperti input user (kapitalisasi, spasi)"""
+    variant = rng.random()
+    if variant < 0.2:
+        return skill_name.title()
+    if variant < 0.3:
+        return f" {skill_name.upper()} "
+    return skill_name
+
+
+def generate_benchmark_dataset(user_count, job_count, seed=0) -> dict[str, list]:
+    """
+    Generate users_data dan jobs_data sintetis dengan bentuk yang sama seperti
+    get_users_from_neo4j / get_jobs_from_neo4j. Skill diambil dari ontology.ttl
+    dengan popularitas Zipf; hasil selalu sama untuk seed yang sama.
+    """
+    rng = random.Random(seed)
+    skill_names = get_ontology_skill_names()
+
+    popularity_order = list(range(len(skill_names)))
+    rng.shuffle(popularity_order)
+    weights = [0.0] * len(skill_names)
+    for rank, skill_position in enumerate(popularity_order):
+        weights[skill_position] = 1 / (rank + 1) ** SKILL_POPULARITY_EXPONENT
+
+    users_data = []
+    for i in range(user_count):
+        skills = sample_skills(
+            rng, skill_names, weights, sample_skill_count(rng, USER_SKILL_COUNT)
+        )
+        users_data.append(
+            {
+                "uid": f"benchmark-user-{seed}-{i}",
+                "name": f"Benchmark User {i}",
+                "email": f"user{i}.{seed}@benchmark.local",
+                "role": "user",
+                "skills": [vary_skill_name(rng, skill) for skill in skills],
+            }
+        )
+
+    jobs_data = []
+    for i in range(job_count):
+        skills = sample_skills(
+            rng, skill_names, weights, sample_skill_count(rng, JOB_SKILL_COUNT)
+        )
+        required_skills = [
+            (
+                f"benchmark unknown skill {rng.randrange(job_count)}"
+                if rng.random() < JOB_UNKNOWN_SKILL_RATE
+                else vary_skill_name(rng, skill)
+            )
+            for skill in skills
+        ]
+        jobs_data.append(
+            {
+                "job_url": f"https://benchmark.local/jobs/{seed}/{i}",
+                "job_title": f"Benchmark Job {i}",
+                "company_name": f"Company {i % 97}",
+                "city": "Jakarta",
+                "province": "DKI Jakarta",
+                "required_skills": required_skills,
+            }
+        )
+
+    return {"users_data": users_data, "jobs_data": jobs_data}
+
+
+def get_peak_rss_mb() -> float:
+    """Peak resident memory process (high-water mark) dalam MB"""
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss dalam byte di macOS, dalam KiB di Linux
+    if sys.platform == "darwin":
+        return peak_rss / 2**20
+    return peak_rss / 1024
+
+
+def time_stage(stage, func, items=None, trace_memory=False) -> tuple[any, dict]:
+    """
+    Jalankan satu stage dan ukur durasi, throughput (items per detik) dan memory.
+    traced_peak_mb (tracemalloc) hanya diisi jika trace_memory aktif karena
+    tracemalloc memperlambat kode Python.
+    """
+    if trace_memory:
+        tracemalloc.start()
+
+    started_at = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - started_at
+
+    stats = {
+        "stage": stage,
+        "seconds": round(seconds, 6),
+        "items": items,
+        "items_per_second": (
+            round(items / seconds, 2) if items is not None and seconds > 0 else None
+        ),
+        "peak_rss_mb": round(get_peak_rss_mb(), 2),
+        "traced_peak_mb": None,
+    }
+    if trace_memory:
+        stats["traced_peak_mb"] = round(tracemalloc.get_traced_memory()[1] / 2**20, 2)
+        tracemalloc.stop()
+
+    return result, stats
+
+
+def warm_up_matching_caches() -> None:
+    """Bangun cache ontology, taxonomy, lexicon, similarity matrix dan rule kategori"""
+    load_base_ontology()
+    get_skill_lexicon()
+    get_skill_similarity_matrix()
+    get_match_category_bins()
+
+
+def benchmark_scale(
+    scale,
+    seed=0,
+    jobs_per_user=1.0,
+    engines=("python", "numpy"),
+    workers=1,
+    single_user_samples=3,
+    reference_pair_budget=1_000_000,
+    trace_memory=False,
+) -> dict[str, any]:
+    """Benchmark semua stage matching untuk satu skala jumlah user"""
+    user_count = scale
+    job_count = max(1, round(scale * jobs_per_user))
+    pair_count = user_count * job_count
+    stages = []
+
+    dataset, stats = time_stage(
+        "generate_dataset",
+        lambda: generate_benchmark_dataset(user_count, job_count, seed),
+        user_count + job_count,
+        trace_memory,
+    )
+    stages.append(stats)
+    users_data = dataset["users_data"]
+    jobs_data = dataset["jobs_data"]
+
+    graph, stats = time_stage(
+        "import_jobs_to_ontology",
+        lambda: import_all_jobs_to_ontology(load_base_ontology(), jobs_data)[0],
+        job_count,
+        trace_memory,
+    )
+    stages.append(stats)
+
+    graph, stats = time_stage(
+        "import_users_to_ontology",
+        lambda: import_all_users_to_ontology(graph, users_data),
+        user_count,
+        trace_memory,
+    )
+    stages.append(stats)
+
+    match_results = None
+    skipped = []
+    for engine in engines:
+        stage = f"match_all_{engine}"
+        if engine == "python" and pair_count > reference_pair_budget:
+            skipped.append(stage)
+            continue
+
+        if engine == "parallel":
+            run_engine = lambda: calculate_all_user_job_similarities_parallel(
+                graph,
+                workers,
+                block_size=settings.MATCHING_USER_BLOCK_SIZE,
+                top_k=settings.MATCHING_TOP_K,
+                min_score=settings.MATCHING_MIN_SCORE,
+            )
+        else:
+            run_engine = lambda: calculate_all_user_job_similarities(graph)
+
+        with override_settings(MATCHING_ENGINE=engine):
+            engine_results, stats = time_stage(
+                stage, run_engine, pair_count, trace_memory
+            )
+        stats["matches"] = len(engine_results)
+        stages.append(stats)
+        match_results = engine_results
+
+    if match_results is not None:
+        _, stats = time_stage(
+            "categorize_matches",
+            lambda: categorize_match_results(match_results),
+            len(match_results),
+            trace_memory,
+        )
+        stages.append(stats)
+
+    direct_results, stats = time_stage(
+        "score_users_against_jobs",
+        lambda: score_users_against_jobs(
+            users_data,
+            jobs_data,
+            block_size=settings.MATCHING_USER_BLOCK_SIZE,
+            top_k=settings.MATCHING_TOP_K,
+            min_score=settings.MATCHING_MIN_SCORE,
+        ),
+        pair_count,
+        trace_memory,
+    )
+    stats["matches"] = len(direct_results)
+    stages.append(stats)
+
+    sample_users = users_data[:single_user_samples]
+    _, stats = time_stage(
+        "match_single_user_direct",
+        lambda: [
+            calculate_categorized_matches_for_user_skills(user["skills"], jobs_data)
+            for user in sample_users
+        ],
+        len(sample_users) * job_count,
+        trace_memory,
+    )
+    stages.append(stats)
+
+    # Jalur asli menjalankan SPARQL per job dan Sánchez per pair skill
+    if len(sample_users) * job_count * 100 <= reference_pair_budget:
+        _, stats = time_stage(
+            "match_single_user_baseline",
+            lambda: [
+                calculate_baseline_matches_for_user(
+                    jobs_data,
+                    user,
+                    top_k=settings.MATCHING_TOP_K,
+                    min_score=settings.MATCHING_MIN_SCORE,
+                )
+                for user in sample_users
+            ],
+            len(sample_users) * job_count,
+            trace_memory,
+        )
+        stages.append(stats)
+    else:
+        skipped.append("match_single_user_baseline")
+
+    return {
+        "scale": scale,
+        "users": user_count,
+        "jobs": job_count,
+        "pairs": pair_count,
+        "stages": stages,
+        "skipped_stages": skipped,
+    }
+
+
+def fit_scaling_curves(scale_reports) -> dict[str, dict]:
+    """
+    Kurva waktu per stage terhadap skala, beserta eksponen log-log antar skala
+    berurutan (1 = linear, 2 = kuadratik).
+    """
+    curves = {}
+    for scale_report in scale_reports:
+        for stats in scale_report["stages"]:
+            curve = curves.setdefault(stats["stage"], {"scales": [], "seconds": []})
+            curve["scales"].append(scale_report["scale"])
+            curve["seconds"].append(stats["seconds"])
+
+    for curve in curves.values():
+        curve["exponents"] = [
+            (
+                round(
+                    math.log(curve["seconds"][i + 1] / curve["seconds"][i])
+                    / math.log(curve["scales"][i + 1] / curve["scales"][i]),
+                    3,
+                )
+                if curve["seconds"][i] > 0 and curve["seconds"][i + 1] > 0
+                else None
+            )
+            for i in range(len(curve["scales"]) - 1)
+        ]
+
+    return curves
+
+
+def run_matching_benchmark(
+    scales=None,
+    seed=0,
+    jobs_per_user=1.0,
+    engines=("python", "numpy"),
+    workers=1,
+    single_user_samples=3,
+    reference_pair_budget=1_000_000,
+    trace_memory=False,
+) -> dict[str, any]:
+    """
+    Benchmark pipeline matching secara offline (tanpa Neo4j/Redis) pada beberapa
+    skala dan return report yang bisa langsung di-dump sebagai JSON.
+    """
+    scales = scales or BENCHMARK_SCALES
+
+    _, warm_up_stats = time_stage("warm_up_caches", warm_up_matching_caches)
+
+    scale_reports = []
+    for scale in scales:
+        print(f"[BENCHMARK_INFO] Running scale {scale}")
+        scale_reports.append(
+            benchmark_scale(
+                scale,
+                seed=seed,
+                jobs_per_user=jobs_per_user,
+                engines=engines,
+                workers=workers,
+                single_user_samples=single_user_samples,
+                reference_pair_budget=reference_pair_budget,
+                trace_memory=trace_memory,
+            )
+        )
+
+    return {
+        "generated_at": datetime.datetime.now().isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "config": {
+            "scales": list(scales),
+            "seed": seed,
+            "jobs_per_user": jobs_per_user,
+            "engines": list(engines),
+            "workers": workers,
+            "single_user_samples": single_user_samples,
+            "reference_pair_budget": reference_pair_budget,
+            "trace_memory": trace_memory,
+            "matching_top_k": settings.MATCHING_TOP_K,
+            "matching_min_score": settings.MATCHING_MIN_SCORE,
+            "matching_user_block_size": settings.MATCHING_USER_BLOCK_SIZE,
+        },
+        "warm_up": warm_up_stats,
+        "results": scale_reports,
+        "scaling_curves": fit_scaling_curves(scale_reports),
+    }
@@ -1,9 +1,38 @@
 import datetime
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import time
 import uuid
 
+from django.conf import settings
 from neomodel import db
 
-from api.models import Job, Maintenance, MatchingTask, ScrapingTask, User
+from api.services.matchers.helper import build_job_key
+
+BACKUP_FORMAT_VERSION = 1
+BACKUP_DIR_PREFIX = "neo4j_backup_"
+BACKUP_MANIFEST_NAME = "manifest.json"
+
+
+class BackupError(Exception):
+    """Backup sebelum import gagal ditulis, import tidak boleh dilanjutkan"""
+
+
+# Aturan restore: backup hanya mengisi node, relationship dan property yang
+# hilang. Jika property ada di backup dan di data live, nilai live yang dipakai
+# (lihat build_fill_missing_properties)
+
+# Node yang hanya boleh ada satu di database
+RESTORE_SINGLETON_LABELS = {"Maintenance"}
+# Default property model ORM untuk backup yang tidak menyimpan property tersebut
+RESTORE_NODE_DEFAULTS = {
+    "User": {"role": "user"},
+    "ScrapingTask": {"message": ""},
+    "Maintenance": {"isMaintenance": False},
+}
 
 
 def check_label_exists(label: str) -> bool:
@@ -50,182 +79,326 @@ def get_existing_relationship_types() -> list[str]:
         return []
 
 
-def backup_nodes_by_labels(labels: list[str]) -> dict[str, any]:
-    """Backup nodes by their labels using ORM, skipping non-existent ones"""
-    backup_data = {}
+def get_backup_root() -> str:
+    """Folder tempat semua backup Neo4j disimpan"""
+    return str(settings.NEO4J_BACKUP_DIR)
+
+
+def iter_cypher_pages(query: str, params: dict | None = None, fetch_size=None):
+    """
+    Yield record query per halaman (keyset pagination pada id).
+    Query harus memakai $last_id dan $fetch_size, dengan kolom pertama berisi id
+    yang terurut naik, sehingga memory tetap sebatas fetch_size record.
+    """
+    fetch_size = fetch_size or settings.NEO4J_BACKUP_FETCH_SIZE
+    last_id = -1
+    while True:
+        result, _ = db.cypher_query(
+            query, {**(params or {}), "last_id": last_id, "fetch_size": fetch_size}
+        )
+        yield from result
+        if len(result) < fetch_size:
+            return
+        last_id = result[-1][0]
+
+
+def get_file_checksum(file_path: str) -> str:
+    """SHA-256 isi file, dibaca per blok"""
+    checksum = hashlib.sha256()
+    with open(file_path, "rb") as backup_file:
+        for block in iter(lambda: backup_file.read(1024 * 1024), b""):
+            checksum.update(block)
+    return checksum.hexdigest()
+
+
+def write_backup_section(
+    backup_dir: str, section_key: str, kind: str, records
+) -> dict[str, any]:
+    """Tulis record satu section ke {section_key}.ndjson.gz, return entry manifest"""
+    file_name = f"{section_key}.ndjson.gz"
+    file_path = os.path.join(backup_dir, file_name)
+
+    count = 0
+    with gzip.open(file_path, "wt", encoding="utf-8") as section_file:
+        for record in records:
+            section_file.write(json.dumps(record, default=str) + "\n")
+            count += 1
+    os.chmod(file_path, 0o600)
+
+    return {
+        "key": section_key,
+        "kind": kind,
+        "file": file_name,
+        "count": count,
+        "sha256": get_file_checksum(file_path),
+    }
+
+
+def iter_backup_section_records(backup_dir: str, section: dict[str, any]):
+    """Baca record section backup satu per satu"""
+    file_path = os.path.join(backup_dir, section["file"])
+    with gzip.open(file_path, "rt", encoding="utf-8") as section_file:
+        for line in section_file:
+            if line.strip():
+                yield json.loads(line)
+
+
+def write_backup_manifest(backup_dir: str, manifest: dict[str, any]) -> None:
+    """Tulis manifest secara atomic (file sementara lalu rename)"""
+    manifest_path = os.path.join(backup_dir, BACKUP_MANIFEST_NAME)
+    temp_path = f"{manifest_path}.{uuid.uuid4().hex}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as manifest_file:
+        json.dump(manifest, manifest_file, indent=2, default=str)
+    os.chmod(temp_path, 0o600)
+    os.replace(temp_path, manifest_path)
+
+
+def load_backup(backup_dir: str) -> dict[str, any] | None:
+    """Load manifest backup dari folder, None jika backup belum selesai ditulis"""
+    manifest_path = os.path.join(backup_dir, BACKUP_MANIFEST_NAME)
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as manifest_file:
+            manifest = json.load(manifest_file)
+    except (OSError, ValueError):
+        return None
+
+    manifest["backup_dir"] = backup_dir
+    return manifest
+
+
+def save_backup_status(backup_data: dict[str, any], status: str) -> None:
+    """Update status di manifest backup (complete -> restored/superseded)"""
+    backup_dir = backup_data.get("backup_dir")
+    if not backup_dir:
+        return
+
+    backup_data["status"] = status
+    backup_data[f"{status}_at"] = datetime.datetime.now().isoformat()
+    write_backup_manifest(
+        backup_dir, {k: v for k, v in backup_data.items() if k != "backup_dir"}
+    )
+
+
+def verify_backup(backup_data: dict[str, any]) -> list[str]:
+    """Cek checksum semua section, return list error (kosong jika valid)"""
+    errors = []
+    for section in backup_data.get("sections", []):
+        file_path = os.path.join(backup_data["backup_dir"], section["file"])
+        try:
+            if get_file_checksum(file_path) != section["sha256"]:
+                errors.append(f"Checksum mismatch for {section['file']}")
+        except OSError as e:
+            errors.append(f"Cannot read {section['file']}: {e}")
+
+    return errors
+
+
+def list_backup_dirs() -> list[str]:
+    """Semua folder backup, urut dari yang paling lama"""
+    backup_root = get_backup_root()
+    if not os.path.isdir(backup_root):
+        return []
+
+    return [
+        os.path.join(backup_root, name)
+        for name in sorted(os.listdir(backup_root))
+        if name.startswith(BACKUP_DIR_PREFIX)
+        and os.path.isdir(os.path.join(backup_root, name))
+    ]
+
+
+def find_pending_backups() -> list[dict[str, any]]:
+    """Backup lengkap yang belum pernah di-restore (proses mati di tengah import)"""
+    pending = []
+    for backup_dir in list_backup_dirs():
+        backup_data = load_backup(backup_dir)
+        if backup_data and backup_data.get("status") == "complete":
+            pending.append(backup_data)
+
+    return pending
+
+
+def prune_backups(keep=None) -> int:
+    """Hapus backup lama yang sudah di-restore dan backup yang tidak selesai ditulis"""
+    keep = settings.NEO4J_BACKUP_KEEP if keep is None else keep
+    backup_dirs = list_backup_dirs()
+
+    removable = []
+    finished = []
+    for backup_dir in backup_dirs:
+        backup_data = load_backup(backup_dir)
+        if backup_data is None:
+            # Folder terbaru bisa jadi sedang ditulis
+            if backup_dir != backup_dirs[-1]:
+                removable.append(backup_dir)
+        elif backup_data.get("status") in ("restored", "superseded"):
+            finished.append(backup_dir)
+
+    if keep > 0:
+        finished = finished[:-keep]
+    removable.extend(finished)
+
+    for backup_dir in removable:
+        shutil.rmtree(backup_dir, ignore_errors=True)
+
+    return len(removable)
+
+
+def iter_label_nodes(label: str, fetch_size=None):
+    """Stream node dengan label tertentu dalam format record backup"""
+    query = f"""
+    MATCH (n:{label})
+    WHERE id(n) > $last_id
+    RETURN id(n) AS node_id, properties(n) AS props, labels(n) AS labels
+    ORDER BY node_id
+    LIMIT $fetch_size
+    """
+    for record in iter_cypher_pages(query, fetch_size=fetch_size):
+        yield {
+            "node_id": record[0],
+            "properties": record[1],
+            "labels": record[2],
+        }
+
+
+def backup_nodes_by_labels(labels: list[str], backup_dir: str) -> list[dict]:
+    """Backup nodes by their labels ke file NDJSON, skipping non-existent ones"""
+    sections = []
     existing_labels = get_existing_labels()
 
     for label in labels:
+        section_key = f"{label.lower()}_nodes"
         if label not in existing_labels:
             print(f"   ⚠️ Skipping {label} - label not found in database")
-            backup_data[f"{label.lower()}_nodes"] = []
             continue
 
         try:
             print(f"   📦 Backing up {label} nodes...")
-
-            # Use ORM for known models, fallback to cypher for others
-            nodes = []
-            if label == "User":
-                users = User.nodes.all()
-                for user in users:
-                    nodes.append(
-                        {
-                            "node_id": (
-                                user.element_id if hasattr(user, "element_id") else None
-                            ),
-                            "properties": {
-                                "uid": user.uid,
-                                "name": user.name,
-                                "email": user.email,
-                                "password": user.password,
-                                "profilePicture": user.profilePicture,
-                                "role": user.role,
-                            },
-                            "labels": ["User"],
-                        }
-                    )
-            elif label == "ScrapingTask":
-                tasks = ScrapingTask.nodes.all()
-                for task in tasks:
-                    nodes.append(
-                        {
-                            "node_id": (
-                                task.element_id if hasattr(task, "element_id") else None
-                            ),
-                            "properties": {
-                                "uid": task.uid,
-                                "status": task.status,
-                                "startedAt": task.startedAt,
-                                "finishedAt": task.finishedAt,
-                                "message": task.message,
-                            },
-                            "labels": ["ScrapingTask"],
-                        }
-                    )
-            elif label == "MatchingTask":
-                tasks = MatchingTask.nodes.all()
-                for task in tasks:
-                    nodes.append(
-                        {
-                            "node_id": (
-                                task.element_id if hasattr(task, "element_id") else None
-                            ),
-                            "properties": {
-                                "uid": task.uid,
-                                "status": task.status,
-                                "startedAt": task.startedAt,
-                                "finishedAt": task.finishedAt,
-                            },
-                            "labels": ["MatchingTask"],
-                        }
-                    )
-            elif label == "Maintenance":
-                maintenance = Maintenance.nodes.all()
-                for m in maintenance:
-                    nodes.append(
-                        {
-                            "node_id": (
-                                m.element_id if hasattr(m, "element_id") else None
-                            ),
-                            "properties": {
-                                "isMaintenance": m.isMaintenance,
-                            },
-                            "labels": ["Maintenance"],
-                        }
-                    )
-            else:
-                # Fallback to cypher for unknown labels
-                query = f"""
-                MATCH (n:{label})
-                RETURN properties(n) AS props,
-                    id(n) AS node_id,
-                    labels(n) AS labels
-                ORDER BY id(n)
-                """
-                result, _ = db.cypher_query(query)
-                for record in result:
-                    nodes.append(
-                        {
-                            "node_id": record[1],
-                            "properties": record[0],
-                            "labels": record[2],
-                        }
-                    )
-
-            backup_data[f"{label.lower()}_nodes"] = nodes
-            print(f"     ✅ Backed up {len(nodes)} {label} nodes")
+            section = write_backup_section(
+                backup_dir, section_key, "nodes", iter_label_nodes(label)
+            )
+            sections.append(section)
+            print(f"     ✅ Backed up {section['count']} {label} nodes")
 
         except Exception as e:
             print(f"     ⚠️ Error backing up {label}: {e}")
-            backup_data[f"{label.lower()}_nodes"] = []
 
-    return backup_data
+    return sections
+
+
+def iter_type_relationships(rel_type: str, fetch_size=None):
+    """Stream relationship dengan tipe tertentu dalam format record backup"""
+    query = f"""
+    MATCH (start)-[r:{rel_type}]->(end)
+    WHERE id(r) > $last_id
+    RETURN id(r) AS rel_id,
+        properties(r) AS rel_props,
+        type(r) AS rel_type,
+        labels(start) AS start_labels,
+        labels(end) AS end_labels,
+        properties(start) AS start_props,
+        properties(end) AS end_props
+    ORDER BY rel_id
+    LIMIT $fetch_size
+    """
+    for record in iter_cypher_pages(query, fetch_size=fetch_size):
+        yield {
+            "start_node_labels": record[3],
+            "start_node_props": record[5],
+            "end_node_labels": record[4],
+            "end_node_props": record[6],
+            "relationship_type": record[2],
+            "relationship_props": record[1],
+        }
 
 
-def backup_relationships_by_types(relationship_types: list[str]) -> dict[str, any]:
-    """Backup relationships by their types using ORM, skipping non-existent ones"""
-    backup_data = {}
+def backup_relationships_by_types(
+    relationship_types: list[str], backup_dir: str
+) -> list[dict]:
+    """Backup relationships by their types ke file NDJSON, skipping non-existent ones"""
+    sections = []
     existing_rel_types = get_existing_relationship_types()
 
     for rel_type in relationship_types:
+        section_key = f"{rel_type.lower()}_relationships"
         if rel_type not in existing_rel_types:
             print(f"   ⚠️ Skipping {rel_type} - relationship type not found in database")
-            backup_data[f"{rel_type.lower()}_relationships"] = []
             continue
 
         try:
             print(f"   🔗 Backing up {rel_type} relationships...")
-
-            query = f"""
-            MATCH (start)-[r:{rel_type}]->(end)
-            RETURN startNode(r) AS start_node,
-                endNode(r) AS end_node,
-                properties(r) AS rel_props,
-                type(r) AS rel_type,
-                labels(startNode(r)) AS start_labels,
-                labels(endNode(r)) AS end_labels,
-                properties(startNode(r)) AS start_props,
-                properties(endNode(r)) AS end_props
-            """
-
-            result, _ = db.cypher_query(query)
-            relationships = []
-
-            for record in result:
-                relationships.append(
-                    {
-                        "start_node_labels": record[4],
-                        "start_node_props": record[6],
-                        "end_node_labels": record[5],
-                        "end_node_props": record[7],
-                        "relationship_type": record[3],
-                        "relationship_props": record[2],
-                    }
-                )
-
-            backup_data[f"{rel_type.lower()}_relationships"] = relationships
-            print(f"     ✅ Backed up {len(relationships)} {rel_type} relationships")
+            section = write_backup_section(
+                backup_dir,
+                section_key,
+                "relationships",
+                iter_type_relationships(rel_type),
+            )
+            sections.append(section)
+            print(f"     ✅ Backed up {section['count']} {rel_type} relationships")
 
         except Exception as e:
             print(f"     ⚠️ Error backing up {rel_type} relationships: {e}")
-            backup_data[f"{rel_type.lower()}_relationships"] = []
 
-    return backup_data
+    return sections
+
+
+def iter_nodes_with_relationships(
+    node_label: str, relationship_types: list[str], fetch_size=None
+):
+    """Stream node beserta relationship-nya, satu record per node"""
+    # Build relationship patterns for existing types only
+    rel_patterns = []
+    return_clauses = []
+
+    for i, rel_type in enumerate(relationship_types):
+        rel_patterns.append(f"OPTIONAL MATCH (n)-[r{i}:{rel_type}]-(related{i})")
+        return_clauses.append(
+            f"collect(DISTINCT {{type: type(r{i}), props: properties(r{i}), "
+            f"related_labels: labels(related{i}), related_props: properties(related{i})}}) AS {rel_type.lower()}_rels"
+        )
+
+    # Halaman node dipilih dulu sebelum OPTIONAL MATCH agar LIMIT per node
+    query = f"""
+    MATCH (n:{node_label})
+    WHERE id(n) > $last_id
+    WITH n ORDER BY id(n) LIMIT $fetch_size
+    {' '.join(rel_patterns)}
+    RETURN id(n) AS node_id,
+        properties(n) AS node_props,
+        labels(n) AS node_labels,
+        {', '.join(return_clauses)}
+    ORDER BY node_id
+    """
+
+    for record in iter_cypher_pages(query, fetch_size=fetch_size):
+        node_data = {
+            "node_id": record[0],
+            "properties": record[1],
+            "labels": record[2],
+            "relationships": {},
+        }
+
+        # Add relationships, filter out empty relationships
+        for i, rel_type in enumerate(relationship_types):
+            node_data["relationships"][rel_type] = [
+                rel for rel in record[3 + i] if rel.get("type") is not None
+            ]
+
+        yield node_data
 
 
 def backup_node_relationships(
     node_label: str,
     relationship_types: list[str],
-) -> dict[str, any]:
-    """Backup specific node with its relationships using ORM where possible"""
-    backup_data = {}
+    backup_dir: str,
+) -> list[dict]:
+    """Backup specific node with its relationships ke file NDJSON"""
+    section_key = f"{node_label.lower()}_with_relationships"
 
     # Check if node label exists
     if not check_label_exists(node_label):
         print(f"   ⚠️ Skipping {node_label} - label not found in database")
-        backup_data[f"{node_label.lower()}_with_relationships"] = []
-        return backup_data
+        return []
 
     # Filter existing relationship types
     existing_rel_types = get_existing_relationship_types()
@@ -233,89 +406,52 @@ def backup_node_relationships(
 
     if not valid_rel_types:
         print(f"   ⚠️ No valid relationship types found for {node_label}")
-        backup_data[f"{node_label.lower()}_with_relationships"] = []
-        return backup_data
+        return []
 
     try:
         print(f"   🎯 Backing up {node_label} nodes with relationships...")
         print(f"     Valid relationships: {valid_rel_types}")
 
-        # Build relationship patterns for existing types only
-        rel_patterns = []
-        return_clauses = []
-
-        for i, rel_type in enumerate(valid_rel_types):
-            rel_patterns.append(f"OPTIONAL MATCH (n)-[r{i}:{rel_type}]-(related{i})")
-            return_clauses.append(
-                f"collect(DISTINCT {{type: type(r{i}), props: properties(r{i}), "
-                f"related_labels: labels(related{i}), related_props: properties(related{i})}}) AS {rel_type.lower()}_rels"
-            )
-
-        query = f"""
-        MATCH (n:{node_label})
-        {' '.join(rel_patterns)}
-        RETURN n,
-            properties(n) AS node_props,
-            labels(n) AS node_labels,
-            id(n) AS node_id,
-            {', '.join(return_clauses)}
-        ORDER BY id(n)
-        """
-
-        result, _ = db.cypher_query(query)
-        nodes_with_rels = []
-
-        for record in result:
-            node_data = {
-                "node_id": record[3],
-                "properties": record[1],
-                "labels": record[2],
-                "relationships": {},
-            }
-
-            # Add relationships
-            for i, rel_type in enumerate(valid_rel_types):
-                rel_key_index = 4 + i  # Start from index 4
-                if len(record) > rel_key_index:
-                    # Filter out empty relationships
-                    valid_rels = [
-                        rel
-                        for rel in record[rel_key_index]
-                        if rel.get("type") is not None
-                    ]
-                    node_data["relationships"][rel_type] = valid_rels
-
-            nodes_with_rels.append(node_data)
-
-        backup_data[f"{node_label.lower()}_with_relationships"] = nodes_with_rels
+        section = write_backup_section(
+            backup_dir,
+            section_key,
+            "nodes_with_relationships",
+            iter_nodes_with_relationships(node_label, valid_rel_types),
+        )
         print(
-            f"     ✅ Backed up {len(nodes_with_rels)} {node_label} nodes with relationships"
+            f"     ✅ Backed up {section['count']} {node_label} nodes with relationships"
         )
+        return [section]
 
     except Exception as e:
         print(f"     ⚠️ Error backing up {node_label} with relationships: {e}")
-        backup_data[f"{node_label.lower()}_with_relationships"] = []
-
-    return backup_data
+        return []
 
 
 def perform_full_dynamic_backup(config: dict[str, any]) -> dict[str, any]:
-    """Perform full backup based on configuration using ORM where possible"""
-    backup_data = {
-        "metadata": {
-            "backup_timestamp": datetime.datetime.now().isoformat(),
-            "config": config,
-            "warnings": [],
-        }
-    }
+    """
+    Perform full backup based on configuration.
+    Data di-stream ke folder backup (NDJSON gzip per section + manifest.json
+    berisi jumlah record dan checksum), yang di-return hanya manifest-nya.
+    """
+    backup_timestamp = datetime.datetime.now()
+    backup_name = backup_timestamp.strftime("%Y%m%dT%H%M%S%f")
+    backup_dir = os.path.join(
+        get_backup_root(),
+        f"{BACKUP_DIR_PREFIX}{backup_name}_{uuid.uuid4().hex[:8]}",
+    )
+    try:
+        os.makedirs(backup_dir, mode=0o700)
+    except OSError as e:
+        raise BackupError(f"Cannot create backup folder {backup_dir}: {e}") from e
 
+    sections = []
     warnings = []
 
     # Backup individual nodes
     if "node_labels" in config and config["node_labels"]:
         try:
-            node_backup = backup_nodes_by_labels(config["node_labels"])
-            backup_data.update(node_backup)
+            sections.extend(backup_nodes_by_labels(config["node_labels"], backup_dir))
         except Exception as e:
             warning = f"Error backing up node labels: {e}"
             warnings.append(warning)
@@ -324,8 +460,9 @@ def perform_full_dynamic_backup(config: dict[str, any]) -> dict[str, any]:
     # Backup individual relationships
     if "relationship_types" in config and config["relationship_types"]:
         try:
-            rel_backup = backup_relationships_by_types(config["relationship_types"])
-            backup_data.update(rel_backup)
+            sections.extend(
+                backup_relationships_by_types(config["relationship_types"], backup_dir)
+            )
         except Exception as e:
             warning = f"Error backing up relationship types: {e}"
             warnings.append(warning)
@@ -338,27 +475,66 @@ def perform_full_dynamic_backup(config: dict[str, any]) -> dict[str, any]:
                 node_label = node_config["label"]
                 rel_types = node_config["relationships"]
 
-                node_rel_backup = backup_node_relationships(node_label, rel_types)
-                backup_data.update(node_rel_backup)
+                sections.extend(
+                    backup_node_relationships(node_label, rel_types, backup_dir)
+                )
             except Exception as e:
                 warning = f"Error backing up {node_config.get('label', 'unknown')} with relationships: {e}"
                 warnings.append(warning)
                 print(f"   ⚠️ {warning}")
 
-    # Calculate totals
-    total_items = 0
-    for key, value in backup_data.items():
-        if isinstance(value, list):
-            total_items += len(value)
+    total_items = sum(section["count"] for section in sections)
 
-    backup_data["metadata"]["total_items"] = total_items
-    backup_data["metadata"]["warnings"] = warnings
+    # Manifest ditulis terakhir, backup tanpa manifest dianggap tidak lengkap
+    manifest = {
+        "version": BACKUP_FORMAT_VERSION,
+        "status": "complete",
+        "metadata": {
+            "backup_timestamp": backup_timestamp.isoformat(),
+            "config": config,
+            "warnings": warnings,
+            "total_items": total_items,
+        },
+        "sections": sections,
+    }
+    try:
+        write_backup_manifest(backup_dir, manifest)
+    except OSError as e:
+        raise BackupError(f"Cannot write backup manifest in {backup_dir}: {e}") from e
 
-    print(f"\n   ✅ Dynamic backup completed: {total_items} items")
+    print(f"\n   ✅ Dynamic backup completed: {total_items} items in {backup_dir}")
     if warnings:
         print(f"   ⚠️ {len(warnings)} warnings occurred")
 
-    return backup_data
+    return {**manifest, "backup_dir": backup_dir}
+
+
+def iter_backup_sections(backup_data: dict[str, any], kind: str):
+    """
+    Yield (section_key, records) untuk section dengan kind tertentu.
+    Mendukung backup di disk (manifest) maupun dict lama berisi list di memory.
+    """
+    if "sections" in backup_data:
+        for section in backup_data["sections"]:
+            if section["kind"] == kind and section["count"] > 0:
+                yield section["key"], iter_backup_section_records(
+                    backup_data["backup_dir"], section
+                )
+        return
+
+    suffix = {
+        "nodes": "_nodes",
+        "relationships": "_relationships",
+        "nodes_with_relationships": "_with_relationships",
+    }[kind]
+    for key, records in backup_data.items():
+        if not isinstance(records, list) or not records:
+            continue
+        if not key.endswith(suffix):
+            continue
+        if kind == "relationships" and key.endswith("_with_relationships"):
+            continue
+        yield key, records
 
 
 def get_unique_property(props: dict[str, any]) -> tuple | None:
@@ -378,384 +554,475 @@ def get_unique_property(props: dict[str, any]) -> tuple | None:
     return None
 
 
-def restore_nodes(backup_data: dict[str, any]) -> int:
-    """Restore nodes from backup data using ORM where possible"""
+def restore_grouped_rows(grouped_rows, build_query, batch_size=None) -> int:
+    """
+    Kirim row per group dengan satu query UNWIND $rows per batch.
+    grouped_rows berisi (group_key, row); query dibangun sekali per group
+    sehingga teks query tetap sama dan plan cache Neo4j terpakai.
+    """
+    batch_size = batch_size or settings.NEO4J_IMPORT_BATCH_SIZE
+    queries = {}
+    pending = {}
+    written = 0
+
+    for group_key, row in grouped_rows:
+        rows = pending.setdefault(group_key, [])
+        rows.append(row)
+        if len(rows) >= batch_size:
+            if group_key not in queries:
+                queries[group_key] = build_query(group_key)
+            db.cypher_query(queries[group_key], {"rows": rows})
+            written += len(rows)
+            pending[group_key] = []
+
+    for group_key, rows in pending.items():
+        if rows:
+            if group_key not in queries:
+                queries[group_key] = build_query(group_key)
+            db.cypher_query(queries[group_key], {"rows": rows})
+            written += len(rows)
+
+    return written
+
+
+def build_fill_missing_properties(variable: str, props: str) -> str:
+    """
+    Cypher yang hanya mengisi property yang belum ada di node/relationship.
+    Nilai live selalu menang, sehingga backup lama (misal dari
+    recover_pending_backups) tidak menimpa perubahan setelah backup dibuat.
+    """
+    return f"""
+    WITH *, properties({variable}) AS live_{variable}
+    SET {variable} += {props}
+    SET {variable} += live_{variable}
+    """
+
+
+def build_node_restore_query(group_key: tuple) -> str:
+    """Query UNWIND untuk satu kombinasi label + property unik"""
+    labels, match_prop = group_key
+    labels_str = ":".join(labels)
+
+    if match_prop is None:
+        # Node singleton hanya dibuat jika belum ada sama sekali
+        return f"""
+        OPTIONAL MATCH (existing:{labels_str})
+        WITH count(existing) AS existing
+        WHERE existing = 0
+        UNWIND $rows[0..1] AS row
+        CREATE (n:{labels_str})
+        SET n = row.props
+        """
+
+    return f"""
+    UNWIND $rows AS row
+    MERGE (n:{labels_str} {{{match_prop}: row.value}})
+    {build_fill_missing_properties("n", "row.props")}
+    """
+
+
+def build_relationship_restore_query(group_key: tuple) -> str:
+    """Query UNWIND untuk satu tipe relationship + label/property unik kedua node"""
+    rel_type, start_labels, start_prop, end_labels, end_prop = group_key
+    return f"""
+    UNWIND $rows AS row
+    MERGE (start:{':'.join(start_labels)} {{{start_prop}: row.start_value}})
+    {build_fill_missing_properties("start", "row.start_props")}
+    MERGE (end:{':'.join(end_labels)} {{{end_prop}: row.end_value}})
+    {build_fill_missing_properties("end", "row.end_props")}
+    MERGE (start)-[r:{rel_type}]->(end)
+    {build_fill_missing_properties("r", "row.rel_props")}
+    """
+
+
+def build_node_relationship_restore_query(group_key: tuple) -> str:
+    """Query UNWIND untuk relationship dari node utama ke node terkait"""
+    rel_type, node_labels, node_prop, related_labels, related_prop = group_key
+    return f"""
+    UNWIND $rows AS row
+    MERGE (n:{':'.join(node_labels)} {{{node_prop}: row.node_value}})
+    MERGE (related:{':'.join(related_labels)} {{{related_prop}: row.related_value}})
+    {build_fill_missing_properties("related", "row.related_props")}
+    MERGE (n)-[r:{rel_type}]->(related)
+    {build_fill_missing_properties("r", "row.rel_props")}
+    """
+
+
+def iter_node_restore_rows(label: str, nodes):
+    """Map record node backup ke (group_key, row) untuk restore_grouped_rows"""
+    for node in nodes:
+        labels = tuple(node["labels"])
+        props = {}
+        for node_label in labels:
+            props.update(RESTORE_NODE_DEFAULTS.get(node_label, {}))
+        props.update(node["properties"])
+
+        if set(labels) & RESTORE_SINGLETON_LABELS:
+            yield (labels, None), {"props": props}
+            continue
+
+        unique_prop = get_unique_property(props)
+        if not unique_prop:
+            print(f"     ⚠️ No unique property found for {label} node, skipping...")
+            continue
+
+        yield (labels, unique_prop[0]), {"value": unique_prop[1], "props": props}
+
+
+def restore_nodes(backup_data: dict[str, any], batch_size=None) -> int:
+    """Restore nodes from backup data, batch UNWIND per kombinasi label"""
     total_restored = 0
 
-    for key, nodes in backup_data.items():
-        if key.endswith("_nodes") and isinstance(nodes, list):
-            if not nodes:  # Skip empty collections
-                continue
+    for key, nodes in iter_backup_sections(backup_data, "nodes"):
+        label = key.replace("_nodes", "").replace("_", "").title()
 
-            label = key.replace("_nodes", "").replace("_", "").title()
+        try:
+            print(f"   📦 Restoring {label} nodes...")
 
-            try:
-                print(f"   📦 Restoring {label} nodes...")
-
-                restored = 0
-                for node in nodes:
-                    try:
-                        props = node["properties"]
-                        labels = node["labels"]
-
-                        # Use ORM for known models, fallback to cypher
-                        if label == "User":
-                            # Use ORM to create/update User
-                            user = User.nodes.get_or_none(email=props.get("email"))
-                            if not user:
-                                user = User(
-                                    uid=props.get("uid"),
-                                    name=props.get("name"),
-                                    email=props.get("email"),
-                                    password=props.get("password"),
-                                    profilePicture=props.get("profilePicture"),
-                                    role=props.get("role", "user"),
-                                )
-                                user.save()
-                                restored += 1
-                        elif label == "ScrapingTask":
-                            # Use ORM to create/update ScrapingTask
-                            task = ScrapingTask.nodes.get_or_none(uid=props.get("uid"))
-                            if not task:
-                                task = ScrapingTask(
-                                    uid=props.get("uid"),
-                                    status=props.get("status"),
-                                    startedAt=props.get("startedAt"),
-                                    finishedAt=props.get("finishedAt"),
-                                    message=props.get("message", ""),
-                                )
-                                task.save()
-                                restored += 1
-                        elif label == "MatchingTask":
-                            # Use ORM to create/update MatchingTask
-                            task = MatchingTask.nodes.get_or_none(uid=props.get("uid"))
-                            if not task:
-                                task = MatchingTask(
-                                    uid=props.get("uid"),
-                                    status=props.get("status"),
-                                    startedAt=props.get("startedAt"),
-                                    finishedAt=props.get("finishedAt"),
-                                )
-                                task.save()
-                                restored += 1
-                        elif label == "Maintenance":
-                            # Use ORM to create/update Maintenance
-                            maintenance = Maintenance.get_current_maintenance()
-                            if not maintenance:
-                                maintenance = Maintenance(
-                                    isMaintenance=props.get("isMaintenance", False)
-                                )
-                                maintenance.save()
-                                restored += 1
-                        else:
-                            # Fallback to cypher for unknown labels
-                            unique_prop = get_unique_property(props)
-                            if not unique_prop:
-                                print(
-                                    f"     ⚠️ No unique property found for {label} node, skipping..."
-                                )
-                                continue
-
-                            labels_str = ":".join(labels)
-                            query = f"""
-                            MERGE (n:{labels_str} {{{unique_prop[0]}: $unique_value}})
-                            SET n = $props
-                            """
-                            db.cypher_query(
-                                query, {"unique_value": unique_prop[1], "props": props}
-                            )
-                            restored += 1
-
-                    except Exception as e:
-                        print(f"     ⚠️ Error restoring individual {label} node: {e}")
-                        continue
-
-                print(f"     ✅ Restored {restored} {label} nodes")
-                total_restored += restored
+            restored = restore_grouped_rows(
+                iter_node_restore_rows(label, nodes),
+                build_node_restore_query,
+                batch_size,
+            )
 
-            except Exception as e:
-                print(f"     ⚠️ Error restoring {label} nodes: {e}")
-                continue
+            print(f"     ✅ Restored {restored} {label} nodes")
+            total_restored += restored
+
+        except Exception as e:
+            print(f"     ⚠️ Error restoring {label} nodes: {e}")
+            continue
 
     return total_restored
 
 
-def restore_relationships(backup_data: dict[str, any]) -> int:
-    """Restore relationships from backup data using db.cypher_query"""
+def iter_relationship_restore_rows(rel_type: str, relationships):
+    """Map record relationship backup ke (group_key, row)"""
+    for rel in relationships:
+        start_props = rel["start_node_props"]
+        end_props = rel["end_node_props"]
+
+        # Find unique property for matching
+        start_match_prop = get_unique_property(start_props)
+        end_match_prop = get_unique_property(end_props)
+        if not start_match_prop or not end_match_prop:
+            continue
+
+        group_key = (
+            rel_type,
+            tuple(rel["start_node_labels"]),
+            start_match_prop[0],
+            tuple(rel["end_node_labels"]),
+            end_match_prop[0],
+        )
+        yield group_key, {
+            "start_value": start_match_prop[1],
+            "end_value": end_match_prop[1],
+            "start_props": start_props,
+            "end_props": end_props,
+            "rel_props": rel["relationship_props"],
+        }
+
+
+def restore_relationships(backup_data: dict[str, any], batch_size=None) -> int:
+    """Restore relationships from backup data, batch UNWIND per tipe relationship"""
     total_restored = 0
 
-    for key, relationships in backup_data.items():
-        if key.endswith("_relationships") and isinstance(relationships, list):
-            if not relationships:  # Skip empty collections
-                continue
+    for key, relationships in iter_backup_sections(backup_data, "relationships"):
+        rel_type = key.replace("_relationships", "").upper()
 
-            rel_type = key.replace("_relationships", "").upper()
+        try:
+            print(f"   🔗 Restoring {rel_type} relationships...")
 
-            try:
-                print(f"   🔗 Restoring {rel_type} relationships...")
-
-                restored = 0
-                for rel in relationships:
-                    try:
-                        start_labels = rel["start_node_labels"]
-                        start_props = rel["start_node_props"]
-                        end_labels = rel["end_node_labels"]
-                        end_props = rel["end_node_props"]
-                        rel_props = rel["relationship_props"]
-
-                        # Build match patterns
-                        start_labels_str = ":".join(start_labels)
-                        end_labels_str = ":".join(end_labels)
-
-                        # Find unique property for matching
-                        start_match_prop = get_unique_property(start_props)
-                        end_match_prop = get_unique_property(end_props)
-
-                        if start_match_prop and end_match_prop:
-                            query = f"""
-                            MERGE (start:{start_labels_str} {{{start_match_prop[0]}: $start_value}})
-                            SET start = $start_props
-                            MERGE (end:{end_labels_str} {{{end_match_prop[0]}: $end_value}})
-                            SET end = $end_props
-                            MERGE (start)-[r:{rel_type}]->(end)
-                            SET r = $rel_props
-                            """
-
-                            db.cypher_query(
-                                query,
-                                {
-                                    "start_value": start_match_prop[1],
-                                    "end_value": end_match_prop[1],
-                                    "start_props": start_props,
-                                    "end_props": end_props,
-                                    "rel_props": rel_props,
-                                },
-                            )
-                            restored += 1
-                    except Exception as e:
-                        print(
-                            f"     ⚠️ Error restoring individual {rel_type} relationship: {e}"
-                        )
-                        continue
-
-                print(f"     ✅ Restored {restored} {rel_type} relationships")
-                total_restored += restored
+            restored = restore_grouped_rows(
+                iter_relationship_restore_rows(rel_type, relationships),
+                build_relationship_restore_query,
+                batch_size,
+            )
 
-            except Exception as e:
-                print(f"     ⚠️ Error restoring {rel_type} relationships: {e}")
-                continue
+            print(f"     ✅ Restored {restored} {rel_type} relationships")
+            total_restored += restored
+
+        except Exception as e:
+            print(f"     ⚠️ Error restoring {rel_type} relationships: {e}")
+            continue
 
     return total_restored
 
 
-def restore_nodes_with_relationships(backup_data: dict[str, any]) -> int:
-    """Restore nodes with their relationships using hybrid approach"""
-    total_restored = 0
+def iter_node_with_relationship_restore_rows(label: str, nodes_with_rels, stats):
+    """
+    Map record node + relationship backup ke (group_key, row).
+    Relationship memakai MERGE pada node utama, jadi urutan flush batch
+    node dan relationship tidak mempengaruhi hasil.
+    """
+    for node_data in nodes_with_rels:
+        props = node_data["properties"]
+        labels = tuple(node_data["labels"])
+
+        # Get unique property for main node
+        node_match_prop = get_unique_property(props)
+        if not node_match_prop:
+            print(f"     ⚠️ No unique property found for {label} node, skipping...")
+            continue
+
+        stats["nodes"] += 1
+        yield ("node", labels, node_match_prop[0]), {
+            "value": node_match_prop[1],
+            "props": props,
+        }
 
-    for key, nodes_with_rels in backup_data.items():
-        if key.endswith("_with_relationships") and isinstance(nodes_with_rels, list):
-            if not nodes_with_rels:  # Skip empty collections
-                continue
-
-            label = key.replace("_with_relationships", "").title()
-            print(f"   🎯 Restoring {label} with relationships...")
-
-            restored = 0
-            for node_data in nodes_with_rels:
-                try:
-                    props = node_data["properties"]
-                    labels = node_data["labels"]
-                    relationships = node_data["relationships"]
-
-                    # Get unique property for main node
-                    node_match_prop = get_unique_property(props)
-                    if not node_match_prop:
-                        print(
-                            f"     ⚠️ No unique property found for {label} node, skipping..."
-                        )
-                        continue
-
-                    labels_str = ":".join(labels)
-
-                    # Use MERGE for main node
-                    merge_node_query = f"""
-                    MERGE (n:{labels_str} {{{node_match_prop[0]}: $node_value}})
-                    SET n = $props
-                    """
-                    db.cypher_query(
-                        merge_node_query,
-                        {"node_value": node_match_prop[1], "props": props},
-                    )
-
-                    # Restore relationships
-                    rel_count = 0
-                    for rel_type, rels in relationships.items():
-                        for rel in rels:
-                            if rel.get("type"):  # Skip empty relationships
-                                related_labels = rel.get("related_labels", [])
-                                related_props = rel.get("related_props", {})
-                                rel_props = rel.get("props", {})
-
-                                if related_labels and related_props:
-                                    related_labels_str = ":".join(related_labels)
-                                    match_prop = get_unique_property(related_props)
-
-                                    if match_prop and node_match_prop:
-                                        query = f"""
-                                        MERGE (n:{labels_str} {{{node_match_prop[0]}: $node_value}})
-                                        MERGE (related:{related_labels_str} {{{match_prop[0]}: $related_value}})
-                                        SET related = $related_props
-                                        MERGE (n)-[r:{rel_type}]->(related)
-                                        SET r = $rel_props
-                                        """
-
-                                        db.cypher_query(
-                                            query,
-                                            {
-                                                "node_value": node_match_prop[1],
-                                                "related_value": match_prop[1],
-                                                "related_props": related_props,
-                                                "rel_props": rel_props,
-                                            },
-                                        )
-                                        rel_count += 1
-
-                    print(
-                        f"     📎 Restored {rel_count} relationships for {label} node"
-                    )
-                    restored += 1
-
-                except Exception as e:
-                    print(f"     ⚠️ Error restoring {label} node: {e}")
+        for rel_type, rels in node_data["relationships"].items():
+            for rel in rels:
+                related_labels = rel.get("related_labels", [])
+                related_props = rel.get("related_props", {})
+                if not rel.get("type") or not related_labels or not related_props:
                     continue
 
-            print(f"     ✅ Restored {restored} {label} with relationships")
-            total_restored += restored
+                match_prop = get_unique_property(related_props)
+                if not match_prop:
+                    continue
 
-    return total_restored
+                stats["relationships"] += 1
+                group_key = (
+                    rel_type,
+                    labels,
+                    node_match_prop[0],
+                    tuple(related_labels),
+                    match_prop[0],
+                )
+                yield ("relationship", *group_key), {
+                    "node_value": node_match_prop[1],
+                    "related_value": match_prop[1],
+                    "related_props": related_props,
+                    "rel_props": rel.get("props", {}),
+                }
+
+
+def build_node_with_relationship_restore_query(group_key: tuple) -> str:
+    """Pilih builder query berdasarkan jenis row (node utama atau relationship)"""
+    if group_key[0] == "node":
+        _, labels, match_prop = group_key
+        return f"""
+        UNWIND $rows AS row
+        MERGE (n:{':'.join(labels)} {{{match_prop}: row.value}})
+        {build_fill_missing_properties("n", "row.props")}
+        """
 
+    return build_node_relationship_restore_query(group_key[1:])
 
-def enrich_user_nodes(users_data: list) -> int:
-    """Enrich User nodes with additional properties using ORM"""
-    if not users_data:
-        return 0
 
-    print("👤 Enriching User nodes with additional properties...")
-    print(f"   Found {len(users_data)} users in data")
+def restore_nodes_with_relationships(
+    backup_data: dict[str, any], batch_size=None
+) -> int:
+    """Restore nodes with their relationships, batch UNWIND per label dan tipe"""
+    total_restored = 0
+    batch_size = batch_size or settings.NEO4J_IMPORT_BATCH_SIZE
+
+    for key, nodes_with_rels in iter_backup_sections(
+        backup_data, "nodes_with_relationships"
+    ):
+        label = key.replace("_with_relationships", "").title()
+        print(f"   🎯 Restoring {label} with relationships...")
 
-    updated_count = 0
-    for user_data in users_data:
         try:
-            email = user_data.get("email")
-            if not email:
-                continue
-
-            # Find user using ORM
-            user = User.nodes.get_or_none(email=email)
-            if user:
-                # Update properties using ORM
-                if user_data.get("name"):
-                    user.name = user_data["name"]
-                if user_data.get("profile_image"):
-                    user.profilePicture = user_data["profile_image"]
-                if user_data.get("password"):
-                    user.password = user_data["password"]
-
-                user.save()
-                updated_count += 1
-                print(f"     ✅ Updated User: {email}")
-            else:
-                print(f"     ⚠️ User not found: {email}")
+            stats = {"nodes": 0, "relationships": 0}
+            rows = iter_node_with_relationship_restore_rows(
+                label, nodes_with_rels, stats
+            )
+
+            restore_grouped_rows(
+                rows, build_node_with_relationship_restore_query, batch_size
+            )
 
-        except Exception as e:
             print(
-                f"     ❌ Error updating user {user_data.get('email', 'unknown')}: {e}"
+                f"     📎 Restored {stats['relationships']} relationships for {label} nodes"
             )
+            print(f"     ✅ Restored {stats['nodes']} {label} with relationships")
+            total_restored += stats["nodes"]
+
+        except Exception as e:
+            print(f"     ⚠️ Error restoring {label} with relationships: {e}")
             continue
 
+    return total_restored
+
+
+def run_enrichment_batches(
+    stage: str, query: str, rows: list[dict], batch_size=None
+) -> int:
+    """
+    Jalankan query enrichment UNWIND $rows per batch dengan timing per batch.
+    Query harus RETURN satu count, return total count semua batch.
+    """
+    batch_size = batch_size or settings.NEO4J_IMPORT_BATCH_SIZE
+    total_count = 0
+
+    for start in range(0, len(rows), batch_size):
+        batch = rows[start : start + batch_size]
+        started_at = time.perf_counter()
+        result, _ = db.cypher_query(query, {"rows": batch})
+        batch_count = result[0][0] if result else 0
+        total_count += batch_count
+        elapsed = time.perf_counter() - started_at
+        print(
+            f"     ⏱️ {stage} batch {start // batch_size + 1}: "
+            f"{batch_count}/{len(batch)} rows in {elapsed:.3f}s"
+        )
+
+    return total_count
+
+
+def build_user_enrichment_rows(users_data: list) -> list[dict]:
+    """Map data user ke row {email, props}, hanya property yang terisi"""
+    rows = []
+    for user_data in users_data:
+        email = user_data.get("email")
+        if not email:
+            continue
+
+        user_props = {
+            "name": user_data.get("name"),
+            "profilePicture": user_data.get("profile_image"),
+            "password": user_data.get("password"),
+        }
+        user_props = {k: v for k, v in user_props.items() if v}
+        if user_props:
+            rows.append({"email": email, "props": user_props})
+
+    return rows
+
+
+def enrich_user_nodes(users_data: list, batch_size=None) -> int:
+    """Enrich User nodes with additional properties, batch UNWIND"""
+    if not users_data:
+        return 0
+
+    print("👤 Enriching User nodes with additional properties...")
+    print(f"   Found {len(users_data)} users in data")
+
+    rows = build_user_enrichment_rows(users_data)
+    updated_count = run_enrichment_batches(
+        "User",
+        """
+        UNWIND $rows AS row
+        MATCH (u:User {email: row.email})
+        SET u += row.props
+        RETURN count(u) AS updated
+        """,
+        rows,
+        batch_size,
+    )
+
+    if updated_count < len(rows):
+        print(f"   ⚠️ {len(rows) - updated_count} users not found")
     print(f"   ✅ Successfully enriched {updated_count} User nodes")
     return updated_count
 
 
-def enrich_job_nodes(jobs_data: list) -> int:
-    """Enrich Job nodes with additional properties using hybrid approach"""
+def build_job_properties(job_data: dict) -> dict[str, any]:
+    """Map job data hasil scraping ke property node Job (tanpa nilai None)"""
+    job_url = job_data.get("job_url")
+    job_props = {
+        "jobKey": build_job_key(job_url) if job_url else None,
+        "imageUrl": job_data.get("image_url"),
+        "jobTitle": job_data.get("job_title"),
+        "companyName": job_data.get("company_name"),
+        "subdistrict": job_data.get("subdistrict"),
+        "city": job_data.get("city"),
+        "province": job_data.get("province"),
+        "minimumSalary": job_data.get("minimum_salary"),
+        "maximumSalary": job_data.get("maximum_salary"),
+        "employmentType": job_data.get("employment_type"),
+        "workSetup": job_data.get("work_setup"),
+        "minimumEducation": job_data.get("minimum_education"),
+        "minimumExperience": job_data.get("minimum_experience"),
+        "maximumExperience": job_data.get("maximum_experience"),
+        "jobDescription": job_data.get("job_description"),
+        "scrapedAt": job_data.get("scraped_at"),
+    }
+
+    # Remove None values
+    return {k: v for k, v in job_props.items() if v is not None}
+
+
+def enrich_job_nodes(jobs_data: list, batch_size=None) -> int:
+    """Enrich Job nodes with additional properties, batch UNWIND"""
     if not jobs_data:
         return 0
 
     print("💼 Enriching Job nodes with additional properties...")
     print(f"   Found {len(jobs_data)} jobs in data")
 
-    updated_count = 0
+    rows = []
     for job_data in jobs_data:
-        try:
-            job_url = job_data.get("job_url")
-            if not job_url:
-                continue
-
-            # Use cypher for job enrichment since Job model might be complex
-            additional_props = {
-                "imageUrl": job_data.get("image_url"),
-                "jobTitle": job_data.get("job_title"),
-                "companyName": job_data.get("company_name"),
-                "subdistrict": job_data.get("subdistrict"),
-                "city": job_data.get("city"),
-                "province": job_data.get("province"),
-                "minimumSalary": job_data.get("minimum_salary"),
-                "maximumSalary": job_data.get("maximum_salary"),
-                "employmentType": job_data.get("employment_type"),
-                "workSetup": job_data.get("work_setup"),
-                "minimumEducation": job_data.get("minimum_education"),
-                "minimumExperience": job_data.get("minimum_experience"),
-                "maximumExperience": job_data.get("maximum_experience"),
-                "jobDescription": job_data.get("job_description"),
-                "scrapedAt": job_data.get("scraped_at"),
-            }
-
-            # Remove None values
-            additional_props = {
-                k: v for k, v in additional_props.items() if v is not None
-            }
-
-            if additional_props:
-                query = """
-                MATCH (j:Job {jobUrl: $job_url})
-                SET j += $additional_props
-                RETURN count(j) AS updated
-                """
-
-                result, _ = db.cypher_query(
-                    query, {"job_url": job_url, "additional_props": additional_props}
-                )
-                updated = result[0][0] if result else 0
+        job_url = job_data.get("job_url")
+        additional_props = build_job_properties(job_data)
+        if job_url and additional_props:
+            rows.append({"job_url": job_url, "props": additional_props})
 
-                if updated > 0:
-                    updated_count += 1
-                    if updated_count % 100 == 0:
-                        print(f"     ✅ Updated {updated_count} jobs...")
-
-        except Exception as e:
-            print(
-                f"     ❌ Error updating job {job_data.get('job_url', 'unknown')}: {e}"
-            )
-            continue
+    updated_count = run_enrichment_batches(
+        "Job",
+        """
+        UNWIND $rows AS row
+        MATCH (j:Job {jobUrl: row.job_url})
+        SET j += row.props
+        RETURN count(j) AS updated
+        """,
+        rows,
+        batch_size,
+    )
 
     print(f"   ✅ Successfully enriched {updated_count} Job nodes")
     return updated_count
 
 
+def enrich_job_additional_skills(missing_skills_map: dict, batch_size=None) -> int:
+    """Hubungkan job dengan skill yang tidak ada di ontology sebagai AdditionalSkill"""
+    if not missing_skills_map:
+        return 0
+
+    print("🧩 Adding additional skills to Job nodes...")
+
+    rows = [
+        {"job_url": job_url, "skill_name": skill_name.strip()}
+        for job_url, missing_skills in missing_skills_map.items()
+        for skill_name in missing_skills
+        if skill_name and skill_name.strip()
+    ]
+    added_count = run_enrichment_batches(
+        "AdditionalSkill",
+        """
+        UNWIND $rows AS row
+        MATCH (j:Job {jobUrl: row.job_url})
+        MERGE (s:AdditionalSkill {name: row.skill_name})
+        MERGE (j)-[:REQUIRED_SKILL]->(s)
+        RETURN count(s) AS added
+        """,
+        rows,
+        batch_size,
+    )
+
+    print(f"   ✅ Added {added_count} additional skills to jobs")
+    return added_count
+
+
 def enrich_nodes_with_data(
     users_data: list[dict] | None = None,
     jobs_data: list[dict] | None = None,
+    batch_size=None,
 ) -> dict:
     """Enrich nodes with additional properties from data variables"""
     print("🔄 Starting node enrichment process...")
 
-    enrichment_stats = {"users_updated": 0, "jobs_updated": 0}
+    enrichment_stats = {
+        "users_updated": 0,
+        "jobs_updated": 0,
+    }
 
     # Enrich User nodes
     if users_data:
         try:
-            users_updated = enrich_user_nodes(users_data)
+            users_updated = enrich_user_nodes(users_data, batch_size)
             enrichment_stats["users_updated"] = users_updated
         except Exception as e:
             print(f"   ❌ Failed to enrich User nodes: {e}")
@@ -763,7 +1030,7 @@ def enrich_nodes_with_data(
     # Enrich Job nodes
     if jobs_data:
         try:
-            jobs_updated = enrich_job_nodes(jobs_data)
+            jobs_updated = enrich_job_nodes(jobs_data, batch_size)
             enrichment_stats["jobs_updated"] = jobs_updated
         except Exception as e:
             print(f"   ❌ Failed to enrich Job nodes: {e}")
@@ -779,11 +1046,23 @@ def perform_full_dynamic_restore_with_enrichment(
     users_data: list[dict] | None = None,
     jobs_data: list[dict] | None = None,
 ) -> bool:
-    """Perform full restore from backup data with node enrichment"""
+    """
+    Perform full restore from backup data with node enrichment.
+    Data live tidak pernah ditimpa, backup hanya mengisi yang hilang.
+    """
     if not backup_data or "metadata" not in backup_data:
         print("   ⚠️ No valid backup data to restore")
         return False
 
+    # Backup di disk diverifikasi dulu sebelum apapun ditulis ke database
+    if "sections" in backup_data:
+        checksum_errors = verify_backup(backup_data)
+        if checksum_errors:
+            for error in checksum_errors:
+                print(f"   ❌ {error}")
+            print(f"   ❌ Backup {backup_data['backup_dir']} is corrupted, not restored")
+            return False
+
     print(f"   🔄 Restoring data from {backup_data['metadata']['backup_timestamp']}")
 
     try:
@@ -822,6 +1101,10 @@ def perform_full_dynamic_restore_with_enrichment(
 
             db.commit()
             print("   ✅ Restore transaction committed successfully")
+
+            if "sections" in backup_data:
+                save_backup_status(backup_data, "restored")
+                prune_backups()
             return True
 
         except Exception as e:
@@ -832,3 +1115,30 @@ def perform_full_dynamic_restore_with_enrichment(
     except Exception as e:
         print(f"   ❌ Error during restore with enrichment: {e}")
         return False
+
+
+def recover_pending_backups() -> bool:
+    """
+    Restore backup yang tertinggal karena proses mati antara delete dan restore.
+    Hanya backup terbaru yang di-restore, backup pending lain ditandai superseded.
+    Node/relationship yang masih ada tidak ditimpa, hanya yang hilang dibuat ulang.
+    Return True jika ada backup yang di-restore.
+    """
+    pending_backups = find_pending_backups()
+    if not pending_backups:
+        return False
+
+    latest_backup = pending_backups[-1]
+    print(
+        f"   ♻️ Found unrestored backup {latest_backup['backup_dir']}, recovering..."
+    )
+
+    if not perform_full_dynamic_restore_with_enrichment(latest_backup):
+        raise RuntimeError(
+            f"Failed to recover pending backup {latest_backup['backup_dir']}"
+        )
+
+    for backup_data in pending_backups[:-1]:
+        save_backup_status(backup_data, "superseded")
+
+    return True
@@ -1,8 +1,10 @@
+from django.conf import settings
 from neo4j import GraphDatabase, Transaction
 from neomodel import db
+from rdflib import BNode, Graph
 
-from api.models import Job, Skill, User, UserJobMatch
-from api.services.matchers.helper import update_task_progress
+from api.models import Job, User
+from api.services.matchers.helper import build_job_key, update_task_progress
 
 
 def get_users_from_neo4j():
@@ -40,15 +42,61 @@ def get_users_from_neo4j():
     return users_list
 
 
+def get_user_skill_snapshot(users_data) -> dict[str, frozenset]:
+    """{email: set nama skill lowercase} dari users_data saat matching dimulai"""
+    return {
+        user["email"]: frozenset(skill.lower() for skill in user.get("skills", []))
+        for user in users_data
+    }
+
+
+def get_users_changed_since(user_skill_snapshot) -> list[str]:
+    """
+    Email user yang skill-nya berubah atau user baru sejak snapshot diambil,
+    yaitu user yang match-nya ditulis register/update profile selama matching.
+    """
+    result, _ = db.cypher_query(
+        """
+        MATCH (u:User {role: "user"})
+        OPTIONAL MATCH (u)-[:HAS_SKILL]->(s:Skill)
+        RETURN u.email AS email, collect(toLower(s.name)) AS skills
+        """
+    )
+    return sorted(
+        row[0]
+        for row in result
+        if row[0] and user_skill_snapshot.get(row[0]) != frozenset(row[1])
+    )
+
+
+def get_user_skill_names(user_emails) -> dict[str, list[str]]:
+    """{email: nama skill} untuk user tertentu, dibaca langsung dari Neo4j"""
+    result, _ = db.cypher_query(
+        """
+        UNWIND $emails AS email
+        MATCH (u:User {email: email})
+        OPTIONAL MATCH (u)-[:HAS_SKILL]->(s:Skill)
+        RETURN u.email AS email, collect(s.name) AS skills
+        """,
+        {"emails": list(user_emails)},
+    )
+    return {row[0]: row[1] for row in result}
+
+
 def get_jobs_from_neo4j():
     """Get jobs data from Neo4j database"""
     jobs = Job.all_with_skills()
     jobs_list = []
+    stale_job_keys = []
     for item in jobs:
         job = item["job"]
         skills = [skill.name for skill in item["skills"]]
+        job_key = build_job_key(job.jobUrl)
+        if job.jobKey != job_key:
+            stale_job_keys.append(job.jobUrl)
         job_data = {
             "job_url": job.jobUrl,
+            "job_key": job_key,
             "job_title": job.jobTitle,
             "company_name": job.companyName,
             "subdistrict": job.subdistrict,
@@ -66,9 +114,112 @@ def get_jobs_from_neo4j():
             "required_skills": skills,
         }
         jobs_list.append(job_data)
+
+    # Job dari import sebelum ada jobKey atau dengan jobKey format lama
+    if stale_job_keys:
+        backfill_job_keys(stale_job_keys)
+
     return jobs_list
 
 
+def backfill_job_keys(job_urls, batch_size=1000) -> int:
+    """Set jobKey yang kosong atau masih format lama, return jumlah baris yang dikirim"""
+    return run_unwind_in_batches(
+        """
+        UNWIND $rows AS row
+        MATCH (j:Job {jobUrl: row.jobUrl})
+        WHERE j.jobKey IS NULL OR j.jobKey <> row.jobKey
+        SET j.jobKey = row.jobKey
+        """,
+        [{"jobUrl": job_url, "jobKey": build_job_key(job_url)} for job_url in job_urls],
+        batch_size,
+    )
+
+
+def connect_user_skills(user_email, skill_names) -> tuple[int, list[str]]:
+    """
+    Hubungkan user dengan skill (nama case-insensitive) dalam satu query.
+    Return (jumlah skill terhubung, nama skill yang tidak ditemukan).
+    """
+    skill_names = [
+        skill_name.strip()
+        for skill_name in skill_names or []
+        if skill_name and skill_name.strip()
+    ]
+    if not skill_names:
+        return 0, []
+
+    result, _ = db.cypher_query(
+        """
+        MATCH (u:User {email: $email})
+        UNWIND $skill_names AS skill_name
+        MATCH (s:Skill)
+        WHERE toLower(s.name) = toLower(skill_name)
+        WITH u, skill_name, head(collect(s)) AS s
+        MERGE (u)-[:HAS_SKILL]->(s)
+        RETURN collect(skill_name) AS connected
+        """,
+        {"email": user_email, "skill_names": skill_names},
+    )
+    connected = set(result[0][0]) if result else set()
+
+    missing_skills = [name for name in skill_names if name not in connected]
+    return len(skill_names) - len(missing_skills), missing_skills
+
+
+def delete_user_job_matches(user_email) -> int:
+    """Hapus semua UserJobMatch milik satu user, dimulai dari index User.email"""
+    result, _ = db.cypher_query(
+        """
+        MATCH (:User {email: $email})<-[:USER_MATCH]-(m:UserJobMatch)
+        DETACH DELETE m
+        RETURN count(m) AS deleted
+        """,
+        {"email": user_email},
+    )
+    return result[0][0] if result else 0
+
+
+def create_user_job_matches(user_email, categorized_matches) -> int:
+    """Buat UserJobMatch untuk satu user dalam satu UNWIND, job dicari dari jobKey"""
+    match_rows = []
+    for match in categorized_matches:
+        if not match.get("job_url"):
+            print(f"[USER_MATCH_WARNING] No job_url found in match: {match}")
+            continue
+
+        match_rows.append(
+            {
+                "jobKey": match.get("job_key") or build_job_key(match["job_url"]),
+                "similarity": match["similarity"],
+                "category": match["category"],
+            }
+        )
+
+    if not match_rows:
+        return 0
+
+    result, _ = db.cypher_query(
+        """
+        MATCH (u:User {email: $email})
+        UNWIND $rows AS row
+        MATCH (j:Job {jobKey: row.jobKey})
+        CREATE (m:UserJobMatch {similarityScore: row.similarity, matchType: row.category})
+        CREATE (m)-[:USER_MATCH]->(u)
+        CREATE (m)-[:JOB_MATCH]->(j)
+        RETURN count(m) AS created
+        """,
+        {"email": user_email, "rows": match_rows},
+    )
+    created = result[0][0] if result else 0
+
+    if created < len(match_rows):
+        print(
+            f"[USER_MATCH_WARNING] {len(match_rows) - created} matched jobs not found for {user_email}"
+        )
+    return created
+
+
 def update_neo4j_for_specific_user(user_email, user_skills, categorized_matches):
     """Update Neo4j hanya untuk specific user tanpa mengganggu user lain"""
     db.begin()
@@ -80,101 +231,23 @@ def update_neo4j_for_specific_user(user_email, user_skills, categorized_matches)
             db.rollback()
             return
 
-        deleted_matches = 0
-        user_job_matches = UserJobMatch.nodes.all()
-        for match in user_job_matches:
-            # Check if this match is connected to our user
-            connected_users = match.user_match.all()
-            for connected_user in connected_users:
-                if connected_user.email == user_email:
-                    # Disconnect relationships first
-                    match.user_match.disconnect_all()
-                    match.job_match.disconnect_all()
-                    # Delete the match node
-                    match.delete()
-                    deleted_matches += 1
-                    break
+        # 2. Remove existing matches of this user only
+        deleted_matches = delete_user_job_matches(user_email)
+        print(f"[UPDATE_USER_INFO] Deleted {deleted_matches} matches for {user_email}")
 
         # 3. Remove existing skills relationships
         user.has_skill.disconnect_all()
         print(f"[UPDATE_USER_INFO] Disconnected all existing skills for {user_email}")
 
-        # 4. Add new skills using ORM
-        skills_added = 0
-        for skill_name in user_skills:
-            if not skill_name or not skill_name.strip():  # Skip empty skills
-                continue
-
-            try:
-                # Find skill using case-insensitive search
-                skill = Skill.nodes.filter(name__iexact=skill_name.strip()).first()
-                if skill:
-                    user.has_skill.connect(skill)
-                    skills_added += 1
-                else:
-                    print(
-                        f"[UPDATE_USER_WARNING] Skill '{skill_name}' not found in database"
-                    )
-            except Exception as e:
-                print(
-                    f"[UPDATE_USER_ERROR] Error connecting skill '{skill_name}': {str(e)}"
-                )
+        # 4. Add new skills
+        skills_added, missing_skills = connect_user_skills(user_email, user_skills)
+        for skill_name in missing_skills:
+            print(f"[UPDATE_USER_WARNING] Skill '{skill_name}' not found in database")
 
         print(f"[UPDATE_USER_INFO] Added {skills_added} skills for {user_email}")
 
         # 5. Add new categorized matches
-        matches_added = 0
-        for match in categorized_matches:
-            try:
-                # Extract job URL from match graph
-                job_uri = match.get("job_uri", "")
-                similarity = match["similarity"]
-                category = match["category"]
-
-                if not job_uri:
-                    print(f"[UPDATE_USER_WARNING] No job_uri found in match: {match}")
-                    continue
-
-                job_identifier = job_uri.split("/")[-1] if job_uri else ""
-                if "_" in job_identifier:
-                    job_identifier = job_identifier.split("_")[1]
-
-                if not job_identifier:
-                    print(
-                        f"[UPDATE_USER_WARNING] Could not extract job identifier from {job_uri}"
-                    )
-                    continue
-
-                # Find job using ORM with URL containing identifier
-                job = None
-                try:
-                    # Try exact match first
-                    jobs = Job.nodes.filter(jobUrl__contains=job_identifier)
-                    job = jobs.first()
-                except Exception as e:
-                    print(
-                        f"[UPDATE_USER_ERROR] Error finding job with identifier '{job_identifier}': {str(e)}"
-                    )
-
-                if not job:
-                    print(
-                        f"[UPDATE_USER_WARNING] Job not found for identifier '{job_identifier}'"
-                    )
-                    continue
-
-                # Create UserJobMatch using ORM
-                user_job_match = UserJobMatch(
-                    similarityScore=similarity, matchType=category
-                )
-                user_job_match.save()
-
-                # Connect to user and job using ORM relationships
-                user_job_match.user_match.connect(user)
-                user_job_match.job_match.connect(job)
-                matches_added += 1
-            except Exception as e:
-                print(f"[UPDATE_USER_ERROR] Error processing match {match}: {str(e)}")
-                continue
+        matches_added = create_user_job_matches(user_email, categorized_matches)
 
         print(f"[UPDATE_USER_INFO] Added {matches_added} matches for {user_email}")
 
@@ -189,6 +262,23 @@ def update_neo4j_for_specific_user(user_email, user_skills, categorized_matches)
         raise
 
 
+def replace_user_job_matches(user_email, categorized_matches) -> int:
+    """Ganti semua UserJobMatch satu user dalam satu transaction, skill tidak disentuh"""
+    db.begin()
+    try:
+        delete_user_job_matches(user_email)
+        created = create_user_job_matches(user_email, categorized_matches)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        print(
+            f"[USER_MATCH_ERROR] Failed to replace matches for {user_email}: {str(e)}"
+        )
+        raise
+
+    return created
+
+
 def create_calculated_user(new_user_data, categorized_matches):
     """Update Neo4j hanya untuk specific user tanpa mengganggu user lain"""
     db.begin()
@@ -209,45 +299,12 @@ def create_calculated_user(new_user_data, categorized_matches):
         print("User created:", user.uid)
 
         # 2. Add new skills
-        skills_added = 0
-        for skill_name in new_user_data["skills"]:
-            if not skill_name or not skill_name.strip():  # Skip empty skills
-                continue
-
-            skill = Skill.nodes.filter(name__iexact=skill_name).first()
-            if skill:
-                user.has_skill.connect(skill)
-                skills_added += 1
+        skills_added, _ = connect_user_skills(user.email, new_user_data["skills"])
 
         print(f"Skills added: {skills_added}")
 
         # 3. Add new categorized matches
-        matches_added = 0
-        for match in categorized_matches:
-            # Extract job URL from match graph
-            job_uri = match.get("job_uri", "")
-            similarity = match["similarity"]
-            category = match["category"]
-
-            job_identifier = job_uri.split("/")[-1] if job_uri else ""
-            job_identifier = job_identifier.split("_")[1]
-
-            if not job_identifier:
-                continue
-
-            # Find job by URL containing identifier
-            job = Job.nodes.filter(jobUrl__contains=job_identifier).first()
-            if job:
-                # Create UserJobMatch
-                user_job_match = UserJobMatch(
-                    similarityScore=similarity, matchType=category
-                )
-                user_job_match.save()
-
-                # Connect to user and job
-                user_job_match.user_match.connect(user)
-                user_job_match.job_match.connect(job)
-                matches_added += 1
+        create_user_job_matches(user.email, categorized_matches)
 
         db.commit()
     except Exception as e:
@@ -268,8 +325,15 @@ def create_calculated_user(new_user_data, categorized_matches):
     }
 
 
-def import_to_neo4j_from_graph(graph):
-    """Import RDF graph to Neo4j using neosemantics - NO TRANSACTION WRAPPER"""
+def import_to_neo4j_from_graph(
+    graph, chunk_size=None, task_id=None, update_state_func=None
+):
+    """
+    Import RDF graph to Neo4j using neosemantics - NO TRANSACTION WRAPPER.
+    Dengan chunk_size, graph dikirim sebagai beberapa batch N-Triples
+    (dikelompokkan per subject dan blank node-nya) supaya tidak ada satu string
+    Turtle besar.
+    """
     try:
         print("[IMPORT_INFO] Starting graph import to Neo4j")
 
@@ -288,12 +352,35 @@ def import_to_neo4j_from_graph(graph):
         db.cypher_query("CALL n10s.graphconfig.init($config)", {"config": config})
         print("[IMPORT_INFO] Configured neosemantics")
 
-        # Serialize graph and import
-        turtle_data = graph.serialize(format="turtle")
-        db.cypher_query(
-            "CALL n10s.rdf.import.inline($rdf_data, 'Turtle')",
-            {"rdf_data": turtle_data},
-        )
+        if not chunk_size:
+            # Serialize graph and import
+            turtle_data = graph.serialize(format="turtle")
+            db.cypher_query(
+                "CALL n10s.rdf.import.inline($rdf_data, 'Turtle')",
+                {"rdf_data": turtle_data},
+            )
+            print("[IMPORT_SUCCESS] Graph imported successfully")
+            return
+
+        progress_data = {"imported_triples": 0, "total_triples": len(graph)}
+        for rdf_data, triple_count in iter_ntriples_chunks(graph, chunk_size):
+            db.cypher_query(
+                "CALL n10s.rdf.import.inline($rdf_data, 'N-Triples')",
+                {"rdf_data": rdf_data},
+            )
+            progress_data["imported_triples"] += triple_count
+            print(
+                f"[IMPORT_INFO] Imported {progress_data['imported_triples']}/{progress_data['total_triples']} triples"
+            )
+
+            if update_state_func:
+                update_task_progress(
+                    task_id,
+                    "IMPORTING_DATA_WITH_NEOSEMANTICS",
+                    dict(progress_data),
+                    update_state_func,
+                )
+
         print("[IMPORT_SUCCESS] Graph imported successfully")
 
     except Exception as e:
@@ -301,6 +388,54 @@ def import_to_neo4j_from_graph(graph):
         raise
 
 
+def group_subjects_by_blank_nodes(graph) -> list[list]:
+    """
+    Kelompokkan subject yang terhubung lewat blank node (Restriction, rdf:List).
+    Blank node tidak punya identitas antar panggilan n10s, jadi triple-nya harus
+    dikirim di batch yang sama dengan subject yang mereferensikannya.
+    """
+    parents = {}
+
+    def find(node):
+        root = parents.setdefault(node, node)
+        while root != parents[root]:
+            root = parents[root]
+        parents[node] = root
+        return root
+
+    for subject, _, obj in graph:
+        if isinstance(obj, BNode):
+            subject_root, obj_root = find(subject), find(obj)
+            if subject_root != obj_root:
+                parents[obj_root] = subject_root
+
+    groups = {}
+    for subject in graph.subjects(unique=True):
+        groups.setdefault(find(subject), []).append(subject)
+
+    return list(groups.values())
+
+
+def iter_ntriples_chunks(graph, chunk_size):
+    """
+    Yield (ntriples_string, jumlah_triple) per batch. Semua triple milik satu
+    subject, beserta blank node yang direferensikannya, selalu berada di batch
+    yang sama.
+    """
+    chunk_graph = Graph()
+    for subjects in group_subjects_by_blank_nodes(graph):
+        for subject in subjects:
+            for triple in graph.triples((subject, None, None)):
+                chunk_graph.add(triple)
+
+        if len(chunk_graph) >= chunk_size:
+            yield chunk_graph.serialize(format="nt"), len(chunk_graph)
+            chunk_graph = Graph()
+
+    if len(chunk_graph):
+        yield chunk_graph.serialize(format="nt"), len(chunk_graph)
+
+
 def clean_up_neo4j():
     """Clean up Neo4j nodes and relationships - NO TRANSACTION WRAPPER"""
     try:
@@ -497,66 +632,24 @@ def convert_match_labels_to_property():
         raise
 
 
-def add_missing_skills_to_jobs(missing_skills_map):
-    """Add missing skills to jobs - NO TRANSACTION WRAPPER"""
-    try:
-        print("[ADD_MISSING_SKILLS_INFO] Starting to add missing skills to jobs")
-        added_skills_count = 0
-
-        for job_url, missing_skills in missing_skills_map.items():
-            try:
-                for skill_name in missing_skills:
-                    if not skill_name or not skill_name.strip():
-                        continue
-
-                    try:
-                        # Use raw cypher since AdditionalSkill relationship might not be defined in model
-                        db.cypher_query(
-                            """
-                            MATCH (j:Job {jobUrl: $job_url})
-                            MERGE (s:AdditionalSkill {name: $skill_name})
-                            MERGE (j)-[:REQUIRED_SKILL]->(s)
-                            """,
-                            {"job_url": job_url, "skill_name": skill_name.strip()},
-                        )
-                        added_skills_count += 1
-
-                        print(
-                            f"[ADD_MISSING_SKILLS_DEBUG] Added skill '{skill_name}' to job {job_url}"
-                        )
-
-                    except Exception as skill_error:
-                        print(
-                            f"[ADD_MISSING_SKILLS_ERROR] Failed to add skill '{skill_name}': {str(skill_error)}"
-                        )
-                        continue
-
-            except Exception as job_error:
-                print(
-                    f"[ADD_MISSING_SKILLS_ERROR] Error processing job {job_url}: {str(job_error)}"
-                )
-                continue
-
-        print(
-            f"[ADD_MISSING_SKILLS_SUCCESS] Added {added_skills_count} missing skills to jobs"
-        )
-
-    except Exception as e:
-        print(f"[ADD_MISSING_SKILLS_ERROR] Fatal error adding missing skills: {str(e)}")
-        raise
-
-
-def create_indexes():
-    """Create database indexes - NO TRANSACTION WRAPPER"""
+def create_indexes(wait=False):
+    """
+    Create database indexes - NO TRANSACTION WRAPPER.
+    wait=True menunggu semua index online, dipakai sebelum batch import yang
+    MATCH per row (index baru dibangun di background oleh Neo4j).
+    """
     try:
         print("[CREATE_INDEXES_INFO] Starting to create database indexes")
 
         indexes = [
             ("Job", "jobUrl"),
+            ("Job", "jobKey"),
             ("User", "email"),
             ("Skill", "name"),
             ("AdditionalSkill", "name"),
             ("UserJobMatch", "matchType"),
+            ("StagedJob", "jobUrl"),
+            ("StagedJob", "jobKey"),
         ]
 
         for node_type, property_name in indexes:
@@ -572,6 +665,15 @@ def create_indexes():
                     f"[CREATE_INDEXES_ERROR] Failed to create index for {node_type}.{property_name}: {str(e)}"
                 )
 
+        if wait:
+            try:
+                db.cypher_query(
+                    "CALL db.awaitIndexes($timeout)",
+                    {"timeout": settings.NEO4J_INDEX_AWAIT_TIMEOUT},
+                )
+            except Exception as e:
+                print(f"[CREATE_INDEXES_WARNING] Indexes not online yet: {str(e)}")
+
         print("[CREATE_INDEXES_SUCCESS] Database indexes creation completed")
 
     except Exception as e:
@@ -586,6 +688,7 @@ def import_and_clean_neo4j_with_enrichment(
     missing_skills_map=None,
     task_id=None,
     update_state_func=None,
+    chunk_size=None,
 ):
     """Import and clean Neo4j with enrichment using proper transaction management"""
     try:
@@ -593,9 +696,16 @@ def import_and_clean_neo4j_with_enrichment(
 
         # Step 1: Backup existing data (no transaction needed)
         from api.services.matchers.matchers_neo4j_backup_restore_services import (
+            enrich_job_additional_skills,
             perform_full_dynamic_backup,
+            recover_pending_backups,
+            save_backup_status,
         )
 
+        # Backup dari import sebelumnya yang mati sebelum restore dipulihkan dulu
+        if recover_pending_backups():
+            print("[MAIN_IMPORT_INFO] Recovered data from unrestored backup")
+
         backup_config = {
             "node_labels": [
                 "User",
@@ -631,7 +741,12 @@ def import_and_clean_neo4j_with_enrichment(
                 )
 
             # Import RDF graph (no internal transaction)
-            import_to_neo4j_from_graph(graph)
+            import_to_neo4j_from_graph(
+                graph,
+                chunk_size=chunk_size,
+                task_id=task_id,
+                update_state_func=update_state_func,
+            )
             print("[MAIN_IMPORT_INFO] RDF graph imported")
 
             if update_state_func:
@@ -656,6 +771,8 @@ def import_and_clean_neo4j_with_enrichment(
         except Exception as e:
             db.rollback()
             print(f"[MAIN_IMPORT_ERROR] Main transaction rolled back: {str(e)}")
+            # Data lama tidak terhapus, backup ini tidak perlu di-restore
+            save_backup_status(backup_data, "superseded")
             raise
 
         # Step 4: Restore backup data with enrichment (has internal transaction)
@@ -678,12 +795,13 @@ def import_and_clean_neo4j_with_enrichment(
             print(f"[MAIN_IMPORT_ERROR] Error during backup restore: {str(e)}")
             # Don't re-raise, continue with missing skills
 
-        # Step 5: Add missing skills (separate transaction)
+        # Step 5: Add missing skills (separate transaction, tidak ikut gagal
+        # jika restore di-rollback)
         if missing_skills_map:
             db.begin()
             try:
                 print("[MAIN_IMPORT_INFO] Adding missing skills to jobs")
-                add_missing_skills_to_jobs(missing_skills_map)
+                enrich_job_additional_skills(missing_skills_map)
                 db.commit()
                 print("[MAIN_IMPORT_SUCCESS] Missing skills added")
             except Exception as e:
@@ -707,3 +825,530 @@ def import_and_clean_neo4j_with_enrichment(
     except Exception as e:
         print(f"[MAIN_IMPORT_ERROR] Fatal error in import process: {str(e)}")
         raise
+
+
+def run_unwind_in_batches(query, rows, batch_size=1000, params=None) -> int:
+    """Jalankan query UNWIND $rows per batch, return jumlah baris yang dikirim"""
+    sent = 0
+    for start in range(0, len(rows), batch_size):
+        batch = rows[start : start + batch_size]
+        db.cypher_query(query, {**(params or {}), "rows": batch})
+        sent += len(batch)
+
+    return sent
+
+
+def import_jobs_and_matches_to_neo4j(
+    jobs_data,
+    job_skill_rows,
+    additional_skill_rows,
+    match_rows,
+    skill_names,
+    batch_size=1000,
+    user_skill_snapshot=None,
+) -> list[str]:
+    """
+    Native import hasil matching: semua job ditulis ulang langsung dengan label
+    dan property final, job yang tidak ada lagi dihapus. User dan task tidak
+    disentuh sehingga tidak perlu backup/restore. Return email user yang
+    berubah sejak user_skill_snapshot (match-nya tidak ditimpa).
+    """
+    print("[NATIVE_IMPORT_INFO] Starting native import to Neo4j")
+
+    result, _ = db.cypher_query("MATCH (j:Job) RETURN j.jobUrl")
+    incoming_job_urls = [job["job_url"] for job in jobs_data]
+    incoming_job_url_set = set(incoming_job_urls)
+    removed_job_urls = [
+        row[0] for row in result if row[0] and row[0] not in incoming_job_url_set
+    ]
+
+    changed_user_emails = apply_incremental_matching_to_neo4j(
+        jobs_data,
+        incoming_job_urls,
+        removed_job_urls,
+        job_skill_rows,
+        additional_skill_rows,
+        match_rows,
+        skill_names,
+        batch_size,
+        user_skill_snapshot=user_skill_snapshot,
+    )
+
+    # AdditionalSkill yang tidak dipakai job manapun lagi
+    db.cypher_query(
+        """
+        MATCH (s:AdditionalSkill)
+        WHERE NOT (s)<-[:REQUIRED_SKILL]-()
+        DELETE s
+        """
+    )
+
+    print(
+        f"[NATIVE_IMPORT_SUCCESS] Imported {len(incoming_job_urls)} jobs and {len(match_rows)} matches"
+    )
+    return changed_user_emails
+
+
+def get_job_skill_signatures_from_neo4j() -> dict[str, frozenset]:
+    """Get jobUrl beserta set nama skill (Skill + AdditionalSkill) yang tersimpan"""
+    result, _ = db.cypher_query(
+        """
+        MATCH (j:Job)
+        OPTIONAL MATCH (j)-[:REQUIRED_SKILL]->(s)
+        RETURN j.jobUrl AS job_url, collect(toLower(s.name)) AS skills
+        """
+    )
+    return {row[0]: frozenset(row[1]) for row in result if row[0]}
+
+
+def apply_incremental_matching_to_neo4j(
+    jobs_data,
+    rescored_job_urls,
+    removed_job_urls,
+    job_skill_rows,
+    additional_skill_rows,
+    match_rows,
+    skill_names,
+    batch_size=1000,
+    top_k=0,
+    user_skill_snapshot=None,
+) -> list[str]:
+    """
+    Terapkan delta hasil scraping ke Neo4j dalam satu transaction:
+    hapus job yang hilang, upsert semua job, ganti skill dan match hanya untuk
+    job yang baru/berubah. Match untuk job lain tidak disentuh.
+
+    Match user yang skill-nya berubah sejak user_skill_snapshot (register/update
+    profile selama matching) tidak ditimpa dengan hasil score dari skill lama;
+    email user tersebut di-return agar di-match ulang.
+    """
+    from api.services.matchers.matchers_neo4j_backup_restore_services import (
+        build_job_properties,
+    )
+
+    # Index jobKey/email harus online sebelum batch MATCH per row pertama
+    create_indexes(wait=True)
+
+    db.begin()
+    try:
+        changed_user_emails = (
+            get_users_changed_since(user_skill_snapshot)
+            if user_skill_snapshot is not None
+            else []
+        )
+        if changed_user_emails:
+            print(
+                f"[INCREMENTAL_INFO] {len(changed_user_emails)} users changed during matching, keeping their matches"
+            )
+            changed_user_email_set = set(changed_user_emails)
+            match_rows = [
+                row for row in match_rows if row["email"] not in changed_user_email_set
+            ]
+
+        # Skill ontology harus ada sebelum relasi dibuat
+        run_unwind_in_batches(
+            "UNWIND $rows AS name MERGE (:Skill {name: name})",
+            skill_names,
+            batch_size,
+        )
+
+        # 1. Hapus job yang sudah tidak ada beserta match-nya
+        run_unwind_in_batches(
+            """
+            UNWIND $rows AS job_url
+            MATCH (m:UserJobMatch)-[:JOB_MATCH]->(:Job {jobUrl: job_url})
+            DETACH DELETE m
+            """,
+            removed_job_urls,
+            batch_size,
+        )
+        run_unwind_in_batches(
+            """
+            UNWIND $rows AS job_url
+            MATCH (j:Job {jobUrl: job_url})
+            DETACH DELETE j
+            """,
+            removed_job_urls,
+            batch_size,
+        )
+        print(f"[INCREMENTAL_INFO] Removed {len(removed_job_urls)} jobs")
+
+        # 2. Match dan skill lama untuk job yang di-score ulang
+        run_unwind_in_batches(
+            """
+            UNWIND $rows AS job_url
+            MATCH (m:UserJobMatch)-[:JOB_MATCH]->(:Job {jobUrl: job_url})
+            OPTIONAL MATCH (m)-[:USER_MATCH]->(u:User)
+            WITH m, u
+            WHERE u IS NULL OR NOT u.email IN $changed_user_emails
+            DETACH DELETE m
+            """,
+            rescored_job_urls,
+            batch_size,
+            {"changed_user_emails": changed_user_emails},
+        )
+        run_unwind_in_batches(
+            """
+            UNWIND $rows AS job_url
+            MATCH (:Job {jobUrl: job_url})-[r:REQUIRED_SKILL]->()
+            DELETE r
+            """,
+            rescored_job_urls,
+            batch_size,
+        )
+
+        # 3. Upsert property semua job
+        job_rows = [
+            {"jobUrl": job["job_url"], "props": build_job_properties(job)}
+            for job in jobs_data
+            if job.get("job_url")
+        ]
+        run_unwind_in_batches(
+            """
+            UNWIND $rows AS row
+            MERGE (j:Job {jobUrl: row.jobUrl})
+            SET j += row.props
+            """,
+            job_rows,
+            batch_size,
+        )
+        print(f"[INCREMENTAL_INFO] Upserted {len(job_rows)} jobs")
+
+        # 4. Skill untuk job yang baru/berubah
+        run_unwind_in_batches(
+            """
+            UNWIND $rows AS row
+            MATCH (j:Job {jobUrl: row.jobUrl})
+            MATCH (s:Skill {name: row.skill})
+            MERGE (j)-[:REQUIRED_SKILL]->(s)
+            """,
+            job_skill_rows,
+            batch_size,
+        )
+        run_unwind_in_batches(
+            """
+            UNWIND $rows AS row
+            MATCH (j:Job {jobUrl: row.jobUrl})
+            MERGE (s:AdditionalSkill {name: row.skill})
+            MERGE (j)-[:REQUIRED_SKILL]->(s)
+            """,
+            additional_skill_rows,
+            batch_size,
+        )
+
+        # 5. Match baru
+        run_unwind_in_batches(
+            """
+            UNWIND $rows AS row
+            MATCH (u:User {email: row.email})
+            MATCH (j:Job {jobKey: row.jobKey})
+            CREATE (m:UserJobMatch {similarityScore: row.similarity, matchType: row.category})
+            CREATE (m)-[:USER_MATCH]->(u)
+            CREATE (m)-[:JOB_MATCH]->(j)
+            """,
+            match_rows,
+            batch_size,
+        )
+        print(f"[INCREMENTAL_INFO] Created {len(match_rows)} matches")
+
+        # 6. Match lama bisa tergeser dari top-K oleh match baru
+        if top_k > 0:
+            run_unwind_in_batches(
+                """
+                UNWIND $rows AS email
+                MATCH (u:User {email: email})<-[:USER_MATCH]-(m:UserJobMatch)
+                WITH u, m ORDER BY m.similarityScore DESC
+                WITH u, collect(m)[$top_k..] AS pruned_matches
+                UNWIND pruned_matches AS m
+                DETACH DELETE m
+                """,
+                sorted({row["email"] for row in match_rows}),
+                batch_size,
+                {"top_k": top_k},
+            )
+
+        db.commit()
+        print("[INCREMENTAL_SUCCESS] Incremental changes committed")
+    except Exception as e:
+        db.rollback()
+        print(f"[INCREMENTAL_ERROR] Transaction rolled back: {str(e)}")
+        raise
+
+    return changed_user_emails
+
+
+def delete_in_batches(query, batch_size=1000) -> int:
+    """Jalankan query DELETE ... LIMIT $batch_size berulang sampai tidak ada yang terhapus"""
+    total_deleted = 0
+    while True:
+        result, _ = db.cypher_query(query, {"batch_size": batch_size})
+        deleted = result[0][0] if result else 0
+        total_deleted += deleted
+        if deleted == 0:
+            return total_deleted
+
+
+def clear_staged_generation(batch_size=1000):
+    """Hapus sisa staging dari import sebelumnya yang gagal sebelum flip"""
+    delete_in_batches(
+        """
+        MATCH (m:StagedUserJobMatch)
+        WITH m LIMIT $batch_size
+        DETACH DELETE m
+        RETURN count(*)
+        """,
+        batch_size,
+    )
+    delete_in_batches(
+        """
+        MATCH (j:StagedJob)
+        WITH j LIMIT $batch_size
+        DETACH DELETE j
+        RETURN count(*)
+        """,
+        batch_size,
+    )
+    delete_in_batches(
+        """
+        MATCH ()-[r:STAGED_REQUIRED_SKILL]->()
+        WITH r LIMIT $batch_size
+        DELETE r
+        RETURN count(*)
+        """,
+        batch_size,
+    )
+
+
+def import_jobs_and_matches_staged(
+    jobs_data,
+    job_skill_rows,
+    additional_skill_rows,
+    match_rows,
+    skill_names,
+    batch_size=1000,
+    user_skill_snapshot=None,
+) -> list[str]:
+    """
+    Import hasil matching tanpa downtime. Data baru ditulis dengan label staging
+    (StagedJob, StagedUserJobMatch, STAGED_REQUIRED_SKILL) yang tidak dibaca API,
+    lalu di-flip menjadi data aktif dalam satu transaction. Data lama diberi label
+    RetiredJob/RetiredUserJobMatch dan dihapus oleh delete_retired_generation.
+    User, bookmark dan report tidak pernah dihapus/di-restore.
+
+    Match user yang skill-nya berubah sejak user_skill_snapshot (register/update
+    profile selama staging) tidak di-retire; email user tersebut di-return agar
+    di-match ulang terhadap generation baru.
+    """
+    from api.services.matchers.matchers_neo4j_backup_restore_services import (
+        build_job_properties,
+    )
+
+    print("[STAGED_IMPORT_INFO] Staging new generation")
+    create_indexes(wait=True)
+    clear_staged_generation(batch_size)
+
+    job_rows = [
+        {
+            "jobUrl": job["job_url"],
+            "props": {**build_job_properties(job), "jobUrl": job["job_url"]},
+        }
+        for job in jobs_data
+    ]
+
+    # 1. Staging, setiap batch auto-commit dan tidak terlihat oleh pembaca.
+    # Job aktif dari import lama diberi jobKey agar match bisa di-stage
+    backfill_job_keys([row["jobUrl"] for row in job_rows], batch_size)
+    run_unwind_in_batches(
+        "UNWIND $rows AS name MERGE (:Skill {name: name})",
+        skill_names,
+        batch_size,
+    )
+    run_unwind_in_batches(
+        """
+        UNWIND $rows AS row
+        OPTIONAL MATCH (j:Job {jobUrl: row.jobUrl})
+        WITH row, j WHERE j IS NULL
+        CREATE (s:StagedJob)
+        SET s = row.props
+        """,
+        job_rows,
+        batch_size,
+    )
+
+    staged_job_match = """
+        OPTIONAL MATCH (live:Job {jobUrl: row.jobUrl})
+        OPTIONAL MATCH (staged:StagedJob {jobUrl: row.jobUrl})
+        WITH row, coalesce(live, staged) AS j
+        WHERE j IS NOT NULL
+    """
+    run_unwind_in_batches(
+        f"""
+        UNWIND $rows AS row
+        {staged_job_match}
+        MATCH (s:Skill {{name: row.skill}})
+        MERGE (j)-[:STAGED_REQUIRED_SKILL]->(s)
+        """,
+        job_skill_rows,
+        batch_size,
+    )
+    run_unwind_in_batches(
+        f"""
+        UNWIND $rows AS row
+        {staged_job_match}
+        MERGE (s:AdditionalSkill {{name: row.skill}})
+        MERGE (j)-[:STAGED_REQUIRED_SKILL]->(s)
+        """,
+        additional_skill_rows,
+        batch_size,
+    )
+    run_unwind_in_batches(
+        """
+        UNWIND $rows AS row
+        MATCH (u:User {email: row.email})
+        OPTIONAL MATCH (live:Job {jobKey: row.jobKey})
+        OPTIONAL MATCH (staged:StagedJob {jobKey: row.jobKey})
+        WITH row, u, coalesce(live, staged) AS j
+        WHERE j IS NOT NULL
+        CREATE (m:StagedUserJobMatch {similarityScore: row.similarity, matchType: row.category})
+        CREATE (m)-[:USER_MATCH]->(u)
+        CREATE (m)-[:JOB_MATCH]->(j)
+        """,
+        match_rows,
+        batch_size,
+    )
+    print(
+        f"[STAGED_IMPORT_INFO] Staged {len(job_rows)} jobs and {len(match_rows)} matches"
+    )
+
+    # 2. Flip generation secara atomic
+    incoming_job_urls = [row["jobUrl"] for row in job_rows]
+    db.begin()
+    try:
+        changed_user_emails = (
+            get_users_changed_since(user_skill_snapshot)
+            if user_skill_snapshot is not None
+            else []
+        )
+        if changed_user_emails:
+            print(
+                f"[STAGED_IMPORT_INFO] {len(changed_user_emails)} users changed during staging, keeping their matches"
+            )
+        run_unwind_in_batches(
+            """
+            UNWIND $rows AS row
+            MATCH (j:Job {jobUrl: row.jobUrl})
+            SET j = row.props
+            """,
+            job_rows,
+            batch_size,
+        )
+        db.cypher_query(
+            """
+            MATCH (j:Job)
+            WHERE NOT j.jobUrl IN $job_urls
+            REMOVE j:Job
+            SET j:RetiredJob
+            """,
+            {"job_urls": incoming_job_urls},
+        )
+        run_unwind_in_batches(
+            """
+            UNWIND $rows AS job_url
+            MATCH (:Job {jobUrl: job_url})-[r:REQUIRED_SKILL]->()
+            DELETE r
+            """,
+            incoming_job_urls,
+            batch_size,
+        )
+        db.cypher_query(
+            """
+            MATCH (j)-[r:STAGED_REQUIRED_SKILL]->(s)
+            CREATE (j)-[:REQUIRED_SKILL]->(s)
+            DELETE r
+            """
+        )
+        # Match staged dari skill lama diganti re-match setelah flip
+        db.cypher_query(
+            """
+            MATCH (m:StagedUserJobMatch)-[:USER_MATCH]->(u:User)
+            WHERE u.email IN $changed_user_emails
+            DETACH DELETE m
+            """,
+            {"changed_user_emails": changed_user_emails},
+        )
+        db.cypher_query(
+            """
+            MATCH (m:UserJobMatch)
+            OPTIONAL MATCH (m)-[:USER_MATCH]->(u:User)
+            WITH m, u
+            WHERE u IS NULL
+                OR NOT u.email IN $changed_user_emails
+                OR (m)-[:JOB_MATCH]->(:RetiredJob)
+            REMOVE m:UserJobMatch
+            SET m:RetiredUserJobMatch
+            """,
+            {"changed_user_emails": changed_user_emails},
+        )
+        db.cypher_query(
+            """
+            MATCH (m:StagedUserJobMatch)
+            REMOVE m:StagedUserJobMatch
+            SET m:UserJobMatch
+            """
+        )
+        db.cypher_query(
+            """
+            MATCH (j:StagedJob)
+            REMOVE j:StagedJob
+            SET j:Job
+            """
+        )
+        db.commit()
+        print("[STAGED_IMPORT_SUCCESS] Active generation flipped")
+    except Exception as e:
+        db.rollback()
+        print(f"[STAGED_IMPORT_ERROR] Flip rolled back, live data unchanged: {str(e)}")
+        raise
+
+    return changed_user_emails
+
+
+def delete_retired_generation(batch_size=1000) -> dict[str, int]:
+    """Hapus data generation lama (RetiredJob, RetiredUserJobMatch) per batch"""
+    deleted_matches = delete_in_batches(
+        """
+        MATCH (m:RetiredUserJobMatch)
+        WITH m LIMIT $batch_size
+        DETACH DELETE m
+        RETURN count(*)
+        """,
+        batch_size,
+    )
+    deleted_jobs = delete_in_batches(
+        """
+        MATCH (j:RetiredJob)
+        WITH j LIMIT $batch_size
+        DETACH DELETE j
+        RETURN count(*)
+        """,
+        batch_size,
+    )
+    deleted_skills = delete_in_batches(
+        """
+        MATCH (s:AdditionalSkill)
+        WHERE NOT (s)<-[:REQUIRED_SKILL]-() AND NOT (s)<-[:STAGED_REQUIRED_SKILL]-()
+        WITH s LIMIT $batch_size
+        DELETE s
+        RETURN count(*)
+        """,
+        batch_size,
+    )
+
+    print(
+        f"[RETIRED_CLEANUP_SUCCESS] Deleted {deleted_matches} matches, {deleted_jobs} jobs, {deleted_skills} additional skills"
+    )
+    return {
+        "matches": deleted_matches,
+        "jobs": deleted_jobs,
+        "additional_skills": deleted_skills,
+    }
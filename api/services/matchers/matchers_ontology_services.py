@@ -1,101 +1,177 @@
+import hashlib
+import heapq
 import math
 import os
+import pickle
 import uuid
 
+import numpy as np
+from django.conf import settings
 from rdflib import RDF, Graph, Literal, URIRef
 from rdflib.namespace import XSD
 
 from api.constants import TALENT_NAMESPACE
+from api.services.matchers.helper import build_job_key
+from api.services.matchers.matchers_skill_similarity_services import (
+    get_skill_similarity_matrix,
+)
+from api.services.matchers.matchers_skill_lexicon_services import (
+    get_lexicon_skill_uri,
+    get_skill_lexicon,
+    resolve_skill_batches,
+    resolve_skill_ids,
+)
+from api.services.matchers.matchers_skill_taxonomy_services import (
+    get_skill_ids,
+    get_skill_taxonomy,
+)
+from api.services.matchers.matchers_vectorized_services import (
+    calculate_all_user_job_similarities_vectorized,
+)
+
+ONTOLOGY_PATH = os.path.join(os.path.dirname(__file__), "ontology.ttl")
+
+_ontology_hash_cache = {}
+_base_ontology_cache = {}
+_category_rules_cache = {}
+_category_bins_cache = {}
 
 
 def load_base_ontology():
-    """Load the base ontology structure"""
-    ontology_path = os.path.join(os.path.dirname(__file__), "ontology.ttl")
+    """
+    Load the base ontology structure.
+    Return Graph baru dari snapshot yang di-cache, jadi triple yang ditambahkan
+    caller tidak mengubah base ontology milik request/task lain.
+    """
+    triples, namespaces = get_base_ontology_snapshot()
+
     base_graph = Graph()
-    base_graph.parse(ontology_path, format="turtle")
+    for prefix, namespace in namespaces:
+        base_graph.bind(prefix, namespace)
+    base_graph.addN((s, p, o, base_graph) for s, p, o in triples)
     base_graph.bind("talent", TALENT_NAMESPACE)
 
     return base_graph
 
 
+def get_ontology_snapshot_path(ontology_hash: str) -> str:
+    """Path snapshot hasil parsing ontology.ttl untuk versi ontology tertentu"""
+    return os.path.join(
+        os.path.dirname(ONTOLOGY_PATH), f"ontology.{ontology_hash[:16]}.triples.pickle"
+    )
+
+
+def parse_ontology_snapshot() -> tuple[tuple, list]:
+    """Parse ontology.ttl menjadi (triples, namespaces)"""
+    graph = Graph()
+    graph.parse(ONTOLOGY_PATH, format="turtle")
+    return tuple(graph), list(graph.namespaces())
+
+
+def load_ontology_snapshot_from_disk(path: str, ontology_hash: str) -> tuple | None:
+    """Load snapshot dari disk, return None jika tidak ada atau versinya berbeda"""
+    if not os.path.exists(path):
+        return None
+
+    try:
+        with open(path, "rb") as snapshot_file:
+            snapshot = pickle.load(snapshot_file)
+    except Exception as e:
+        print(f"[ONTOLOGY_WARNING] Failed to load {path}: {str(e)}")
+        return None
+
+    if snapshot.get("ontology_hash") != ontology_hash:
+        print(f"[ONTOLOGY_WARNING] Ignoring {path}: snapshot is for another ontology")
+        return None
+
+    return snapshot["triples"], snapshot["namespaces"]
+
+
+def save_ontology_snapshot_to_disk(path: str, ontology_hash: str, snapshot) -> None:
+    """Simpan snapshot secara atomic supaya worker lain tidak membaca file setengah jadi"""
+    triples, namespaces = snapshot
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as snapshot_file:
+            pickle.dump(
+                {
+                    "ontology_hash": ontology_hash,
+                    "triples": triples,
+                    "namespaces": namespaces,
+                },
+                snapshot_file,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"[ONTOLOGY_WARNING] Could not persist {path}: {str(e)}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def get_base_ontology_snapshot() -> tuple[tuple, list]:
+    """
+    Get (triples, namespaces) base ontology, diparse sekali per proses per versi
+    ontology. Worker baru membaca snapshot di disk tanpa parsing Turtle.
+    """
+    ontology_hash = get_ontology_hash()
+    snapshot = _base_ontology_cache.get(ontology_hash)
+    if snapshot is not None:
+        return snapshot
+
+    path = get_ontology_snapshot_path(ontology_hash)
+    snapshot = load_ontology_snapshot_from_disk(path, ontology_hash)
+    if snapshot is None:
+        snapshot = parse_ontology_snapshot()
+        save_ontology_snapshot_to_disk(path, ontology_hash, snapshot)
+        print(f"[ONTOLOGY_INFO] Parsed {len(snapshot[0])} triples from {ONTOLOGY_PATH}")
+
+    _base_ontology_cache.clear()
+    _base_ontology_cache[ontology_hash] = snapshot
+
+    return snapshot
+
+
+def get_ontology_hash() -> str:
+    """Content hash dari ontology.ttl, dipakai sebagai versi untuk semua cache turunan"""
+    stat = os.stat(ONTOLOGY_PATH)
+    cache_key = (stat.st_mtime_ns, stat.st_size)
+    ontology_hash = _ontology_hash_cache.get(cache_key)
+    if ontology_hash is None:
+        with open(ONTOLOGY_PATH, "rb") as ontology_file:
+            ontology_hash = hashlib.sha256(ontology_file.read()).hexdigest()
+        _ontology_hash_cache.clear()
+        _ontology_hash_cache[cache_key] = ontology_hash
+
+    return ontology_hash
+
+
 def import_all_jobs_to_ontology(graph, jobs_data):
     """
     Import all jobs into the ontology graph and map missing skills.
     """
-    all_skills_query = """
-    SELECT ?skill
-    WHERE {
-        ?skill rdfs:subClassOf+ <http://www.semanticweb.org/kota203/ontologies/2025/3/talent-matching-ontology/Skills> .
-    }
-    """
-
-    # Load all skills from ontology
-    ontology_skills = {}
-    for row in graph.query(all_skills_query):
-        skill_uri = row[0]
-        skill_name = str(skill_uri).split("/")[-1].replace("_", " ")
-        ontology_skills[skill_name.lower()] = (skill_name, skill_uri)
-
-    special_cases = {
-        "c#": "cs",
-        "ci/cd": "ci_cd",
-        "pl/sql": "pl_sql",
-    }
+    lexicon = get_skill_lexicon()
+    jobs_data = [job for job in jobs_data if "job_url" in job]
 
     jobs_processed = 0
     jobs_with_skills = 0
     missing_skills_map = {}  # Dictionary to store missing skills by job_url
 
-    for job in jobs_data:
-        if "job_url" not in job:
-            continue
-
-        # Create job identifier
-        job_id = job["job_url"].split("/")[-1]
-        if "?" in job_id:
-            job_id = job_id.split("?")[0]
-
+    for job, (skill_ids, missing_skills) in zip(
+        jobs_data,
+        resolve_skill_batches(
+            lexicon, [job.get("required_skills") for job in jobs_data]
+        ),
+    ):
         # Create job individual
-        job_uri = TALENT_NAMESPACE[f"Job_{job_id}"]
-        graph.add((job_uri, RDF.type, TALENT_NAMESPACE["Job"]))
-        graph.add(
-            (
-                job_uri,
-                TALENT_NAMESPACE["jobUrl"],
-                Literal(job["job_url"], datatype=XSD.string),
-            )
-        )
+        job_uri = add_job_individual(graph, job["job_url"])
 
         # Add required skills
-        skills_added = 0
-        missing_skills = []  # List to store missing skills for this job
-        if "required_skills" in job and job["required_skills"]:
-            for skill in job["required_skills"]:
-                skill_lower = skill.lower()
-
-                # Check special cases first
-                if skill_lower in special_cases:
-                    mapped_skill = special_cases[skill_lower]
-                    if mapped_skill in ontology_skills:
-                        original_name, original_uri = ontology_skills[mapped_skill]
-                        graph.add(
-                            (job_uri, TALENT_NAMESPACE["REQUIRED_SKILL"], original_uri)
-                        )
-                        skills_added += 1
-                        continue
-
-                # Regular matching
-                if skill_lower in ontology_skills:
-                    original_name, original_uri = ontology_skills[skill_lower]
-                    graph.add(
-                        (job_uri, TALENT_NAMESPACE["REQUIRED_SKILL"], original_uri)
-                    )
-                    skills_added += 1
-                else:
-                    # Skill not found in ontology
-                    missing_skills.append(skill)
+        add_skill_triples(
+            graph, job_uri, TALENT_NAMESPACE["REQUIRED_SKILL"], lexicon, skill_ids
+        )
 
-        if skills_added > 0:
+        if skill_ids:
             jobs_with_skills += 1
 
         # Store missing skills for this job
@@ -107,36 +183,41 @@ def import_all_jobs_to_ontology(graph, jobs_data):
     return graph, missing_skills_map
 
 
+def build_job_uri(job_url) -> URIRef:
+    """URI individual Job di ontology, dari job key (hash job_url ternormalisasi)"""
+    return TALENT_NAMESPACE[f"Job_{build_job_key(job_url)}"]
+
+
+def add_job_individual(graph, job_url) -> URIRef:
+    """Tambah individual Job beserta jobUrl dan jobKey ke graph, return URI-nya"""
+    job_uri = build_job_uri(job_url)
+    graph.add((job_uri, RDF.type, TALENT_NAMESPACE["Job"]))
+    graph.add(
+        (job_uri, TALENT_NAMESPACE["jobUrl"], Literal(job_url, datatype=XSD.string))
+    )
+    graph.add(
+        (
+            job_uri,
+            TALENT_NAMESPACE["jobKey"],
+            Literal(build_job_key(job_url), datatype=XSD.string),
+        )
+    )
+    return job_uri
+
+
 def import_all_users_to_ontology(graph, users_data):
     """Import ALL users to ontology"""
     # Handle empty or None users_data
     if not users_data:
         return graph
 
-    # Get all skills for matching
-    all_skills_query = """
-    SELECT ?skill
-    WHERE {
-        ?skill rdfs:subClassOf+ <http://www.semanticweb.org/kota203/ontologies/2025/3/talent-matching-ontology/Skills> .
-    }
-    """
-
-    ontology_skills = {}
-    for row in graph.query(all_skills_query):
-        skill_uri = row[0]
-        skill_name = str(skill_uri).split("/")[-1].replace("_", " ")
-        ontology_skills[skill_name.lower()] = (skill_name, skill_uri)
-
-    # Special cases
-    special_cases = {
-        "c#": "cs",
-        "ci/cd": "ci_cd",
-        "pl/sql": "pl_sql",
-    }
-
+    lexicon = get_skill_lexicon()
     total_skills_added = 0
 
-    for user in users_data:
+    for user, (skill_ids, _) in zip(
+        users_data,
+        resolve_skill_batches(lexicon, [user["skills"] for user in users_data]),
+    ):
         # Generate UUID if not exists, or use existing UUID
         if "uuid" in user and user["uuid"]:
             user_uuid = user["uuid"]
@@ -156,265 +237,106 @@ def import_all_users_to_ontology(graph, users_data):
         )
 
         # Add user skills
-        user_skills_added = 0
-        for skill in user["skills"]:
-            skill_lower = skill.lower()
-
-            # Check special cases first
-            if skill_lower in special_cases:
-                mapped_skill = special_cases[skill_lower]
-                if mapped_skill in ontology_skills:
-                    original_name, original_uri = ontology_skills[mapped_skill]
-                    graph.add((user_uri, TALENT_NAMESPACE["HAS_SKILL"], original_uri))
-                    user_skills_added += 1
-                    continue
-
-            # Regular matching
-            if skill_lower in ontology_skills:
-                original_name, original_uri = ontology_skills[skill_lower]
-                graph.add((user_uri, TALENT_NAMESPACE["HAS_SKILL"], original_uri))
-                user_skills_added += 1
-
-        total_skills_added += user_skills_added
+        add_skill_triples(
+            graph, user_uri, TALENT_NAMESPACE["HAS_SKILL"], lexicon, skill_ids
+        )
+        total_skills_added += len(skill_ids)
 
     return graph
 
 
-def build_temp_graph_for_user(base_graph, jobs_data, user_email, user_skills):
-    """Build temporary graph dengan ALL jobs + specific user only"""
-    # Start dengan base ontology
-    temp_graph = Graph()
-    for s, p, o in base_graph:
-        temp_graph.add((s, p, o))
-    temp_graph.bind("talent", TALENT_NAMESPACE)
-
-    # Add ALL jobs
-    temp_graph = import_all_jobs_to_temp_graph(temp_graph, jobs_data)
-
-    # Add ONLY this specific user
-    temp_graph, user_uri = import_specific_user_to_temp_graph(
-        temp_graph, user_email, user_skills
-    )
-
-    return temp_graph, user_uri
-
-
-def import_all_jobs_to_temp_graph(graph, jobs_data):
-    all_skills_query = """
-    SELECT ?skill
-    WHERE {
-        ?skill rdfs:subClassOf+ <http://www.semanticweb.org/kota203/ontologies/2025/3/talent-matching-ontology/Skills> .
-    }
-    """
-
-    ontology_skills = {}
-    for row in graph.query(all_skills_query):
-        skill_uri = row[0]
-        skill_name = str(skill_uri).split("/")[-1].replace("_", " ")
-        ontology_skills[skill_name.lower()] = (skill_name, skill_uri)
-
-    special_cases = {
-        "c#": "cs",
-        "ci/cd": "ci_cd",
-        "pl/sql": "pl_sql",
-    }
-
-    jobs_added = 0
-    for job in jobs_data:
-        if "job_url" not in job:
-            continue
-
-        # Create job
-        job_id = job["job_url"].split("/")[-1]
-        if "?" in job_id:
-            job_id = job_id.split("?")[0]
-
-        job_uri = TALENT_NAMESPACE[f"Job_{job_id}"]
-        graph.add((job_uri, RDF.type, TALENT_NAMESPACE["Job"]))
+def add_skill_triples(graph, subject_uri, predicate, lexicon, skill_ids):
+    """Tambah triple (subject, predicate, skill) untuk setiap skill id hasil lexicon"""
+    for skill_id in skill_ids:
         graph.add(
-            (
-                job_uri,
-                TALENT_NAMESPACE["jobUrl"],
-                Literal(job["job_url"], datatype=XSD.string),
-            )
+            (subject_uri, predicate, URIRef(get_lexicon_skill_uri(lexicon, skill_id)))
         )
 
-        # Add job skills
-        if "required_skills" in job and job["required_skills"]:
-            for skill in job["required_skills"]:
-                skill_lower = skill.lower()
-
-                if skill_lower in special_cases:
-                    mapped_skill = special_cases[skill_lower]
-                    if mapped_skill in ontology_skills:
-                        original_name, original_uri = ontology_skills[mapped_skill]
-                        graph.add(
-                            (job_uri, TALENT_NAMESPACE["REQUIRED_SKILL"], original_uri)
-                        )
-                        continue
-
-                if skill_lower in ontology_skills:
-                    original_name, original_uri = ontology_skills[skill_lower]
-                    graph.add(
-                        (job_uri, TALENT_NAMESPACE["REQUIRED_SKILL"], original_uri)
-                    )
-
-        jobs_added += 1
-
-    return graph
 
-
-def import_specific_user_to_temp_graph(graph, user_email, user_skills):
-    """Import specific user ke temporary graph"""
-    # Get skill mappings
-    all_skills_query = """
-    SELECT ?skill
-    WHERE {
-        ?skill rdfs:subClassOf+ <http://www.semanticweb.org/kota203/ontologies/2025/3/talent-matching-ontology/Skills> .
-    }
+def aggregate_skill_similarities(skill_similarities, job_skill_count=None) -> float:
     """
+    Score overall user-job dari best match per skill user (rumus asli).
+    All-users (matching setelah scraping, engine batch): rata-rata semua best match.
+    Single-user (job_skill_count diisi): jumlah top job_skill_count best match
+    dibagi jumlah skill job, sehingga skill user di luar kebutuhan job tidak
+    menurunkan score. Kedua rumus sengaja dipertahankan agar score endpoint
+    user tidak berubah.
+    """
+    if job_skill_count is None:
+        return sum(skill_similarities) / len(skill_similarities)
 
-    ontology_skills = {}
-    for row in graph.query(all_skills_query):
-        skill_uri = row[0]
-        skill_name = str(skill_uri).split("/")[-1].replace("_", " ")
-        ontology_skills[skill_name.lower()] = (skill_name, skill_uri)
-
-    special_cases = {
-        "c#": "cs",
-        "ci/cd": "ci_cd",
-        "pl/sql": "pl_sql",
-    }
-
-    user_uuid = str(uuid.uuid4())
-    user_uri = TALENT_NAMESPACE[f"User_{user_uuid}"]
-    graph.add((user_uri, RDF.type, TALENT_NAMESPACE["User"]))
-    graph.add(
-        (user_uri, TALENT_NAMESPACE["email"], Literal(user_email, datatype=XSD.string))
-    )
-
-    # Add user skills
-    skills_added = 0
-    for skill in user_skills:
-        skill_lower = skill.lower()
-
-        if skill_lower in special_cases:
-            mapped_skill = special_cases[skill_lower]
-            if mapped_skill in ontology_skills:
-                original_name, original_uri = ontology_skills[mapped_skill]
-                graph.add((user_uri, TALENT_NAMESPACE["HAS_SKILL"], original_uri))
-                skills_added += 1
-                continue
-
-        if skill_lower in ontology_skills:
-            original_name, original_uri = ontology_skills[skill_lower]
-            graph.add((user_uri, TALENT_NAMESPACE["HAS_SKILL"], original_uri))
-            skills_added += 1
-
-    return graph, user_uri
+    top_similarities = sorted(skill_similarities, reverse=True)[0:job_skill_count]
+    return sum(top_similarities) / job_skill_count
 
 
-def calculate_user_job_similarity_for_specific_user(graph, user_uri):
-    # Get all jobs
-    jobs_query = """
-    SELECT ?job
-    WHERE {
-        ?job rdf:type <http://www.semanticweb.org/kota203/ontologies/2025/3/talent-matching-ontology/Job> .
-    }
+def calculate_categorized_matches_for_user_skills(user_skills, jobs_data):
     """
-    jobs = [row[0] for row in graph.query(jobs_query)]
-
-    # Get user skills
-    user_skills_query = f"""
-    SELECT ?skill
-    WHERE {{
-        <{user_uri}> <http://www.semanticweb.org/kota203/ontologies/2025/3/talent-matching-ontology/HAS_SKILL> ?skill .
-    }}
+    Matching satu user tanpa membangun graph rdflib: skill dari lexicon, score
+    dari similarity matrix, hanya match yang berkategori. Input nama skill user
+    dan jobs dari get_jobs_from_neo4j. Score memakai rumus single-user
+    aggregate_skill_similarities, bukan rata-rata engine batch.
     """
-    user_skills = [row[0] for row in graph.query(user_skills_query)]
+    lexicon = get_skill_lexicon()
+    user_skill_ids, _ = resolve_skill_ids(lexicon, user_skills)
 
-    if not user_skills:
+    if not user_skill_ids:
         return []
 
-    match_results = []
-    for job_uri in jobs:
-        # Get job skills
-        job_skills_query = f"""
-        SELECT ?skill
-        WHERE {{
-            <{job_uri}> <http://www.semanticweb.org/kota203/ontologies/2025/3/talent-matching-ontology/REQUIRED_SKILL> ?skill .
-        }}
-        """
-        job_skills = [row[0] for row in graph.query(job_skills_query)]
+    similarity_rows = get_skill_similarity_matrix().tolist()
+    user_similarity_rows = [
+        similarity_rows[user_skill_id] for user_skill_id in user_skill_ids
+    ]
+    top_k = settings.MATCHING_TOP_K
+    min_score = settings.MATCHING_MIN_SCORE
+
+    scored_jobs = []
+    jobs_data = [job for job in jobs_data if "job_url" in job]
+    jobs_skill_ids = resolve_skill_batches(
+        lexicon, [job.get("required_skills") for job in jobs_data]
+    )
 
-        if not job_skills:
+    for job_position, (job, (job_skill_ids, _)) in enumerate(
+        zip(jobs_data, jobs_skill_ids)
+    ):
+        if not job_skill_ids:
             continue
 
-        # Calculate similarity using your existing algorithm
-        skill_similarities = []
-        for user_skill in user_skills:
-            user_skill_features = get_limited_ancestors(graph, user_skill)
-            max_skill_similarity = 0
-
-            for job_skill in job_skills:
-                job_skill_features = get_limited_ancestors(graph, job_skill)
-                skill_similarity = sanchez_similarity(
-                    user_skill_features, job_skill_features
-                )
-                if skill_similarity > max_skill_similarity:
-                    max_skill_similarity = skill_similarity
-
-            skill_similarities.append(max_skill_similarity)
-
-        # Calculate overall similarity
-        skill_similarities = sorted(skill_similarities, reverse=True)
-        if skill_similarities:
-            overall_similarity = sum(skill_similarities[0 : len(job_skills)]) / len(
-                job_skills
-            )
-            if overall_similarity > 0:
-                match_results.append(
-                    {
-                        "user": str(user_uri),
-                        "job": str(job_uri),
-                        "similarity": overall_similarity,
-                    }
-                )
-
-    return match_results
+        # Best match per user skill, langsung dari baris matrix
+        overall_similarity = aggregate_skill_similarities(
+            [
+                max(similarity_row[job_skill_id] for job_skill_id in job_skill_ids)
+                for similarity_row in user_similarity_rows
+            ],
+            job_skill_count=len(job_skill_ids),
+        )
 
+        if overall_similarity > 0 and overall_similarity >= min_score:
+            scored_jobs.append((job_position, job["job_url"], overall_similarity))
 
-def extract_categorized_matches_for_user(graph, user_uri):
-    """
-    Extract categorized matches untuk specific user setelah dynamic categorization
-    """
-    categorized_matches = []
-
-    # Query untuk mendapatkan semua matches yang sudah dikategorisasi untuk user ini
-    categorized_query = f"""
-    SELECT ?match ?similarity ?matchType ?job
-    WHERE {{
-        ?match rdf:type <http://www.semanticweb.org/kota203/ontologies/2025/3/talent-matching-ontology/UserJobMatch> .
-        ?match <http://www.semanticweb.org/kota203/ontologies/2025/3/talent-matching-ontology/USER_MATCH> <{user_uri}> .
-        ?match <http://www.semanticweb.org/kota203/ontologies/2025/3/talent-matching-ontology/similarityScore> ?similarity .
-        ?match <http://www.semanticweb.org/kota203/ontologies/2025/3/talent-matching-ontology/JOB_MATCH> ?job .
-        ?match <http://www.semanticweb.org/kota203/ontologies/2025/3/talent-matching-ontology/matchType> ?matchType .
-    }}
-    """
+    categories = categorize_similarity_scores(
+        [similarity for _, _, similarity in scored_jobs]
+    )
 
-    matches = list(graph.query(categorized_query))
+    top_matches = []
+    for (job_position, job_url, similarity), category in zip(scored_jobs, categories):
+        if category is None:
+            continue
 
-    for match, similarity, match_type, job in matches:
-        categorized_matches.append(
+        push_top_k_match(
+            top_matches,
+            top_k,
+            similarity,
+            job_position,
             {
-                "match_uri": str(match),
-                "job_uri": str(job),
-                "similarity": float(similarity),
-                "category": str(match_type),
-            }
+                "job_uri": str(build_job_uri(job_url)),
+                "job_url": job_url,
+                "job_key": build_job_key(job_url),
+                "similarity": similarity,
+                "category": category,
+            },
         )
 
-    return categorized_matches
+    return pop_top_k_matches(top_matches)
 
 
 def add_user_job_matches_to_ontology(graph, match_results):
@@ -433,6 +355,14 @@ def add_user_job_matches_to_ontology(graph, match_results):
                 Literal(match["similarity"], datatype=XSD.float),
             )
         )
+        if match.get("category"):
+            graph.add(
+                (
+                    match_uri,
+                    TALENT_NAMESPACE["matchType"],
+                    Literal(match["category"], datatype=XSD.string),
+                )
+            )
 
     return graph
 
@@ -456,49 +386,16 @@ def sanchez_similarity(set_a, set_b):
     return similarity
 
 
-def get_limited_ancestors(graph, skill_uri, max_levels=5):
-    """Get skill and its ancestors (up to 3 levels), stopping at Skills node"""
-    ancestors = set()
-    ancestors.add(str(skill_uri))
-
-    # Define Skills top-level node
-    SKILLS_NODE = "http://www.semanticweb.org/kota203/ontologies/2025/3/talent-matching-ontology/Skills"
-
-    current_level = [skill_uri]
-    level = 0
-
-    while current_level and level < max_levels:
-        next_level = []
-        for node in current_level:
-            query = f"""
-            SELECT ?parent
-            WHERE {{
-                <{node}> rdfs:subClassOf ?parent .
-                FILTER(?parent != <{node}>)
-            }}
-            """
-
-            for row in graph.query(query):
-                parent = row[0]
-                parent_str = str(parent)
-
-                if parent_str == SKILLS_NODE:
-                    current_level = max_levels
-                    level = max_levels
-                    continue
-
-                if parent_str not in ancestors:
-                    ancestors.add(parent_str)
-                    next_level.append(parent)
-
-        current_level = next_level
-        level += 1
-
-    return ancestors
-
-
 def calculate_all_user_job_similarities(graph):
     """Calculate similarities between ALL users and ALL jobs at once"""
+    if settings.MATCHING_ENGINE == "numpy":
+        return calculate_all_user_job_similarities_vectorized(
+            graph,
+            block_size=settings.MATCHING_USER_BLOCK_SIZE,
+            top_k=settings.MATCHING_TOP_K,
+            min_score=settings.MATCHING_MIN_SCORE,
+        )
+
     users_query = """
     SELECT ?user ?email
     WHERE {
@@ -517,73 +414,104 @@ def calculate_all_user_job_similarities(graph):
     users = [(row[0], str(row[1])) for row in graph.query(users_query)]
     jobs = [row[0] for row in graph.query(jobs_query)]
 
-    match_results = []
-    processed_combinations = 0
+    taxonomy = get_skill_taxonomy()
+    similarity_rows = get_skill_similarity_matrix().tolist()
 
-    for user_uri, email in users:
-        user_skills_query = f"""
+    # Skill job cukup diambil sekali per job, bukan per user
+    jobs_skill_ids = []
+    for job_uri in jobs:
+        job_skills_query = f"""
         SELECT ?skill
         WHERE {{
-            <{user_uri}> <http://www.semanticweb.org/kota203/ontologies/2025/3/talent-matching-ontology/HAS_SKILL> ?skill .
+            <{job_uri}> <http://www.semanticweb.org/kota203/ontologies/2025/3/talent-matching-ontology/REQUIRED_SKILL> ?skill .
         }}
         """
 
-        user_skills = [row[0] for row in graph.query(user_skills_query)]
+        job_skill_ids = get_skill_ids(
+            taxonomy, [row[0] for row in graph.query(job_skills_query)]
+        )
 
-        if not user_skills:
+        if not job_skill_ids:
             continue
 
-        user_matches = 0
+        jobs_skill_ids.append((job_uri, job_skill_ids))
 
-        for job_uri in jobs:
-            job_skills_query = f"""
-            SELECT ?skill
-            WHERE {{
-                <{job_uri}> <http://www.semanticweb.org/kota203/ontologies/2025/3/talent-matching-ontology/REQUIRED_SKILL> ?skill .
-            }}
-            """
+    top_k = settings.MATCHING_TOP_K
+    min_score = settings.MATCHING_MIN_SCORE
 
-            job_skills = [row[0] for row in graph.query(job_skills_query)]
+    match_results = []
+    processed_combinations = 0
 
-            if not job_skills:
-                continue
+    for user_uri, email in users:
+        user_skills_query = f"""
+        SELECT ?skill
+        WHERE {{
+            <{user_uri}> <http://www.semanticweb.org/kota203/ontologies/2025/3/talent-matching-ontology/HAS_SKILL> ?skill .
+        }}
+        """
 
-            skill_similarities = []
+        user_skill_ids = get_skill_ids(
+            taxonomy, [row[0] for row in graph.query(user_skills_query)]
+        )
 
-            for user_skill in user_skills:
-                user_skill_features = get_limited_ancestors(graph, user_skill)
-                max_skill_similarity = 0
+        if not user_skill_ids:
+            continue
 
-                for job_skill in job_skills:
-                    job_skill_features = get_limited_ancestors(graph, job_skill)
-                    skill_similarity = sanchez_similarity(
-                        user_skill_features, job_skill_features
-                    )
+        user_similarity_rows = [
+            similarity_rows[user_skill_id] for user_skill_id in user_skill_ids
+        ]
 
-                    if skill_similarity > max_skill_similarity:
-                        max_skill_similarity = skill_similarity
+        # Heap top-K per user, pair yang dibuang tidak pernah masuk match_results
+        top_matches = []
 
-                skill_similarities.append(max_skill_similarity)
+        for job_position, (job_uri, job_skill_ids) in enumerate(jobs_skill_ids):
+            # Best match per user skill, langsung dari baris matrix
+            skill_similarities = [
+                max(similarity_row[job_skill_id] for job_skill_id in job_skill_ids)
+                for similarity_row in user_similarity_rows
+            ]
 
             # Calculate overall similarity
             if skill_similarities:
-                overall_similarity = sum(skill_similarities) / len(skill_similarities)
-
-                if overall_similarity > 0:
-                    match_results.append(
+                overall_similarity = aggregate_skill_similarities(skill_similarities)
+
+                if overall_similarity > 0 and overall_similarity >= min_score:
+                    push_top_k_match(
+                        top_matches,
+                        top_k,
+                        overall_similarity,
+                        job_position,
                         {
                             "user": user_uri,
                             "job": job_uri,
                             "similarity": overall_similarity,
-                        }
+                        },
                     )
-                    user_matches += 1
 
             processed_combinations += 1
 
+        match_results.extend(pop_top_k_matches(top_matches))
+
     return match_results
 
 
+def push_top_k_match(heap, top_k, similarity, position, match):
+    """
+    Simpan match ke min-heap berukuran top_k (top_k 0 = simpan semua).
+    Jika score sama, match dengan position lebih kecil yang dipertahankan.
+    """
+    entry = (similarity, -position, match)
+    if top_k <= 0 or len(heap) < top_k:
+        heapq.heappush(heap, entry)
+    elif entry[:2] > heap[0][:2]:
+        heapq.heapreplace(heap, entry)
+
+
+def pop_top_k_matches(heap) -> list[dict]:
+    """Ambil match dari heap, diurutkan kembali sesuai urutan job"""
+    return [match for _, _, match in sorted(heap, key=lambda entry: -entry[1])]
+
+
 def extract_equivalent_class_rules_from_ontology(graph):
     """Extract equivalent class rules for UserJobMatch subclasses from ontology"""
     rules = {}
@@ -738,49 +666,109 @@ def create_simple_threshold_rules():
     }
 
 
-def apply_dynamic_categorization(graph, rules):
-    """Apply categorization based on rules extracted from ontology"""
-    # Get all UserJobMatch with similarity scores
-    matches_query = """
-    SELECT ?match ?similarity
-    WHERE {
-        ?match rdf:type <http://www.semanticweb.org/kota203/ontologies/2025/3/talent-matching-ontology/UserJobMatch> .
-        ?match <http://www.semanticweb.org/kota203/ontologies/2025/3/talent-matching-ontology/similarityScore> ?similarity .
+def categorize_similarity_score(score, rules) -> str | None:
+    """Return match type (Strong/Mid/Weak) dari rule pertama yang cocok dengan score"""
+    for category, rule in rules.items():
+        if evaluate_rule(score, rule):
+            # Convert category name to simple form
+            return category.replace("_Match", "")
+
+    return None
+
+
+def get_match_category_rules() -> dict[str, dict]:
+    """Rules kategorisasi dari base ontology, diekstrak sekali per versi ontology"""
+    ontology_hash = get_ontology_hash()
+    rules = _category_rules_cache.get(ontology_hash)
+    if rules is None:
+        rules = extract_equivalent_class_rules_from_ontology(load_base_ontology())
+        _category_rules_cache.clear()
+        _category_rules_cache[ontology_hash] = rules
+
+    return rules
+
+
+def compile_match_category_bins(rules) -> dict[str, any]:
+    """
+    Compile rules menjadi bin threshold terurut untuk np.searchsorted.
+    Setiap threshold punya kategori sendiri (rule bisa inclusive/exclusive),
+    dan setiap interval di antara threshold punya satu kategori.
+    """
+    edges = set()
+    for rule in rules.values():
+        for key in ("threshold", "min_threshold", "max_threshold"):
+            if key in rule:
+                edges.add(float(rule[key]))
+    edges = sorted(edges)
+
+    # Titik wakil untuk interval (-inf, e0), (e0, e1), ..., (en, inf)
+    interval_points = []
+    if edges:
+        interval_points.append(edges[0] - 1.0)
+        interval_points.extend(
+            (lower + upper) / 2 for lower, upper in zip(edges, edges[1:])
+        )
+        interval_points.append(edges[-1] + 1.0)
+
+    labels = [None] + [category.replace("_Match", "") for category in rules]
+    label_codes = {label: code for code, label in enumerate(labels)}
+
+    def category_code(score):
+        return label_codes[categorize_similarity_score(score, rules)]
+
+    return {
+        "edges": np.array(edges, dtype=np.float64),
+        "edge_codes": np.array([category_code(edge) for edge in edges], np.int8),
+        "interval_codes": np.array(
+            [category_code(point) for point in interval_points] or [0], np.int8
+        ),
+        "labels": np.array(labels, dtype=object),
     }
+
+
+def get_match_category_bins() -> dict[str, any]:
+    """Bin kategorisasi yang sudah di-compile, sekali per versi ontology"""
+    ontology_hash = get_ontology_hash()
+    bins = _category_bins_cache.get(ontology_hash)
+    if bins is None:
+        bins = compile_match_category_bins(get_match_category_rules())
+        _category_bins_cache.clear()
+        _category_bins_cache[ontology_hash] = bins
+
+    return bins
+
+
+def categorize_similarity_scores(scores) -> list[str | None]:
+    """
+    Kategorisasi banyak score sekaligus dengan satu pass np.searchsorted,
+    hasilnya sama dengan categorize_similarity_score per score.
     """
+    bins = get_match_category_bins()
+    scores = np.asarray(scores, dtype=np.float64)
+    edges = bins["edges"]
 
-    matches = list(graph.query(matches_query))
+    if len(edges) == 0:
+        return [None] * len(scores)
 
-    if len(matches) == 0:
-        return graph
+    positions = np.searchsorted(edges, scores, side="left")
+    on_edge = positions < len(edges)
+    on_edge[on_edge] = edges[positions[on_edge]] == scores[on_edge]
 
-    categorization_counts = {"Strong_Match": 0, "Mid_Match": 0, "Weak_Match": 0}
-
-    for match, similarity in matches:
-        score = float(similarity)
-
-        # Apply rules dynamically
-        for category, rule in rules.items():
-            if evaluate_rule(score, rule):
-                # Convert category name to simple form
-                if category == "Strong_Match":
-                    match_type = "Strong"
-                elif category == "Mid_Match":
-                    match_type = "Mid"
-                elif category == "Weak_Match":
-                    match_type = "Weak"
-
-                graph.add(
-                    (
-                        match,
-                        TALENT_NAMESPACE["matchType"],
-                        Literal(match_type, datatype=XSD.string),
-                    )
-                )
-                categorization_counts[category] += 1
-                break  # Stop after first match
+    codes = bins["interval_codes"][positions]
+    codes[on_edge] = bins["edge_codes"][positions[on_edge]]
+
+    return bins["labels"][codes].tolist()
 
-    return graph
+
+def categorize_match_results(match_results) -> list[dict]:
+    """Set match["category"] untuk semua hasil matching dalam satu pass"""
+    categories = categorize_similarity_scores(
+        [match["similarity"] for match in match_results]
+    )
+    for match, category in zip(match_results, categories):
+        match["category"] = category
+
+    return match_results
 
 
 def evaluate_rule(score, rule):
@@ -801,14 +789,3 @@ def evaluate_rule(score, rule):
         return rule["min_threshold"] <= score <= rule["max_threshold"]
 
     return False
-
-
-def apply_dynamic_categorization_pipeline(graph):
-    """Simple pipeline to extract rules and apply them"""
-    # Step 1: Extract rules from ontology equivalent classes
-    rules = extract_equivalent_class_rules_from_ontology(graph)
-
-    # Step 2: Apply categorization using extracted rules
-    graph = apply_dynamic_categorization(graph, rules)
-
-    return graph
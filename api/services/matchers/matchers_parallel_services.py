@@ -0,0 +1,138 @@
+import billiard
+
+from api.services.matchers.helper import update_task_progress
+from api.services.matchers.matchers_skill_similarity_services import (
+    get_skill_similarity_matrix,
+)
+from api.services.matchers.matchers_skill_taxonomy_services import get_skill_taxonomy
+from api.services.matchers.matchers_vectorized_services import (
+    build_best_match_table,
+    extract_users_and_jobs_skill_ids,
+    pad_similarity_matrix,
+    score_user_block,
+    select_match_indices,
+)
+
+# Diisi sebelum pool dibuat, lalu diwarisi worker lewat fork (tidak di-pickle per task)
+_shared_matching_data = {}
+
+
+def get_matching_pool(workers):
+    """
+    Pool fork dari billiard (multiprocessing milik Celery). Berbeda dengan
+    multiprocessing, billiard mengizinkan proses daemon seperti child Celery
+    prefork membuat child process sendiri.
+    """
+    return billiard.get_context("fork").Pool(processes=workers)
+
+
+def score_user_shard(
+    shard_start, shard_end, block_size=256, top_k=0, min_score=0.0
+) -> list[tuple]:
+    """Score satu shard user, return list (user_index, job_index, similarity)"""
+    user_skill_id_lists = _shared_matching_data["user_skill_id_lists"]
+    best_match = _shared_matching_data["best_match"]
+
+    shard_matches = []
+    for start in range(shard_start, shard_end, block_size):
+        end = min(start + block_size, shard_end)
+        scores = score_user_block(user_skill_id_lists[start:end], best_match)
+        for row, column in zip(*select_match_indices(scores, top_k, min_score)):
+            shard_matches.append(
+                (start + int(row), int(column), float(scores[row, column]))
+            )
+
+    return shard_matches
+
+
+def score_indexed_user_shard(shard) -> tuple[int, list[tuple]]:
+    """Wrapper imap_unordered: (shard_index, args) -> (shard_index, hasil)"""
+    shard_index, shard_args = shard
+    return shard_index, score_user_shard(*shard_args)
+
+
+def split_into_shards(total, shard_count) -> list[tuple[int, int]]:
+    """Bagi range [0, total) menjadi shard dengan ukuran yang hampir sama"""
+    shard_count = max(1, min(shard_count, total))
+    shard_size = -(-total // shard_count)
+    return [
+        (start, min(start + shard_size, total)) for start in range(0, total, shard_size)
+    ]
+
+
+def calculate_all_user_job_similarities_parallel(
+    graph,
+    workers,
+    task_id=None,
+    update_state_func=None,
+    block_size=256,
+    top_k=0,
+    min_score=0.0,
+):
+    """
+    Calculate similarities ALL users x ALL jobs dengan membagi user ke beberapa
+    shard yang diproses pool billiard, juga di dalam worker Celery prefork.
+    Hasil sama dengan calculate_all_user_job_similarities.
+    """
+    taxonomy = get_skill_taxonomy()
+    users, jobs = extract_users_and_jobs_skill_ids(graph, taxonomy)
+
+    if not users or not jobs:
+        return []
+
+    _shared_matching_data["user_skill_id_lists"] = [
+        user_skill_ids for _, user_skill_ids in users
+    ]
+    _shared_matching_data["best_match"] = build_best_match_table(
+        [job_skill_ids for _, job_skill_ids in jobs],
+        pad_similarity_matrix(get_skill_similarity_matrix()),
+    )
+
+    shards = split_into_shards(len(users), workers * 4)
+    progress_data = {"completed_shards": 0, "total_shards": len(shards)}
+    shard_results = {}
+
+    def report_shard_progress():
+        progress_data["completed_shards"] += 1
+        if update_state_func:
+            update_task_progress(
+                task_id,
+                "MATCHING_BETWEEN_USERS_AND_JOBS",
+                dict(progress_data),
+                update_state_func,
+            )
+
+    try:
+        with get_matching_pool(workers) as pool:
+            for shard_index, shard_matches in pool.imap_unordered(
+                score_indexed_user_shard,
+                [
+                    (
+                        shard_index,
+                        (shard_start, shard_end, block_size, top_k, min_score),
+                    )
+                    for shard_index, (shard_start, shard_end) in enumerate(shards)
+                ],
+            ):
+                shard_results[shard_index] = shard_matches
+                report_shard_progress()
+    finally:
+        _shared_matching_data.clear()
+
+    # Gabungkan sesuai urutan shard supaya urutan hasil deterministik
+    match_results = []
+    for shard_index in range(len(shards)):
+        for user_index, job_index, similarity in shard_results[shard_index]:
+            match_results.append(
+                {
+                    "user": users[user_index][0],
+                    "job": jobs[job_index][0],
+                    "similarity": similarity,
+                }
+            )
+
+    print(
+        f"[PARALLEL_MATCHING_INFO] Scored {len(users)} users x {len(jobs)} jobs in {len(shards)} shards with {workers} workers"
+    )
+
+    return match_results
@@ -0,0 +1,541 @@
+import json
+import time
+
+from django.conf import settings
+from django.test.utils import override_settings
+
+from api.constants import TALENT_NAMESPACE
+from api.services.matchers.matchers_baseline_services import (
+    build_baseline_graph,
+    calculate_baseline_all_user_job_similarities,
+    calculate_baseline_matches_for_user,
+    get_baseline_ontology_skills,
+    resolve_baseline_skill_uris,
+)
+from api.services.matchers.matchers_benchmark_services import (
+    warm_up_matching_caches,
+)
+from api.services.matchers.matchers_ontology_services import (
+    build_job_uri,
+    calculate_all_user_job_similarities,
+    calculate_categorized_matches_for_user_skills,
+    categorize_match_results,
+    import_all_jobs_to_ontology,
+    import_all_users_to_ontology,
+    load_base_ontology,
+)
+from api.services.matchers.matchers_parallel_services import (
+    calculate_all_user_job_similarities_parallel,
+)
+from api.services.matchers.matchers_skill_lexicon_services import (
+    SKILL_SPECIAL_CASES,
+    get_lexicon_skill_uri,
+    get_skill_lexicon,
+    load_skills_dictionary_aliases,
+    normalize_skill_name,
+    resolve_skill_ids,
+)
+from api.services.matchers.matchers_skill_taxonomy_services import get_skill_name
+from api.services.matchers.matchers_vectorized_services import (
+    score_users_against_jobs,
+)
+
+# Engine yang dibandingkan harus berasal dari keluarga yang sama karena rumus
+# score all-users dan single-user berbeda. Engine pertama adalah referensi:
+# jalur asli (SPARQL, get_limited_ancestors, Sánchez per pair).
+PARITY_ENGINE_FAMILIES = {
+    "all_users": ["baseline", "python", "numpy", "parallel", "direct"],
+    "single_user": ["single_user_baseline", "single_user_direct"],
+}
+BASELINE_ENGINES = ["baseline", "single_user_baseline"]
+
+# Alasan yang memang diharapkan saat lexicon me-resolve skill berbeda dari
+# lookup asli. Alasan lain dianggap regresi dan membuat parity gagal.
+EXPECTED_LEXICON_REASONS = ["normalized_name", "special_case", "dictionary_alias"]
+
+
+def get_engine_family(engine) -> str:
+    """Keluarga engine (all_users / single_user)"""
+    for family, engines in PARITY_ENGINE_FAMILIES.items():
+        if engine in engines:
+            return family
+    raise ValueError(f"Unknown matching engine: {engine}")
+
+
+def load_parity_dataset(path) -> dict[str, list]:
+    """
+    Load fixture/snapshot JSON {"users_data": [...], "jobs_data": [...]} dengan
+    bentuk yang sama seperti output get_users_from_neo4j / get_jobs_from_neo4j
+    """
+    with open(path, "r", encoding="utf-8") as dataset_file:
+        dataset = json.load(dataset_file)
+
+    return {
+        "users_data": dataset.get("users_data") or [],
+        "jobs_data": dataset.get("jobs_data") or [],
+    }
+
+
+def snapshot_parity_dataset_from_neo4j(path=None) -> dict[str, list]:
+    """Ambil users/jobs dari Neo4j, simpan sebagai snapshot JSON jika path diisi"""
+    from api.services.matchers.matchers_neo4j_services import (
+        get_jobs_from_neo4j,
+        get_users_from_neo4j,
+    )
+
+    dataset = {
+        "users_data": get_users_from_neo4j(),
+        "jobs_data": get_jobs_from_neo4j(),
+    }
+    if path:
+        with open(path, "w", encoding="utf-8") as dataset_file:
+            json.dump(dataset, dataset_file, default=str)
+
+    return dataset
+
+
+def build_matching_graph(dataset) -> tuple:
+    """Graph ontology berisi semua job dan user, plus map URI ke email/job_url"""
+    graph, _ = import_all_jobs_to_ontology(load_base_ontology(), dataset["jobs_data"])
+    graph = import_all_users_to_ontology(graph, dataset["users_data"])
+
+    user_emails = {
+        str(user_uri): str(email)
+        for user_uri, email in graph.subject_objects(TALENT_NAMESPACE["email"])
+    }
+    job_urls = {
+        str(job_uri): str(job_url)
+        for job_uri, job_url in graph.subject_objects(TALENT_NAMESPACE["jobUrl"])
+    }
+    return graph, user_emails, job_urls
+
+
+def run_parity_engine(engine, dataset, context) -> list[dict]:
+    """
+    Jalankan satu engine dan normalisasi hasilnya ke
+    [{"user_email", "job_url", "similarity"}] (baseline juga "category").
+    """
+    if engine in ("python", "numpy", "parallel"):
+        graph, user_emails, job_urls = context["graph"]
+        if engine == "parallel":
+            match_results = calculate_all_user_job_similarities_parallel(
+                graph,
+                context["workers"],
+                block_size=settings.MATCHING_USER_BLOCK_SIZE,
+                top_k=settings.MATCHING_TOP_K,
+                min_score=settings.MATCHING_MIN_SCORE,
+            )
+        else:
+            with override_settings(MATCHING_ENGINE=engine):
+                match_results = calculate_all_user_job_similarities(graph)
+
+        return [
+            {
+                "user_email": user_emails[str(match["user"])],
+                "job_url": job_urls[str(match["job"])],
+                "similarity": match["similarity"],
+            }
+            for match in match_results
+        ]
+
+    if engine == "direct":
+        return score_users_against_jobs(
+            dataset["users_data"],
+            dataset["jobs_data"],
+            block_size=settings.MATCHING_USER_BLOCK_SIZE,
+            top_k=settings.MATCHING_TOP_K,
+            min_score=settings.MATCHING_MIN_SCORE,
+        )
+
+    if engine == "baseline":
+        return normalize_baseline_matches(
+            calculate_baseline_all_user_job_similarities(
+                dataset["jobs_data"],
+                dataset["users_data"],
+                top_k=settings.MATCHING_TOP_K,
+                min_score=settings.MATCHING_MIN_SCORE,
+            ),
+            context,
+        )
+
+    match_results = []
+    for user in context["single_users"]:
+        if engine == "single_user_baseline":
+            user_matches = normalize_baseline_matches(
+                calculate_baseline_matches_for_user(
+                    dataset["jobs_data"],
+                    user,
+                    top_k=settings.MATCHING_TOP_K,
+                    min_score=settings.MATCHING_MIN_SCORE,
+                ),
+                context,
+            )
+            match_results.extend(user_matches)
+            continue
+
+        match_results.extend(
+            {
+                "user_email": user["email"],
+                "job_url": match["job_url"],
+                "similarity": match["similarity"],
+            }
+            for match in calculate_categorized_matches_for_user_skills(
+                user["skills"], dataset["jobs_data"]
+            )
+        )
+
+    return match_results
+
+
+def normalize_baseline_matches(match_results, context) -> list[dict]:
+    """Hasil baseline ke bentuk parity, kategori dari rule asli ikut dibandingkan"""
+    return [
+        {
+            "user_email": match["user_email"],
+            "job_url": context["job_urls_by_uri"][match["job"]],
+            "similarity": match["similarity"],
+            "category": match["category"],
+        }
+        for match in match_results
+    ]
+
+
+def classify_lexicon_resolution_change(skill_name, lexicon_skill, alias_names) -> str:
+    """
+    Alasan nama skill di-resolve berbeda: nama ontology dengan spasi/huruf lain,
+    special case (ci/cd, pl/sql) atau alias kamus skill. Selain itu "unexpected".
+    """
+    normalized_name = normalize_skill_name(skill_name)
+    if lexicon_skill is None:
+        return "unexpected"
+    if normalized_name in SKILL_SPECIAL_CASES:
+        return "special_case"
+    if normalized_name == normalize_skill_name(get_skill_name(lexicon_skill)):
+        return "normalized_name"
+    if normalized_name in alias_names:
+        return "dictionary_alias"
+    return "unexpected"
+
+
+def find_lexicon_resolution_changes(dataset) -> dict[str, list]:
+    """
+    User/job yang skill-nya di-resolve berbeda oleh lexicon (alias kamus, spasi)
+    dibanding lookup asli, beserta nama skill penyebab dan alasannya. Pair
+    mereka tidak dibandingkan dengan baseline karena perbedaannya berasal dari
+    input, bukan dari scoring.
+    """
+    graph, _ = build_baseline_graph([], [])
+    ontology_skills = get_baseline_ontology_skills(graph)
+    lexicon = get_skill_lexicon()
+    alias_names = {
+        normalize_skill_name(name)
+        for main_keyword, variants in load_skills_dictionary_aliases().items()
+        for name in [main_keyword, *variants]
+    }
+    changed_skills = {}
+
+    def resolve_skill_names(skill_names) -> tuple[list[str], list[str]]:
+        baseline_skills = [
+            str(skill_uri)
+            for skill_uri in resolve_baseline_skill_uris(ontology_skills, skill_names)
+        ]
+        lexicon_skills = [
+            get_lexicon_skill_uri(lexicon, skill_id)
+            for skill_id in resolve_skill_ids(lexicon, skill_names)[0]
+        ]
+        return baseline_skills, lexicon_skills
+
+    def resolution_changed(skill_names) -> bool:
+        baseline_skills, lexicon_skills = resolve_skill_names(skill_names)
+        if set(baseline_skills) == set(lexicon_skills):
+            return False
+
+        # Catat nama skill penyebab perbedaan beserta alasannya
+        for skill_name in skill_names:
+            baseline_skills, lexicon_skills = resolve_skill_names([skill_name])
+            if baseline_skills == lexicon_skills:
+                continue
+
+            lexicon_skill = lexicon_skills[0] if lexicon_skills else None
+            changed_skills.setdefault(
+                skill_name,
+                {
+                    "skill": skill_name,
+                    "baseline_skill": baseline_skills[0] if baseline_skills else None,
+                    "lexicon_skill": lexicon_skill,
+                    "reason": classify_lexicon_resolution_change(
+                        skill_name, lexicon_skill, alias_names
+                    ),
+                },
+            )
+        return True
+
+    return {
+        "users": sorted(
+            user["email"]
+            for user in dataset["users_data"]
+            if resolution_changed(user.get("skills"))
+        ),
+        "jobs": sorted(
+            job["job_url"]
+            for job in dataset["jobs_data"]
+            if "job_url" in job and resolution_changed(job.get("required_skills"))
+        ),
+        "skills": sorted(changed_skills.values(), key=lambda change: change["skill"]),
+    }
+
+
+def exclude_resolution_changes(dataset, resolution_changes) -> dict[str, list]:
+    """Dataset tanpa user/job yang resolusi skill-nya berubah"""
+    excluded_users = set(resolution_changes["users"])
+    excluded_jobs = set(resolution_changes["jobs"])
+    return {
+        "users_data": [
+            user
+            for user in dataset["users_data"]
+            if user["email"] not in excluded_users
+        ],
+        "jobs_data": [
+            job
+            for job in dataset["jobs_data"]
+            if job.get("job_url") not in excluded_jobs
+        ],
+    }
+
+
+def summarize_resolution_changes(
+    dataset, resolution_changes, max_excluded_ratio, sample_size=20
+) -> dict[str, any]:
+    """
+    Ringkasan pair yang tidak dibandingkan: jumlah, rasio terhadap semua pair,
+    alasan per nama skill. Dalam batas jika semua perbedaan berasal dari
+    alias/special case/normalisasi yang diharapkan dan rasio <= max_excluded_ratio.
+    """
+    excluded_users = set(resolution_changes["users"])
+    excluded_jobs = set(resolution_changes["jobs"])
+    job_urls = [job["job_url"] for job in dataset["jobs_data"] if "job_url" in job]
+    total_pairs = len(dataset["users_data"]) * len(job_urls)
+    excluded_pairs = [
+        (user["email"], job_url)
+        for user in dataset["users_data"]
+        for job_url in job_urls
+        if user["email"] in excluded_users or job_url in excluded_jobs
+    ]
+    excluded_ratio = len(excluded_pairs) / total_pairs if total_pairs else 0.0
+
+    reasons = {}
+    for change in resolution_changes["skills"]:
+        reasons[change["reason"]] = reasons.get(change["reason"], 0) + 1
+    unexpected_skills = [
+        change
+        for change in resolution_changes["skills"]
+        if change["reason"] not in EXPECTED_LEXICON_REASONS
+    ]
+
+    return {
+        "users": len(excluded_users),
+        "jobs": len(excluded_jobs),
+        "pairs": len(excluded_pairs),
+        "ratio": excluded_ratio,
+        "max_ratio": max_excluded_ratio,
+        "reasons": reasons,
+        "unexpected_skills": len(unexpected_skills),
+        "within_bound": not unexpected_skills
+        and (max_excluded_ratio is None or excluded_ratio <= max_excluded_ratio),
+        "samples": {
+            "users": resolution_changes["users"][:sample_size],
+            "jobs": resolution_changes["jobs"][:sample_size],
+            "pairs": [list(pair) for pair in excluded_pairs[:sample_size]],
+            "skills": resolution_changes["skills"][:sample_size],
+            "unexpected_skills": unexpected_skills[:sample_size],
+        },
+    }
+
+
+def time_parity_engine(engine, dataset, context) -> tuple[list[dict], float]:
+    """Jalankan engine dan ukur durasinya (tanpa persiapan graph bersama)"""
+    started_at = time.perf_counter()
+    match_results = run_parity_engine(engine, dataset, context)
+    return match_results, time.perf_counter() - started_at
+
+
+def index_matches(match_results) -> dict[tuple, dict]:
+    """
+    Index match per (user_email, job_url) beserta kategorinya. Kategori yang
+    sudah ada (baseline, rule asli) tidak dihitung ulang dengan bin.
+    """
+    uncategorized = categorize_match_results(
+        [dict(match) for match in match_results if "category" not in match]
+    )
+    return {
+        (match["user_email"], match["job_url"]): match
+        for match in [
+            *(match for match in match_results if "category" in match),
+            *uncategorized,
+        ]
+    }
+
+
+def compare_match_results(
+    reference_results, candidate_results, tolerance=1e-6, sample_size=20
+) -> dict[str, any]:
+    """
+    Bandingkan hasil dua engine per pair: delta score, pair yang hanya ada di
+    salah satu engine, dan kategori Strong/Mid/Weak yang berbeda.
+    """
+    reference_matches = index_matches(reference_results)
+    candidate_matches = index_matches(candidate_results)
+
+    missing_pairs = sorted(set(reference_matches) - set(candidate_matches))
+    extra_pairs = sorted(set(candidate_matches) - set(reference_matches))
+
+    deltas = []
+    category_disagreements = []
+    for pair in sorted(set(reference_matches) & set(candidate_matches)):
+        reference_match = reference_matches[pair]
+        candidate_match = candidate_matches[pair]
+        delta = candidate_match["similarity"] - reference_match["similarity"]
+        deltas.append((abs(delta), pair, reference_match, candidate_match))
+
+        if reference_match.get("category") != candidate_match.get("category"):
+            category_disagreements.append(
+                {
+                    "user_email": pair[0],
+                    "job_url": pair[1],
+                    "reference_similarity": reference_match["similarity"],
+                    "candidate_similarity": candidate_match["similarity"],
+                    "reference_category": reference_match.get("category"),
+                    "candidate_category": candidate_match.get("category"),
+                }
+            )
+
+    deltas.sort(key=lambda item: item[0], reverse=True)
+    absolute_deltas = [item[0] for item in deltas]
+    pairs_over_tolerance = sum(1 for delta in absolute_deltas if delta > tolerance)
+
+    return {
+        "reference_pairs": len(reference_matches),
+        "candidate_pairs": len(candidate_matches),
+        "compared_pairs": len(deltas),
+        "missing_pairs": len(missing_pairs),
+        "extra_pairs": len(extra_pairs),
+        "max_abs_delta": max(absolute_deltas, default=0.0),
+        "mean_abs_delta": (
+            sum(absolute_deltas) / len(absolute_deltas) if absolute_deltas else 0.0
+        ),
+        "pairs_over_tolerance": pairs_over_tolerance,
+        "category_disagreements": len(category_disagreements),
+        "samples": {
+            "largest_deltas": [
+                {
+                    "user_email": pair[0],
+                    "job_url": pair[1],
+                    "reference_similarity": reference_match["similarity"],
+                    "candidate_similarity": candidate_match["similarity"],
+                    "abs_delta": delta,
+                }
+                for delta, pair, reference_match, candidate_match in deltas[
+                    :sample_size
+                ]
+            ],
+            "missing_pairs": [list(pair) for pair in missing_pairs[:sample_size]],
+            "extra_pairs": [list(pair) for pair in extra_pairs[:sample_size]],
+            "category_disagreements": category_disagreements[:sample_size],
+        },
+        "parity": (
+            not missing_pairs
+            and not extra_pairs
+            and pairs_over_tolerance == 0
+            and not category_disagreements
+        ),
+    }
+
+
+def run_matching_parity(
+    dataset,
+    candidate,
+    reference=None,
+    tolerance=1e-6,
+    workers=2,
+    single_user_samples=20,
+    sample_size=20,
+    max_excluded_ratio=None,
+) -> dict[str, any]:
+    """
+    Shadow evaluation: jalankan engine referensi dan kandidat pada input yang
+    sama lalu laporkan delta score, beda kategori dan rasio speedup. Pair yang
+    dikecualikan karena lexicon ikut dilaporkan dan dibatasi max_excluded_ratio
+    (jika diisi).
+    """
+    family = get_engine_family(candidate)
+    reference = reference or PARITY_ENGINE_FAMILIES[family][0]
+    if get_engine_family(reference) != family:
+        raise ValueError(
+            f"Engine {reference} and {candidate} use different similarity formulas"
+        )
+
+    warm_up_matching_caches()
+
+    resolution_changes = {"users": [], "jobs": [], "skills": []}
+    if {reference, candidate} & set(BASELINE_ENGINES):
+        resolution_changes = find_lexicon_resolution_changes(dataset)
+    excluded = summarize_resolution_changes(
+        dataset, resolution_changes, max_excluded_ratio, sample_size
+    )
+    dataset = exclude_resolution_changes(dataset, resolution_changes)
+
+    context = {
+        "workers": workers,
+        "single_users": [user for user in dataset["users_data"] if user.get("skills")][
+            :single_user_samples
+        ],
+        "job_urls_by_uri": {
+            str(build_job_uri(job["job_url"])): job["job_url"]
+            for job in dataset["jobs_data"]
+            if "job_url" in job
+        },
+    }
+    if {reference, candidate} & {"python", "numpy", "parallel"}:
+        context["graph"] = build_matching_graph(dataset)
+
+    reference_results, reference_seconds = time_parity_engine(
+        reference, dataset, context
+    )
+    candidate_results, candidate_seconds = time_parity_engine(
+        candidate, dataset, context
+    )
+
+    comparison = compare_match_results(
+        reference_results, candidate_results, tolerance, sample_size
+    )
+
+    return {
+        "reference": reference,
+        "candidate": candidate,
+        "family": family,
+        "tolerance": tolerance,
+        "dataset": {
+            "users": len(dataset["users_data"]),
+            "jobs": len(dataset["jobs_data"]),
+            "single_user_samples": (
+                len(context["single_users"]) if family == "single_user" else None
+            ),
+            # Tidak dibandingkan dengan baseline: skill di-resolve berbeda oleh lexicon
+            "excluded_by_lexicon": excluded,
+        },
+        "config": {
+            "matching_top_k": settings.MATCHING_TOP_K,
+            "matching_min_score": settings.MATCHING_MIN_SCORE,
+            "matching_user_block_size": settings.MATCHING_USER_BLOCK_SIZE,
+            "workers": workers,
+        },
+        "timing": {
+            "reference_seconds": reference_seconds,
+            "candidate_seconds": candidate_seconds,
+            "speedup": (
+                reference_seconds / candidate_seconds if candidate_seconds > 0 else None
+            ),
+        },
+        **comparison,
+        "parity": comparison["parity"] and excluded["within_bound"],
+    }
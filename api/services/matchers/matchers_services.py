@@ -1,27 +1,56 @@
+from django.conf import settings
+
+from api.constants import TALENT_NAMESPACE
 from api.models import Maintenance
 from api.services.matchers.helper import update_task_progress
+from api.services.matchers.matchers_neo4j_backup_restore_services import BackupError
 from api.services.matchers.matchers_neo4j_services import (
+    apply_incremental_matching_to_neo4j,
+    delete_retired_generation,
+    get_job_skill_signatures_from_neo4j,
     get_jobs_from_neo4j,
+    get_user_skill_names,
+    get_user_skill_snapshot,
     get_users_from_neo4j,
     import_and_clean_neo4j_with_enrichment,
+    import_jobs_and_matches_staged,
+    import_jobs_and_matches_to_neo4j,
+    replace_user_job_matches,
     update_neo4j_for_specific_user,
 )
 from api.services.matchers.matchers_ontology_services import (
     add_user_job_matches_to_ontology,
-    apply_dynamic_categorization_pipeline,
-    build_temp_graph_for_user,
     calculate_all_user_job_similarities,
-    calculate_user_job_similarity_for_specific_user,
-    extract_categorized_matches_for_user,
+    calculate_categorized_matches_for_user_skills,
+    categorize_match_results,
     import_all_jobs_to_ontology,
     import_all_users_to_ontology,
     load_base_ontology,
 )
+from api.services.matchers.matchers_parallel_services import (
+    calculate_all_user_job_similarities_parallel,
+)
+from api.services.matchers.matchers_skill_lexicon_services import (
+    get_lexicon_skill_uri,
+    get_skill_lexicon,
+    resolve_skill_id,
+)
+from api.services.matchers.matchers_skill_taxonomy_services import get_skill_name
+from api.services.matchers.matchers_vectorized_services import (
+    score_users_against_jobs,
+)
 
 
 def matching_after_scraping(task_id, update_state_func=None, jobs_data=[]):
     try:
-        Maintenance.set_maintenance(True)
+        if settings.MATCHING_MODE == "incremental":
+            return incremental_matching_after_scraping(
+                task_id, update_state_func=update_state_func, jobs_data=jobs_data
+            )
+
+        # Mode native/staged tidak menghapus seluruh database, site tetap online
+        if settings.NEO4J_IMPORT_MODE in ("n10s", "chunked"):
+            Maintenance.set_maintenance(True)
 
         main_graph = load_base_ontology()
 
@@ -54,6 +83,8 @@ def matching_after_scraping(task_id, update_state_func=None, jobs_data=[]):
 
         main_graph = import_all_users_to_ontology(main_graph, users_data)
 
+        match_results = []
+
         if users_count > 0:
             if update_state_func:
                 update_task_progress(
@@ -63,9 +94,18 @@ def matching_after_scraping(task_id, update_state_func=None, jobs_data=[]):
                     update_state_func,
                 )
 
-            match_results = calculate_all_user_job_similarities(main_graph)
-
-            main_graph = add_user_job_matches_to_ontology(main_graph, match_results)
+            if settings.MATCHING_WORKERS > 1:
+                match_results = calculate_all_user_job_similarities_parallel(
+                    main_graph,
+                    settings.MATCHING_WORKERS,
+                    task_id=task_id,
+                    update_state_func=update_state_func,
+                    block_size=settings.MATCHING_USER_BLOCK_SIZE,
+                    top_k=settings.MATCHING_TOP_K,
+                    min_score=settings.MATCHING_MIN_SCORE,
+                )
+            else:
+                match_results = calculate_all_user_job_similarities(main_graph)
 
             if update_state_func:
                 update_task_progress(
@@ -75,16 +115,269 @@ def matching_after_scraping(task_id, update_state_func=None, jobs_data=[]):
                     update_state_func,
                 )
 
-            main_graph = apply_dynamic_categorization_pipeline(main_graph)
+            match_results = categorize_match_results(match_results)
 
-        import_and_clean_neo4j_with_enrichment(
-            main_graph,
-            users_data=users_data,
-            jobs_data=jobs_data,
-            missing_skills_map=missing_skills_map,
-            task_id=task_id,
-            update_state_func=update_state_func,
-        )
+        if settings.NEO4J_IMPORT_MODE in ("native", "staged"):
+            import_matching_results_natively(
+                main_graph,
+                match_results,
+                jobs_data,
+                task_id=task_id,
+                update_state_func=update_state_func,
+                user_skill_snapshot=get_user_skill_snapshot(users_data),
+            )
+        else:
+            main_graph = add_user_job_matches_to_ontology(main_graph, match_results)
+
+            import_and_clean_neo4j_with_enrichment(
+                main_graph,
+                users_data=users_data,
+                jobs_data=jobs_data,
+                missing_skills_map=missing_skills_map,
+                task_id=task_id,
+                update_state_func=update_state_func,
+                chunk_size=(
+                    settings.NEO4J_IMPORT_CHUNK_SIZE
+                    if settings.NEO4J_IMPORT_MODE == "chunked"
+                    else None
+                ),
+            )
+        Maintenance.set_maintenance(False)
+    except BackupError as e:
+        # Tanpa backup data live tidak aman, task harus gagal (status ERROR)
         Maintenance.set_maintenance(False)
+        print(f"[MATCHING_ERROR] Backup failed, import aborted: {str(e)}")
+        raise
     except Exception as e:
         Maintenance.set_maintenance(False)
+
+
+def split_job_skills(lexicon, required_skills) -> tuple[list[str], list[str]]:
+    """Pisahkan skill job menjadi nama Skill ontology dan AdditionalSkill"""
+    ontology_skills = []
+    additional_skills = []
+    for skill in required_skills or []:
+        skill_id = resolve_skill_id(lexicon, skill)
+        if skill_id is not None:
+            skill_name = get_skill_name(get_lexicon_skill_uri(lexicon, skill_id))
+            if skill_name not in ontology_skills:
+                ontology_skills.append(skill_name)
+        elif skill and skill.strip() and skill.strip() not in additional_skills:
+            additional_skills.append(skill.strip())
+
+    return ontology_skills, additional_skills
+
+
+def build_job_skill_rows(lexicon, jobs_data) -> tuple[list[dict], list[dict]]:
+    """Baris UNWIND {jobUrl, skill} untuk relasi REQUIRED_SKILL ke Skill dan AdditionalSkill"""
+    job_skill_rows = []
+    additional_skill_rows = []
+    for job in jobs_data:
+        ontology_skills, additional_skills = split_job_skills(
+            lexicon, job.get("required_skills")
+        )
+        job_skill_rows.extend(
+            {"jobUrl": job["job_url"], "skill": skill} for skill in ontology_skills
+        )
+        additional_skill_rows.extend(
+            {"jobUrl": job["job_url"], "skill": skill} for skill in additional_skills
+        )
+
+    return job_skill_rows, additional_skill_rows
+
+
+def import_matching_results_natively(
+    graph,
+    match_results,
+    jobs_data,
+    task_id=None,
+    update_state_func=None,
+    user_skill_snapshot=None,
+):
+    """
+    Tulis Job, Skill dan UserJobMatch langsung dari data Python ke Neo4j dengan
+    batch UNWIND, tanpa serialisasi Turtle, n10s maupun proses clean up.
+    User yang berubah sejak user_skill_snapshot di-match ulang setelah import.
+    """
+    if update_state_func:
+        update_task_progress(
+            task_id,
+            "IMPORTING_DATA_TO_NEO4J",
+            {},
+            update_state_func,
+        )
+
+    lexicon = get_skill_lexicon()
+    jobs_data = list(
+        {job["job_url"]: job for job in jobs_data if "job_url" in job}.values()
+    )
+
+    user_emails = {
+        str(user_uri): str(email)
+        for user_uri, email in graph.subject_objects(TALENT_NAMESPACE["email"])
+    }
+    job_keys = {
+        str(job_uri): str(job_key)
+        for job_uri, job_key in graph.subject_objects(TALENT_NAMESPACE["jobKey"])
+    }
+
+    match_rows = [
+        {
+            "email": user_emails[str(match["user"])],
+            "jobKey": job_keys[str(match["job"])],
+            "similarity": match["similarity"],
+            "category": match.get("category"),
+        }
+        for match in match_results
+    ]
+    job_skill_rows, additional_skill_rows = build_job_skill_rows(lexicon, jobs_data)
+
+    if settings.NEO4J_IMPORT_MODE == "staged":
+        import_jobs_and_matches = import_jobs_and_matches_staged
+    else:
+        import_jobs_and_matches = import_jobs_and_matches_to_neo4j
+
+    changed_user_emails = import_jobs_and_matches(
+        jobs_data,
+        job_skill_rows,
+        additional_skill_rows,
+        match_rows,
+        [get_skill_name(skill_uri) for skill_uri in lexicon["skill_uris"]],
+        batch_size=settings.NEO4J_IMPORT_BATCH_SIZE,
+        user_skill_snapshot=user_skill_snapshot,
+    )
+    rematch_changed_users(changed_user_emails)
+
+    if settings.NEO4J_IMPORT_MODE == "staged":
+        schedule_retired_generation_cleanup()
+
+
+def rematch_changed_users(user_emails):
+    """
+    Match ulang user yang register/update skill selama matching berjalan,
+    terhadap job aktif dan skill terbaru, dengan jalur yang sama seperti register.
+    """
+    if not user_emails:
+        return
+
+    jobs_data = get_jobs_from_neo4j()
+    user_skills = get_user_skill_names(user_emails)
+    for user_email in user_emails:
+        categorized_matches = calculate_categorized_matches_for_user_skills(
+            user_skills.get(user_email, []), jobs_data
+        )
+        replace_user_job_matches(user_email, categorized_matches)
+
+    print(
+        f"[MATCHING_INFO] Re-matched {len(user_emails)} users changed during matching"
+    )
+
+
+def schedule_retired_generation_cleanup():
+    """Hapus generation lama di background, langsung dijalankan jika Celery tidak tersedia"""
+    from api.tasks import cleanup_retired_graph_generation
+
+    try:
+        cleanup_retired_graph_generation.delay(settings.NEO4J_IMPORT_BATCH_SIZE)
+    except Exception as e:
+        print(
+            f"[STAGED_IMPORT_WARNING] Could not schedule cleanup, running inline: {str(e)}"
+        )
+        delete_retired_generation(settings.NEO4J_IMPORT_BATCH_SIZE)
+
+
+def incremental_matching_after_scraping(task_id, update_state_func=None, jobs_data=[]):
+    """
+    Matching setelah scraping yang hanya memproses delta: job baru/berubah
+    di-score terhadap semua user, job yang hilang dihapus beserta match-nya,
+    dan match job lain di Neo4j tidak disentuh.
+    """
+    if not jobs_data:
+        raise ValueError("Jobs is empty. Cannot proceed.")
+
+    if update_state_func:
+        update_task_progress(
+            task_id,
+            "IMPORTING_JOB_TO_ONTOLOGY",
+            {},
+            update_state_func,
+        )
+
+    lexicon = get_skill_lexicon()
+    existing_signatures = get_job_skill_signatures_from_neo4j()
+
+    incoming_jobs = {}
+    for job in jobs_data:
+        if "job_url" in job:
+            incoming_jobs[job["job_url"]] = job
+
+    delta_jobs = []
+    for job_url, job in incoming_jobs.items():
+        ontology_skills, additional_skills = split_job_skills(
+            lexicon, job.get("required_skills")
+        )
+        signature = frozenset(
+            skill.lower() for skill in ontology_skills + additional_skills
+        )
+        if existing_signatures.get(job_url) != signature:
+            delta_jobs.append(job)
+
+    job_skill_rows, additional_skill_rows = build_job_skill_rows(lexicon, delta_jobs)
+
+    removed_job_urls = [
+        job_url for job_url in existing_signatures if job_url not in incoming_jobs
+    ]
+    rescored_job_urls = [job["job_url"] for job in delta_jobs]
+
+    print(
+        f"[INCREMENTAL_INFO] {len(incoming_jobs)} incoming jobs: {len(delta_jobs)} new/changed, {len(removed_job_urls)} removed"
+    )
+
+    match_rows = []
+    users_data = get_users_from_neo4j()
+    if delta_jobs and users_data:
+        if update_state_func:
+            update_task_progress(
+                task_id,
+                "MATCHING_BETWEEN_USERS_AND_JOBS",
+                {},
+                update_state_func,
+            )
+
+        delta_matches = score_users_against_jobs(
+            users_data,
+            delta_jobs,
+            block_size=settings.MATCHING_USER_BLOCK_SIZE,
+            top_k=settings.MATCHING_TOP_K,
+            min_score=settings.MATCHING_MIN_SCORE,
+        )
+        for match in categorize_match_results(delta_matches):
+            match_rows.append(
+                {
+                    "email": match["user_email"],
+                    "jobKey": match["job_key"],
+                    "similarity": match["similarity"],
+                    "category": match["category"],
+                }
+            )
+
+    if update_state_func:
+        update_task_progress(
+            task_id,
+            "FINISHING_DATA",
+            {},
+            update_state_func,
+        )
+
+    changed_user_emails = apply_incremental_matching_to_neo4j(
+        list(incoming_jobs.values()),
+        rescored_job_urls,
+        removed_job_urls,
+        job_skill_rows,
+        additional_skill_rows,
+        match_rows,
+        [get_skill_name(skill_uri) for skill_uri in lexicon["skill_uris"]],
+        top_k=settings.MATCHING_TOP_K,
+        user_skill_snapshot=get_user_skill_snapshot(users_data),
+    )
+    rematch_changed_users(changed_user_emails)
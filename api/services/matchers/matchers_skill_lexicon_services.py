@@ -0,0 +1,134 @@
+import json
+import os
+
+from api.services.matchers.matchers_skill_taxonomy_services import (
+    get_skill_name,
+    get_skill_taxonomy,
+)
+
+SKILLS_DICTIONARY_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)),
+    "admin",
+    "scrapers",
+    "dictionary",
+    "skills_dictionary.json",
+)
+
+# Nama input yang ditulis berbeda dengan nama skill di ontology
+SKILL_SPECIAL_CASES = {
+    "c#": "cs",
+    "ci/cd": "ci cd",
+    "pl/sql": "pl sql",
+}
+
+_skill_lexicon_cache = {}
+
+
+def normalize_skill_name(skill_name) -> str:
+    """Lowercase dan rapikan spasi, dipakai untuk semua lookup lexicon"""
+    return " ".join(str(skill_name).lower().split())
+
+
+def load_skills_dictionary_aliases() -> dict[str, list[str]]:
+    """Load {main keyword: variants} dari skills_dictionary.json"""
+    try:
+        with open(SKILLS_DICTIONARY_PATH, "r", encoding="utf-8") as dictionary_file:
+            skills_dictionary = json.load(dictionary_file)
+    except Exception as e:
+        print(f"[SKILL_LEXICON_WARNING] Failed to load skills dictionary: {str(e)}")
+        return {}
+
+    aliases = {}
+    for group in skills_dictionary.values():
+        for main_keyword, variants in group.items():
+            aliases.setdefault(main_keyword, []).extend(variants)
+
+    return aliases
+
+
+def build_skill_lexicon(taxonomy, aliases) -> dict[str, int]:
+    """
+    Compile lookup nama ternormalisasi -> skill id (index taxonomy).
+    Prioritas: nama skill ontology, lalu special cases, lalu alias kamus skill.
+    """
+    skill_ids = {
+        normalize_skill_name(get_skill_name(skill_uri)): skill_id
+        for skill_id, skill_uri in enumerate(taxonomy["skill_uris"])
+    }
+
+    for skill_name, ontology_name in SKILL_SPECIAL_CASES.items():
+        if ontology_name in skill_ids:
+            skill_ids.setdefault(skill_name, skill_ids[ontology_name])
+
+    for main_keyword, variants in aliases.items():
+        names = [normalize_skill_name(name) for name in [main_keyword, *variants]]
+
+        # Satu grup kamus diarahkan ke skill ontology pertama yang dikenal
+        skill_id = next((skill_ids[name] for name in names if name in skill_ids), None)
+        if skill_id is None:
+            continue
+
+        for name in names:
+            skill_ids.setdefault(name, skill_id)
+
+    return skill_ids
+
+
+def get_skill_lexicon() -> dict[str, any]:
+    """Get skill lexicon, dibangun sekali per proses per versi ontology dan kamus skill"""
+    taxonomy = get_skill_taxonomy()
+    try:
+        dictionary_version = os.stat(SKILLS_DICTIONARY_PATH).st_mtime_ns
+    except OSError:
+        dictionary_version = None
+    lexicon_version = (taxonomy["ontology_hash"], dictionary_version)
+
+    lexicon = _skill_lexicon_cache.get(lexicon_version)
+    if lexicon is None:
+        lexicon = {
+            "skill_uris": taxonomy["skill_uris"],
+            "skill_ids": build_skill_lexicon(
+                taxonomy, load_skills_dictionary_aliases()
+            ),
+        }
+        _skill_lexicon_cache.clear()
+        _skill_lexicon_cache[lexicon_version] = lexicon
+        print(
+            f"[SKILL_LEXICON_INFO] Compiled {len(lexicon['skill_ids'])} names for {len(lexicon['skill_uris'])} skills"
+        )
+
+    return lexicon
+
+
+def resolve_skill_id(lexicon, skill_name) -> int | None:
+    """Resolve satu nama skill (input user/job) ke skill id"""
+    if not skill_name:
+        return None
+    return lexicon["skill_ids"].get(normalize_skill_name(skill_name))
+
+
+def resolve_skill_ids(lexicon, skill_names) -> tuple[list[int], list[str]]:
+    """Resolve list nama skill ke skill id unik, return (skill_ids, missing_skills)"""
+    lexicon_skill_ids = lexicon["skill_ids"]
+    skill_ids = []
+    missing_skills = []
+    for skill_name in skill_names or []:
+        skill_id = lexicon_skill_ids.get(normalize_skill_name(skill_name))
+        if skill_id is None:
+            missing_skills.append(skill_name)
+        elif skill_id not in skill_ids:
+            skill_ids.append(skill_id)
+
+    return skill_ids, missing_skills
+
+
+def resolve_skill_batches(
+    lexicon, skill_name_lists
+) -> list[tuple[list[int], list[str]]]:
+    """Resolve skill untuk banyak job/user sekaligus, satu lookup dict per nama skill"""
+    return [resolve_skill_ids(lexicon, skill_names) for skill_names in skill_name_lists]
+
+
+def get_lexicon_skill_uri(lexicon, skill_id) -> str:
+    """URI skill ontology untuk skill id"""
+    return lexicon["skill_uris"][skill_id]
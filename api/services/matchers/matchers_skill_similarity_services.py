@@ -0,0 +1,99 @@
+import os
+
+import numpy as np
+
+from api.services.matchers.matchers_skill_taxonomy_services import get_skill_taxonomy
+
+SIMILARITY_MATRIX_DIR = os.path.dirname(__file__)
+
+_skill_similarity_cache = {}
+
+
+def build_skill_similarity_matrix(taxonomy) -> np.ndarray:
+    """Hitung Sánchez similarity untuk semua pasangan skill di ontology"""
+    from api.services.matchers.matchers_ontology_services import sanchez_similarity
+
+    skill_uris = taxonomy["skill_uris"]
+    ancestors = taxonomy["ancestors"]
+    skill_count = len(skill_uris)
+
+    similarity_matrix = np.zeros((skill_count, skill_count), dtype=np.float32)
+    for i, skill_a in enumerate(skill_uris):
+        similarity_matrix[i, i] = sanchez_similarity(
+            ancestors[skill_a], ancestors[skill_a]
+        )
+        for j in range(i + 1, skill_count):
+            similarity = sanchez_similarity(ancestors[skill_a], ancestors[skill_uris[j]])
+            similarity_matrix[i, j] = similarity
+            similarity_matrix[j, i] = similarity
+
+    return similarity_matrix
+
+
+def get_similarity_matrix_path(ontology_hash: str) -> str:
+    """Path file .npy untuk versi ontology tertentu"""
+    return os.path.join(
+        SIMILARITY_MATRIX_DIR, f"ontology.{ontology_hash[:16]}.similarity.npy"
+    )
+
+
+def load_similarity_matrix_from_disk(path: str, skill_count: int) -> np.ndarray | None:
+    """Load matrix dari disk, return None jika tidak ada atau tidak valid"""
+    if not os.path.exists(path):
+        return None
+
+    try:
+        similarity_matrix = np.load(path, allow_pickle=False)
+    except Exception as e:
+        print(f"[SKILL_SIMILARITY_WARNING] Failed to load {path}: {str(e)}")
+        return None
+
+    if similarity_matrix.shape != (skill_count, skill_count):
+        print(
+            f"[SKILL_SIMILARITY_WARNING] Ignoring {path}: shape {similarity_matrix.shape} does not match {skill_count} skills"
+        )
+        return None
+
+    return similarity_matrix.astype(np.float32, copy=False)
+
+
+def save_similarity_matrix_to_disk(path: str, similarity_matrix: np.ndarray) -> None:
+    """Simpan matrix ke disk secara atomic supaya worker lain tidak membaca file setengah jadi"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as matrix_file:
+            np.save(matrix_file, similarity_matrix, allow_pickle=False)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"[SKILL_SIMILARITY_WARNING] Could not persist {path}: {str(e)}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def get_skill_similarity_matrix() -> np.ndarray:
+    """
+    Get matrix skill x skill (float32) untuk versi ontology saat ini.
+    Urutan baris/kolom mengikuti taxonomy["skill_index"].
+    """
+    taxonomy = get_skill_taxonomy()
+    ontology_hash = taxonomy["ontology_hash"]
+
+    similarity_matrix = _skill_similarity_cache.get(ontology_hash)
+    if similarity_matrix is not None:
+        return similarity_matrix
+
+    skill_count = len(taxonomy["skill_uris"])
+    path = get_similarity_matrix_path(ontology_hash)
+
+    similarity_matrix = load_similarity_matrix_from_disk(path, skill_count)
+    if similarity_matrix is None:
+        similarity_matrix = build_skill_similarity_matrix(taxonomy)
+        save_similarity_matrix_to_disk(path, similarity_matrix)
+        print(
+            f"[SKILL_SIMILARITY_INFO] Built {skill_count}x{skill_count} similarity matrix"
+        )
+
+    _skill_similarity_cache.clear()
+    _skill_similarity_cache[ontology_hash] = similarity_matrix
+
+    return similarity_matrix
@@ -0,0 +1,112 @@
+from rdflib import RDFS
+
+from api.constants import TALENT_NAMESPACE
+
+SKILLS_NODE = str(TALENT_NAMESPACE["Skills"])
+
+_skill_taxonomy_cache = {}
+
+
+def build_skill_taxonomy(graph, max_levels=5) -> dict[str, any]:
+    """
+    Build index ancestor untuk semua skill di ontology sekaligus.
+    Hasilnya sama dengan get_limited_ancestors, tapi dihitung sekali dari
+    seluruh edge rdfs:subClassOf tanpa SPARQL per level.
+    """
+    parents_map = {}
+    children_map = {}
+    for child, parent in graph.subject_objects(RDFS.subClassOf):
+        child_str = str(child)
+        parent_str = str(parent)
+        if child_str == parent_str:
+            continue
+        parents_map.setdefault(child_str, []).append(parent_str)
+        children_map.setdefault(parent_str, []).append(child_str)
+
+    # Semua subclass (transitif) dari Skills
+    skill_uris = set()
+    pending = [SKILLS_NODE]
+    while pending:
+        node = pending.pop()
+        for child in children_map.get(node, []):
+            if child not in skill_uris:
+                skill_uris.add(child)
+                pending.append(child)
+
+    skill_uris = sorted(skill_uris)
+    ancestors = {
+        skill_uri: collect_limited_ancestors(skill_uri, parents_map, max_levels)
+        for skill_uri in skill_uris
+    }
+
+    return {
+        "skill_uris": skill_uris,
+        "skill_index": {skill_uri: i for i, skill_uri in enumerate(skill_uris)},
+        "ancestors": ancestors,
+    }
+
+
+def get_skill_name(skill_uri) -> str:
+    """Nama skill dari URI, sama dengan property name di node Skill Neo4j"""
+    return str(skill_uri).split("/")[-1].replace("_", " ")
+
+
+def collect_limited_ancestors(skill_uri, parents_map, max_levels=5) -> frozenset:
+    """Traversal BFS yang sama dengan get_limited_ancestors, berhenti di node Skills"""
+    ancestors = {skill_uri}
+    current_level = [skill_uri]
+    level = 0
+    reached_skills_node = False
+
+    while current_level and level < max_levels and not reached_skills_node:
+        next_level = []
+        for node in current_level:
+            for parent in parents_map.get(node, []):
+                if parent == SKILLS_NODE:
+                    # Level ini tetap diselesaikan, level berikutnya tidak diproses
+                    reached_skills_node = True
+                    continue
+
+                if parent not in ancestors:
+                    ancestors.add(parent)
+                    next_level.append(parent)
+
+        current_level = next_level
+        level += 1
+
+    return frozenset(ancestors)
+
+
+def get_skill_taxonomy() -> dict[str, any]:
+    """Get skill taxonomy index, dibangun sekali per proses per versi ontology"""
+    from api.services.matchers.matchers_ontology_services import (
+        get_ontology_hash,
+        load_base_ontology,
+    )
+
+    ontology_version = get_ontology_hash()
+    taxonomy = _skill_taxonomy_cache.get(ontology_version)
+    if taxonomy is None:
+        taxonomy = build_skill_taxonomy(load_base_ontology())
+        taxonomy["ontology_hash"] = ontology_version
+        _skill_taxonomy_cache.clear()
+        _skill_taxonomy_cache[ontology_version] = taxonomy
+        print(
+            f"[SKILL_TAXONOMY_INFO] Indexed ancestors for {len(taxonomy['skill_uris'])} skills"
+        )
+
+    return taxonomy
+
+
+def get_skill_ids(taxonomy, skill_uris) -> list[int]:
+    """Map skill URI ke index matrix, skill di luar taxonomy diabaikan"""
+    skill_index = taxonomy["skill_index"]
+    skill_ids = []
+    for skill_uri in skill_uris:
+        skill_id = skill_index.get(str(skill_uri))
+        if skill_id is None:
+            print(f"[SKILL_TAXONOMY_WARNING] Skill {skill_uri} is not part of Skills")
+            continue
+        skill_ids.append(skill_id)
+
+    return skill_ids
@@ -0,0 +1,219 @@
+import numpy as np
+
+from api.constants import TALENT_NAMESPACE
+from api.services.matchers.helper import build_job_key
+from api.services.matchers.matchers_skill_similarity_services import (
+    get_skill_similarity_matrix,
+)
+from api.services.matchers.matchers_skill_lexicon_services import (
+    get_skill_lexicon,
+    resolve_skill_batches,
+)
+from api.services.matchers.matchers_skill_taxonomy_services import (
+    get_skill_ids,
+    get_skill_taxonomy,
+)
+
+
+def pad_similarity_matrix(similarity_matrix) -> np.ndarray:
+    """Tambah satu baris/kolom nol di index terakhir sebagai padding skill"""
+    skill_count = similarity_matrix.shape[0]
+    padded_matrix = np.zeros((skill_count + 1, skill_count + 1), dtype=np.float32)
+    padded_matrix[:skill_count, :skill_count] = similarity_matrix
+    return padded_matrix
+
+
+def encode_skill_id_lists(skill_id_lists, pad_id) -> np.ndarray:
+    """Encode list of skill id (panjang berbeda-beda) ke array 2D dengan padding"""
+    max_length = max((len(skill_ids) for skill_ids in skill_id_lists), default=0)
+    encoded = np.full((len(skill_id_lists), max(max_length, 1)), pad_id, dtype=np.int32)
+    for row, skill_ids in enumerate(skill_id_lists):
+        encoded[row, : len(skill_ids)] = skill_ids
+    return encoded
+
+
+def build_best_match_table(
+    job_skill_id_lists, padded_matrix, job_chunk_size=2048
+) -> np.ndarray:
+    """
+    Hitung best[k, j] = max similarity skill k terhadap semua skill job j.
+    Baris padding (index terakhir) selalu nol.
+    """
+    pad_id = padded_matrix.shape[0] - 1
+    job_skill_ids = encode_skill_id_lists(job_skill_id_lists, pad_id)
+
+    best_match = np.zeros((padded_matrix.shape[0], len(job_skill_id_lists)), np.float32)
+    for start in range(0, len(job_skill_id_lists), job_chunk_size):
+        chunk = job_skill_ids[start : start + job_chunk_size]
+        best_match[:, start : start + len(chunk)] = padded_matrix[:, chunk].max(axis=2)
+
+    return best_match
+
+
+def score_user_block(user_skill_id_lists, best_match) -> np.ndarray:
+    """
+    Hitung scores (jumlah user x jumlah job) berisi rata-rata best match per skill user
+    (rumus all-users aggregate_skill_similarities). Penjumlahan dilakukan berurutan
+    per skill (float64) seperti sum() di engine python.
+    """
+    pad_id = best_match.shape[0] - 1
+    user_skill_ids = encode_skill_id_lists(user_skill_id_lists, pad_id)
+    user_skill_counts = np.array([len(skill_ids) for skill_ids in user_skill_id_lists])
+
+    scores = np.zeros((len(user_skill_id_lists), best_match.shape[1]), dtype=np.float64)
+    for position in range(user_skill_ids.shape[1]):
+        scores += best_match[user_skill_ids[:, position]]
+    scores /= user_skill_counts[:, None]
+
+    return scores
+
+
+def select_match_indices(scores, top_k=0, min_score=0.0) -> tuple:
+    """
+    Return (rows, columns) pair yang disimpan: similarity > 0, >= min_score, dan
+    hanya top_k job tertinggi per user (top_k 0 = semua). Job dengan index lebih
+    kecil menang jika score sama, urutan hasil tetap per user lalu per job.
+    """
+    keep = (scores > 0) & (scores >= min_score)
+
+    if 0 < top_k < scores.shape[1]:
+        top_columns = np.argsort(-scores, axis=1, kind="stable")[:, :top_k]
+        in_top_k = np.zeros_like(keep)
+        np.put_along_axis(in_top_k, top_columns, True, axis=1)
+        keep &= in_top_k
+
+    return np.nonzero(keep)
+
+
+def iter_user_job_score_blocks(
+    user_skill_id_lists, job_skill_id_lists, similarity_matrix, block_size=256
+):
+    """Yield (offset, scores) per blok user untuk semua job"""
+    best_match = build_best_match_table(
+        job_skill_id_lists, pad_similarity_matrix(similarity_matrix)
+    )
+
+    for start in range(0, len(user_skill_id_lists), block_size):
+        yield start, score_user_block(
+            user_skill_id_lists[start : start + block_size], best_match
+        )
+
+
+def extract_users_and_jobs_skill_ids(graph, taxonomy):
+    """Ambil user dan job beserta skill id-nya dari graph tanpa SPARQL per node"""
+    users_query = """
+    SELECT ?user ?email
+    WHERE {
+        ?user rdf:type <http://www.semanticweb.org/kota203/ontologies/2025/3/talent-matching-ontology/User> .
+        ?user <http://www.semanticweb.org/kota203/ontologies/2025/3/talent-matching-ontology/email> ?email .
+    }
+    """
+
+    jobs_query = """
+    SELECT ?job
+    WHERE {
+        ?job rdf:type <http://www.semanticweb.org/kota203/ontologies/2025/3/talent-matching-ontology/Job> .
+    }
+    """
+
+    users = []
+    for row in graph.query(users_query):
+        user_skill_ids = get_skill_ids(
+            taxonomy, graph.objects(row[0], TALENT_NAMESPACE["HAS_SKILL"])
+        )
+        if user_skill_ids:
+            users.append((row[0], user_skill_ids))
+
+    jobs = []
+    for row in graph.query(jobs_query):
+        job_skill_ids = get_skill_ids(
+            taxonomy, graph.objects(row[0], TALENT_NAMESPACE["REQUIRED_SKILL"])
+        )
+        if job_skill_ids:
+            jobs.append((row[0], job_skill_ids))
+
+    return users, jobs
+
+
+def calculate_all_user_job_similarities_vectorized(
+    graph, block_size=256, top_k=0, min_score=0.0
+):
+    """Versi NumPy dari calculate_all_user_job_similarities dengan hasil yang sama"""
+    taxonomy = get_skill_taxonomy()
+    users, jobs = extract_users_and_jobs_skill_ids(graph, taxonomy)
+
+    match_results = []
+    if not users or not jobs:
+        return match_results
+
+    for offset, scores in iter_user_job_score_blocks(
+        [user_skill_ids for _, user_skill_ids in users],
+        [job_skill_ids for _, job_skill_ids in jobs],
+        get_skill_similarity_matrix(),
+        block_size,
+    ):
+        for row, column in zip(*select_match_indices(scores, top_k, min_score)):
+            match_results.append(
+                {
+                    "user": users[offset + row][0],
+                    "job": jobs[column][0],
+                    "similarity": float(scores[row, column]),
+                }
+            )
+
+    return match_results
+
+
+def score_users_against_jobs(
+    users_data, jobs_data, block_size=256, top_k=0, min_score=0.0
+):
+    """
+    Score user x job langsung dari data Neo4j/scraping (nama skill), tanpa graph RDF.
+    Return list of {"user_email", "job_url", "job_key", "similarity"} untuk
+    similarity > 0.
+    """
+    lexicon = get_skill_lexicon()
+
+    users_data = users_data or []
+    users = [
+        (user["email"], user_skill_ids)
+        for user, (user_skill_ids, _) in zip(
+            users_data,
+            resolve_skill_batches(lexicon, [user.get("skills") for user in users_data]),
+        )
+        if user_skill_ids
+    ]
+
+    jobs_data = [job for job in jobs_data or [] if "job_url" in job]
+    jobs = [
+        (job["job_url"], job_skill_ids)
+        for job, (job_skill_ids, _) in zip(
+            jobs_data,
+            resolve_skill_batches(
+                lexicon, [job.get("required_skills") for job in jobs_data]
+            ),
+        )
+        if job_skill_ids
+    ]
+
+    match_results = []
+    if not users or not jobs:
+        return match_results
+
+    for offset, scores in iter_user_job_score_blocks(
+        [user_skill_ids for _, user_skill_ids in users],
+        [job_skill_ids for _, job_skill_ids in jobs],
+        get_skill_similarity_matrix(),
+        block_size,
+    ):
+        for row, column in zip(*select_match_indices(scores, top_k, min_score)):
+            match_results.append(
+                {
+                    "user_email": users[offset + row][0],
+                    "job_url": jobs[column][0],
+                    "job_key": build_job_key(jobs[column][0]),
+                    "similarity": float(scores[row, column]),
+                }
+            )
+
+    return match_results
@@ -6,6 +6,7 @@ from neomodel import db
 
 from api.models import Maintenance, MatchingTask, ScrapingTask
 from api.services.admin.scrapers.scraper_services import scrape_all_websites
+from api.services.matchers.matchers_neo4j_services import delete_retired_generation
 from api.services.matchers.matchers_services import matching_after_scraping
 
 
@@ -161,3 +162,9 @@ def matching_job_after_scraping(self, jobs_data=[]):
 
         # Re-raise the exception so Celery marks the task as FAILURE
         raise e
+
+
+@shared_task
+def cleanup_retired_graph_generation(batch_size=1000):
+    """Task Celery untuk menghapus data generation lama setelah staged import"""
+    return delete_retired_generation(batch_size)
@@ -1,3 +1,1296 @@
-from django.test import TestCase
+import io
+import json
+import random
+import re
+import tempfile
+from unittest import mock, skipUnless
 
-# Create your tests here.
+import billiard
+import numpy as np
+from celery import Celery
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+
+from neomodel import db
+from rdflib import RDF, BNode, Graph
+from rdflib.compare import isomorphic
+from selenium.webdriver import ChromeOptions
+
+from api.constants import TALENT_NAMESPACE
+from api.services.admin.scrapers import (
+    glints_scraper,
+    helper,
+    kalibrr_scraper,
+    scraper_corpus,
+)
+from api.services.admin.scrapers.driver_pool import scrape_job_details_in_parallel
+from api.services.admin.scrapers.http_scraper import (
+    create_http_session,
+    fetch_job_details_over_http,
+    fetch_page_source,
+)
+from api.services.admin.scrapers.scraper_corpus import (
+    record_page,
+    start_corpus_server,
+)
+from api.services.matchers.helper import build_job_key
+from api.services.matchers.matchers_baseline_services import get_limited_ancestors
+from api.services.matchers.matchers_benchmark_services import (
+    fit_scaling_curves,
+    generate_benchmark_dataset,
+    get_ontology_skill_names,
+    get_peak_rss_mb,
+    run_matching_benchmark,
+)
+from api.services.matchers.matchers_neo4j_backup_restore_services import (
+    BackupError,
+    load_backup,
+    perform_full_dynamic_backup,
+    perform_full_dynamic_restore_with_enrichment,
+)
+from api.services.matchers.matchers_neo4j_services import (
+    apply_incremental_matching_to_neo4j,
+    get_user_skill_snapshot,
+    get_users_changed_since,
+    import_and_clean_neo4j_with_enrichment,
+    import_jobs_and_matches_staged,
+    import_jobs_and_matches_to_neo4j,
+    iter_ntriples_chunks,
+)
+from api.services.matchers.matchers_ontology_services import (
+    aggregate_skill_similarities,
+    calculate_categorized_matches_for_user_skills,
+    categorize_similarity_score,
+    categorize_similarity_scores,
+    get_match_category_rules,
+    import_all_jobs_to_ontology,
+    load_base_ontology,
+    pop_top_k_matches,
+    push_top_k_match,
+    sanchez_similarity,
+)
+from api.services.matchers.matchers_parallel_services import (
+    calculate_all_user_job_similarities_parallel,
+)
+from api.services.matchers.matchers_parity_services import (
+    build_matching_graph,
+    classify_lexicon_resolution_change,
+    run_matching_parity,
+)
+from api.services.matchers.matchers_services import (
+    incremental_matching_after_scraping,
+    matching_after_scraping,
+)
+from api.services.matchers.matchers_skill_lexicon_services import (
+    get_skill_lexicon,
+    resolve_skill_ids,
+)
+from api.services.matchers.matchers_skill_similarity_services import (
+    get_skill_similarity_matrix,
+)
+from api.services.matchers.matchers_skill_taxonomy_services import (
+    get_skill_name,
+    get_skill_taxonomy,
+)
+from api.services.matchers.matchers_vectorized_services import score_users_against_jobs
+
+
+def is_neo4j_available() -> bool:
+    try:
+        db.cypher_query("RETURN 1")
+        return True
+    except Exception:
+        return False
+
+
+# Task bound dijalankan dengan apply(), self.request.id hanya ada di thread task
+celery_test_app = Celery("tests", broker="memory://", backend="cache+memory://")
+
+
+def build_progress_recorder(task, progress):
+    """update_state_func yang meneruskan ke task.update_state dan mencatat scraped_jobs"""
+
+    def update_state(state, meta):
+        task.update_state(state=state, meta=meta)
+        progress.append(meta["scraped_jobs"])
+
+    return update_state
+
+
+@celery_test_app.task(bind=True)
+def scrape_in_bound_task(self, job_urls):
+    """Jalankan driver pool dari task bound, return (jobs, progress scraped_jobs)"""
+    progress = []
+
+    with mock.patch(
+        "api.services.admin.scrapers.driver_pool.open_authenticated_driver",
+        return_value=object(),
+    ), mock.patch("api.services.admin.scrapers.driver_pool.close_driver"):
+        job_details = scrape_job_details_in_parallel(
+            self.request.id,
+            job_urls,
+            lambda driver, job_url, task_id: {"job_url": job_url},
+            object(),
+            [],
+            "https://test.local",
+            "SCRAPING_JOB_DETAILS",
+            {"scraped_jobs": 0},
+            build_progress_recorder(self, progress),
+            workers=2,
+        )
+
+    return job_details, progress
+
+
+@celery_test_app.task(bind=True)
+def fetch_over_http_in_bound_task(self, job_urls):
+    """Jalankan fetcher HTTP dari task bound, return (detail, gagal, progress)"""
+    progress = []
+    job_details, failed_positions = fetch_job_details_over_http(
+        self.request.id,
+        create_http_session(),
+        job_urls,
+        glints_scraper.parse_job_details,
+        "SCRAPING_JOB_DETAILS",
+        {"scraped_jobs": 0},
+        build_progress_recorder(self, progress),
+    )
+
+    return job_details, failed_positions, progress
+
+
+def build_matching_fixture(user_count=8, job_count=10, seed=0) -> dict[str, list]:
+    """Dataset kecil dengan nama skill persis seperti di ontology.ttl"""
+    rng = random.Random(seed)
+    skill_names = get_ontology_skill_names()
+
+    return {
+        "users_data": [
+            {
+                "uid": f"user-{i}",
+                "email": f"user{i}@test.local",
+                "skills": rng.sample(skill_names, rng.randint(1, 5)),
+            }
+            for i in range(user_count)
+        ]
+        + [{"uid": "user-empty", "email": "empty@test.local", "skills": []}],
+        "jobs_data": [
+            {
+                "job_url": f"https://test.local/jobs/{i}",
+                "required_skills": rng.sample(skill_names, rng.randint(1, 5))
+                + ["skill yang tidak ada"],
+            }
+            for i in range(job_count)
+        ],
+    }
+
+
+class MatchingBenchmarkTest(SimpleTestCase):
+    """Benchmark offline skala kecil, dataset deterministik per seed"""
+
+    def test_dataset_is_deterministic_per_seed(self):
+        dataset = generate_benchmark_dataset(5, 8, seed=1)
+
+        self.assertEqual(dataset, generate_benchmark_dataset(5, 8, seed=1))
+        self.assertNotEqual(dataset, generate_benchmark_dataset(5, 8, seed=2))
+        self.assertEqual(len(dataset["users_data"]), 5)
+        self.assertEqual(len(dataset["jobs_data"]), 8)
+
+    def test_scaling_curve_exponents(self):
+        curves = fit_scaling_curves(
+            [
+                {
+                    "scale": scale,
+                    "stages": [
+                        {"stage": "quadratic", "seconds": quadratic_seconds},
+                        {"stage": "instant", "seconds": instant_seconds},
+                    ],
+                }
+                for scale, quadratic_seconds, instant_seconds in (
+                    (10, 1.0, 0.0),
+                    (100, 100.0, 1.0),
+                )
+            ]
+        )
+
+        self.assertEqual(curves["quadratic"]["scales"], [10, 100])
+        self.assertEqual(curves["quadratic"]["exponents"], [2.0])
+        self.assertEqual(curves["instant"]["exponents"], [None])
+
+    def test_small_scale_run_skips_stages_over_budget(self):
+        for budget, skipped_stages in (
+            (1_000_000, []),
+            (50, ["match_all_python", "match_single_user_baseline"]),
+        ):
+            with self.subTest(reference_pair_budget=budget):
+                report = run_matching_benchmark(
+                    scales=[10], single_user_samples=1, reference_pair_budget=budget
+                )
+                (scale_report,) = report["results"]
+                stages = [stats["stage"] for stats in scale_report["stages"]]
+
+                self.assertEqual(scale_report["pairs"], 100)
+                self.assertEqual(scale_report["skipped_stages"], skipped_stages)
+                self.assertIn("match_all_numpy", stages)
+                for stage in skipped_stages:
+                    self.assertNotIn(stage, stages)
+                    self.assertNotIn(stage, report["scaling_curves"])
+
+    def test_command_writes_json_report(self):
+        stdout = io.StringIO()
+        call_command(
+            "benchmark_matching",
+            "--scales=10",
+            "--engines=numpy",
+            "--single-user-samples=1",
+            stdout=stdout,
+            stderr=io.StringIO(),
+        )
+
+        report = json.loads(stdout.getvalue())
+        self.assertEqual(report["config"]["scales"], [10])
+        self.assertIn("match_all_numpy", report["scaling_curves"])
+
+    def test_peak_rss_unit_per_platform(self):
+        benchmark_services = "api.services.matchers.matchers_benchmark_services"
+        for platform_name, ru_maxrss in (("linux", 2**20), ("darwin", 2**30)):
+            with self.subTest(platform=platform_name), mock.patch(
+                f"{benchmark_services}.sys.platform", platform_name
+            ), mock.patch(
+                f"{benchmark_services}.resource.getrusage",
+                return_value=mock.Mock(ru_maxrss=ru_maxrss),
+            ):
+                self.assertEqual(get_peak_rss_mb(), 1024)
+
+
+class MatchingEngineParityTest(SimpleTestCase):
+    """Semua engine harus sama dengan jalur asli (SPARQL + Sánchez per pair)"""
+
+    def assert_parity(self, candidate, **kwargs):
+        report = run_matching_parity(build_matching_fixture(), candidate, **kwargs)
+        self.assertEqual(report["dataset"]["excluded_by_lexicon"]["users"], 0)
+        self.assertEqual(report["dataset"]["excluded_by_lexicon"]["jobs"], 0)
+        self.assertGreater(report["compared_pairs"], 0)
+        self.assertTrue(report["parity"], report["samples"])
+
+    def test_all_users_engines_match_baseline(self):
+        for candidate in ("python", "numpy", "direct"):
+            with self.subTest(candidate=candidate):
+                self.assert_parity(candidate)
+
+    def test_parallel_engine_matches_baseline(self):
+        self.assert_parity("parallel", workers=2)
+
+    def test_single_user_engine_matches_baseline(self):
+        self.assert_parity("single_user_direct", single_user_samples=4)
+
+    @override_settings(MATCHING_TOP_K=3, MATCHING_MIN_SCORE=0.3)
+    def test_top_k_and_min_score_match_baseline(self):
+        for candidate in ("python", "numpy", "direct", "single_user_direct"):
+            with self.subTest(candidate=candidate):
+                self.assert_parity(candidate)
+
+    def test_lexicon_only_names_are_excluded_from_baseline(self):
+        dataset = build_matching_fixture()
+        dataset["users_data"][0]["skills"] = [
+            f"  {skill.upper()} " for skill in dataset["users_data"][0]["skills"]
+        ]
+
+        report = run_matching_parity(dataset, "numpy", max_excluded_ratio=0.2)
+
+        excluded = report["dataset"]["excluded_by_lexicon"]
+        self.assertEqual(excluded["samples"]["users"], ["user0@test.local"])
+        self.assertEqual(excluded["pairs"], len(dataset["jobs_data"]))
+        self.assertEqual(set(excluded["reasons"]), {"normalized_name"})
+        self.assertTrue(report["parity"])
+
+    def test_excluded_pairs_match_the_expected_alias_mapping(self):
+        dataset = build_matching_fixture()
+        dataset["users_data"][0]["skills"] = ["CI/CD", "PL/SQL"]
+        dataset["jobs_data"][0]["required_skills"] = ["js", "ci cd"]
+
+        report = run_matching_parity(dataset, "numpy", max_excluded_ratio=0.5)
+
+        excluded = report["dataset"]["excluded_by_lexicon"]
+        self.assertEqual(excluded["users"], 1)
+        self.assertEqual(excluded["jobs"], 1)
+        self.assertEqual(
+            excluded["pairs"],
+            len(dataset["users_data"]) + len(dataset["jobs_data"]) - 1,
+        )
+        self.assertEqual(
+            {
+                change["skill"]: (
+                    change["reason"],
+                    change["lexicon_skill"].rsplit("/", 1)[-1],
+                )
+                for change in excluded["samples"]["skills"]
+            },
+            {
+                "CI/CD": ("special_case", "CI_CD"),
+                "PL/SQL": ("special_case", "PL_SQL"),
+                "js": ("dictionary_alias", "JavaScript"),
+            },
+        )
+        self.assertEqual(excluded["unexpected_skills"], 0)
+        self.assertTrue(report["parity"], report["samples"])
+
+    def test_too_many_excluded_pairs_fail_parity(self):
+        dataset = build_matching_fixture()
+        dataset["users_data"][0]["skills"] = ["CI/CD"]
+
+        report = run_matching_parity(dataset, "numpy", max_excluded_ratio=0.0)
+
+        self.assertFalse(report["dataset"]["excluded_by_lexicon"]["within_bound"])
+        self.assertFalse(report["parity"])
+
+    def test_unknown_resolution_change_is_unexpected(self):
+        self.assertEqual(
+            classify_lexicon_resolution_change(
+                "skill internal kantor", TALENT_NAMESPACE["Python"], set()
+            ),
+            "unexpected",
+        )
+        self.assertEqual(
+            classify_lexicon_resolution_change("golang", None, {"golang"}),
+            "unexpected",
+        )
+
+
+def score_parallel_in_daemon_process(result_queue):
+    """Jalankan engine parallel di proses daemon seperti child Celery prefork"""
+    graph, user_emails, job_urls = build_matching_graph(build_matching_fixture())
+    result_queue.put(
+        sorted(
+            (user_emails[str(match["user"])], job_urls[str(match["job"])])
+            for match in calculate_all_user_job_similarities_parallel(graph, 2)
+        )
+    )
+
+
+class ParallelMatchingTest(SimpleTestCase):
+    """Pool matching harus tetap jalan dari proses daemon (child Celery prefork)"""
+
+    def test_parallel_engine_runs_inside_daemon_process(self):
+        context = billiard.get_context("fork")
+        result_queue = context.Queue()
+        process = context.Process(
+            target=score_parallel_in_daemon_process, args=(result_queue,)
+        )
+        process.daemon = True
+        process.start()
+        daemon_pairs = result_queue.get(timeout=120)
+        process.join(timeout=30)
+
+        reference = run_matching_parity(build_matching_fixture(), "numpy")
+        self.assertEqual(process.exitcode, 0)
+        self.assertEqual(len(daemon_pairs), reference["reference_pairs"])
+
+
+class MatchingAfterScrapingTest(SimpleTestCase):
+    @override_settings(MATCHING_MODE="incremental")
+    def test_incremental_failure_is_handled_like_full_matching(self):
+        with mock.patch(
+            "api.services.matchers.matchers_services.incremental_matching_after_scraping",
+            side_effect=ValueError("Jobs is empty. Cannot proceed."),
+        ), mock.patch(
+            "api.services.matchers.matchers_services.Maintenance"
+        ) as maintenance:
+            matching_after_scraping("task-id", jobs_data=[])
+
+        maintenance.set_maintenance.assert_called_with(False)
+
+    @override_settings(MATCHING_MODE="full")
+    def test_backup_failure_fails_the_task(self):
+        with mock.patch(
+            "api.services.matchers.matchers_services.load_base_ontology",
+            side_effect=BackupError("Cannot create backup folder"),
+        ), mock.patch(
+            "api.services.matchers.matchers_services.Maintenance"
+        ) as maintenance:
+            with self.assertRaises(BackupError):
+                matching_after_scraping("task-id", jobs_data=[])
+
+        maintenance.set_maintenance.assert_called_with(False)
+
+
+class IncrementalMatchingTest(SimpleTestCase):
+    """Delta scraping: hanya job baru/berubah yang di-score ulang"""
+
+    def setUp(self):
+        self.skill_names = get_ontology_skill_names()[:3]
+        self.job_urls = [f"https://test.local/jobs/{i}" for i in range(4)]
+
+    @override_settings(MATCHING_TOP_K=0, MATCHING_MIN_SCORE=0.0)
+    def test_jobs_are_split_into_new_changed_removed_and_unchanged(self):
+        unchanged_url, changed_url, new_url, removed_url = self.job_urls
+        existing_signatures = {
+            unchanged_url: frozenset(
+                [self.skill_names[0].lower(), "skill internal kantor"]
+            ),
+            changed_url: frozenset([self.skill_names[1].lower()]),
+            removed_url: frozenset([self.skill_names[2].lower()]),
+        }
+        jobs_data = [
+            # Hanya beda huruf besar/kecil, tidak di-score ulang
+            {
+                "job_url": unchanged_url,
+                "required_skills": [
+                    self.skill_names[0].upper(),
+                    "SKILL INTERNAL KANTOR",
+                ],
+            },
+            {"job_url": changed_url, "required_skills": [self.skill_names[2]]},
+            {"job_url": new_url, "required_skills": [self.skill_names[1]]},
+        ]
+        users_data = [
+            {"uid": "user-0", "email": "user@test.local", "skills": self.skill_names}
+        ]
+
+        matchers_services = "api.services.matchers.matchers_services"
+        with mock.patch(
+            f"{matchers_services}.get_job_skill_signatures_from_neo4j",
+            return_value=existing_signatures,
+        ), mock.patch(
+            f"{matchers_services}.get_users_from_neo4j", return_value=users_data
+        ), mock.patch(
+            f"{matchers_services}.apply_incremental_matching_to_neo4j",
+            return_value=[],
+        ) as apply_incremental, mock.patch(
+            f"{matchers_services}.rematch_changed_users"
+        ):
+            incremental_matching_after_scraping("task-id", jobs_data=jobs_data)
+
+        (
+            incoming_jobs,
+            rescored_job_urls,
+            removed_job_urls,
+            job_skill_rows,
+            additional_skill_rows,
+            match_rows,
+            _,
+        ) = apply_incremental.call_args.args
+
+        self.assertEqual(incoming_jobs, jobs_data)
+        self.assertEqual(rescored_job_urls, [changed_url, new_url])
+        self.assertEqual(removed_job_urls, [removed_url])
+        self.assertEqual(
+            {row["jobUrl"] for row in job_skill_rows}, {changed_url, new_url}
+        )
+        self.assertEqual(additional_skill_rows, [])
+        self.assertEqual(
+            {row["jobKey"] for row in match_rows},
+            {build_job_key(changed_url), build_job_key(new_url)},
+        )
+
+    def test_only_rescored_users_are_pruned_back_to_top_k(self):
+        db = mock.patch("api.services.matchers.matchers_neo4j_services.db").start()
+        self.addCleanup(mock.patch.stopall)
+        db.cypher_query.return_value = ([], None)
+        unchanged_url, changed_url, _, removed_url = self.job_urls
+        match_rows = [
+            {"email": email, "jobKey": "key", "similarity": 0.9, "category": "Strong"}
+            for email in ("b@test.local", "a@test.local", "b@test.local")
+        ]
+
+        apply_incremental_matching_to_neo4j(
+            [{"job_url": unchanged_url}, {"job_url": changed_url}],
+            [changed_url],
+            [removed_url],
+            [],
+            [],
+            match_rows,
+            [],
+            top_k=2,
+        )
+
+        queries = [(call.args + (None,))[:2] for call in db.cypher_query.call_args_list]
+        deleted_match_job_urls = [
+            params["rows"]
+            for query, params in queries
+            if "(m:UserJobMatch)-[:JOB_MATCH]->" in query
+        ]
+        self.assertEqual(deleted_match_job_urls, [[removed_url], [changed_url]])
+        prune_params = [
+            params for query, params in queries if "pruned_matches" in query
+        ]
+        self.assertEqual(
+            prune_params, [{"top_k": 2, "rows": ["a@test.local", "b@test.local"]}]
+        )
+
+
+class UsersChangedDuringMatchingTest(SimpleTestCase):
+    """Match dari register/update profile selama matching tidak boleh ditimpa"""
+
+    users_data = [
+        {"email": "same@test.local", "skills": ["Python"]},
+        {"email": "updated@test.local", "skills": ["Java"]},
+    ]
+    live_users = [
+        ["same@test.local", ["python"]],
+        ["updated@test.local", ["java", "sql"]],
+        ["registered@test.local", ["python"]],
+    ]
+
+    def mock_db(self):
+        def cypher_query(query, params=None):
+            if "HAS_SKILL" in query:
+                return self.live_users, None
+            return [], None
+
+        db = mock.patch("api.services.matchers.matchers_neo4j_services.db").start()
+        self.addCleanup(mock.patch.stopall)
+        db.cypher_query.side_effect = cypher_query
+        return db
+
+    def test_changed_users_are_detected_from_snapshot(self):
+        self.mock_db()
+        self.assertEqual(
+            get_users_changed_since(get_user_skill_snapshot(self.users_data)),
+            ["registered@test.local", "updated@test.local"],
+        )
+
+    def test_import_keeps_matches_of_changed_users(self):
+        db = self.mock_db()
+        match_rows = [
+            {"email": email, "jobKey": "key", "similarity": 0.9, "category": "Strong"}
+            for email, _ in self.live_users
+        ]
+
+        changed_user_emails = apply_incremental_matching_to_neo4j(
+            [{"job_url": "https://test.local/jobs/0"}],
+            ["https://test.local/jobs/0"],
+            [],
+            [],
+            [],
+            match_rows,
+            [],
+            user_skill_snapshot=get_user_skill_snapshot(self.users_data),
+        )
+
+        self.assertEqual(
+            changed_user_emails, ["registered@test.local", "updated@test.local"]
+        )
+        db.commit.assert_called_once()
+        for query, params in (
+            (call.args + (None,))[:2] for call in db.cypher_query.call_args_list
+        ):
+            if "CREATE (m:UserJobMatch" in query:
+                self.assertEqual(
+                    [row["email"] for row in params["rows"]], ["same@test.local"]
+                )
+            if "u.email IN $changed_user_emails" in query:
+                self.assertEqual(params["changed_user_emails"], changed_user_emails)
+
+    def test_staged_flip_keeps_matches_of_changed_users(self):
+        db = self.mock_db()
+
+        changed_user_emails = import_jobs_and_matches_staged(
+            [{"job_url": "https://test.local/jobs/0"}],
+            [],
+            [],
+            [],
+            [],
+            user_skill_snapshot=get_user_skill_snapshot(self.users_data),
+        )
+
+        self.assertEqual(
+            changed_user_emails, ["registered@test.local", "updated@test.local"]
+        )
+        db.commit.assert_called_once()
+        retire_params = [
+            call.args[1]
+            for call in db.cypher_query.call_args_list
+            if "SET m:RetiredUserJobMatch" in call.args[0]
+        ]
+        self.assertEqual(retire_params, [{"changed_user_emails": changed_user_emails}])
+
+
+class NTriplesChunkTest(SimpleTestCase):
+    """Import chunked harus menghasilkan graph yang sama dengan import sekaligus"""
+
+    def test_chunks_rebuild_single_shot_graph(self):
+        graph = load_base_ontology()
+        self.assertTrue(any(isinstance(s, BNode) for s in graph.subjects()))
+        single_shot = Graph().parse(data=graph.serialize(format="turtle"))
+
+        for chunk_size in (1, 50, len(graph)):
+            with self.subTest(chunk_size=chunk_size):
+                # Setiap parse punya blank node sendiri, sama seperti tiap
+                # panggilan n10s.rdf.import.inline
+                chunked = Graph()
+                triple_count = 0
+                for rdf_data, chunk_triples in iter_ntriples_chunks(graph, chunk_size):
+                    chunked.parse(data=rdf_data, format="nt")
+                    triple_count += chunk_triples
+
+                self.assertEqual(triple_count, len(graph))
+                self.assertTrue(isomorphic(chunked, single_shot))
+
+
+class ImportIndexTest(SimpleTestCase):
+    """Index jobKey/email harus online sebelum batch UNWIND pertama"""
+
+    match_rows = [
+        {
+            "email": "user@test.local",
+            "jobKey": "key",
+            "similarity": 0.9,
+            "category": "Strong",
+        }
+    ]
+
+    def run_import(self, import_func):
+        db = mock.patch("api.services.matchers.matchers_neo4j_services.db").start()
+        self.addCleanup(mock.patch.stopall)
+        db.cypher_query.return_value = ([], None)
+
+        import_func(
+            [{"job_url": "https://test.local/jobs/0"}], [], [], self.match_rows, []
+        )
+        return [call.args[0] for call in db.cypher_query.call_args_list]
+
+    def assert_indexes_ready_before_batches(self, queries):
+        first_batch = next(
+            i for i, query in enumerate(queries) if "UNWIND $rows" in query
+        )
+        ready_queries = queries[:first_batch]
+        for node_type, property_name in (("Job", "jobKey"), ("User", "email")):
+            self.assertIn(
+                f"CREATE INDEX IF NOT EXISTS FOR (n:{node_type}) ON (n.{property_name})",
+                ready_queries,
+            )
+        self.assertIn("CALL db.awaitIndexes($timeout)", ready_queries)
+
+    def test_native_import_creates_indexes_first(self):
+        self.assert_indexes_ready_before_batches(
+            self.run_import(import_jobs_and_matches_to_neo4j)
+        )
+
+    def test_staged_import_creates_indexes_first(self):
+        self.assert_indexes_ready_before_batches(
+            self.run_import(import_jobs_and_matches_staged)
+        )
+
+
+class FakeBackupDatabase:
+    """Neo4j palsu untuk backup/restore: record backup tetap, query UNWIND dicatat"""
+
+    def __init__(self, users, relationships, live_users=None):
+        self.users = users
+        self.relationships = relationships
+        self.live_users = live_users if live_users is not None else {}
+        self.restore_queries = []
+        self.begin = self.commit = self.rollback = mock.Mock()
+
+    def cypher_query(self, query, params=None):
+        if "UNWIND $rows" in query:
+            self.restore_queries.append((query, params["rows"]))
+            if "MERGE (n:User {email: row.value})" in query:
+                self.apply_user_restore(query, params["rows"])
+            return [], None
+        if "db.labels()" in query:
+            return [["User"]], None
+        if "db.relationshipTypes()" in query:
+            return [["TRIGGERED_BY"]], None
+        if "MATCH (n:User)" in query:
+            return self.page(self.users, params), None
+        if "[r:TRIGGERED_BY]" in query:
+            return self.page(self.relationships, params), None
+        return [], None
+
+    def page(self, records, params):
+        return [record for record in records if record[0] > params["last_id"]][
+            : params["fetch_size"]
+        ]
+
+    def apply_user_restore(self, query, rows):
+        """Jalankan MERGE lalu SET n += ... di query restore User, sesuai urutan"""
+        set_clauses = re.findall(r"SET n \+= (\S+)", query)
+        assert set_clauses, query
+        for row in rows:
+            node = self.live_users.setdefault(row["value"], {"email": row["value"]})
+            live_n = dict(node)
+            for clause in set_clauses:
+                node.update(row["props"] if clause == "row.props" else live_n)
+
+
+@override_settings(NEO4J_BACKUP_FETCH_SIZE=2)
+class BackupRestoreRoundTripTest(SimpleTestCase):
+    """Backup di disk harus di-restore dengan data yang sama dan tidak menimpa data live"""
+
+    backup_config = {
+        "node_labels": ["User"],
+        "relationship_types": ["TRIGGERED_BY"],
+        "nodes_with_relationships": [],
+    }
+
+    def setUp(self):
+        backup_root = tempfile.TemporaryDirectory()
+        self.addCleanup(backup_root.cleanup)
+        self.enterContext(override_settings(NEO4J_BACKUP_DIR=backup_root.name))
+
+    def test_backup_files_round_trip_through_restore(self):
+        user_props = [
+            {"email": f"user{i}@test.local", "uid": f"uid-{i}", "name": f"User {i}"}
+            for i in range(5)
+        ]
+        fake_db = FakeBackupDatabase(
+            [[i, props, ["User"]] for i, props in enumerate(user_props)],
+            [
+                [0, {}, "TRIGGERED_BY", ["ScrapingTask"], ["User"]]
+                + [{"uid": "task-0", "status": "done"}, user_props[0]]
+            ],
+        )
+        with mock.patch(
+            "api.services.matchers.matchers_neo4j_backup_restore_services.db",
+            fake_db,
+        ):
+            backup_data = perform_full_dynamic_backup(self.backup_config)
+            backup_data = load_backup(backup_data["backup_dir"])
+            self.assertTrue(perform_full_dynamic_restore_with_enrichment(backup_data))
+
+        (user_query, user_rows), (relationship_query, relationship_rows) = (
+            fake_db.restore_queries
+        )
+        self.assertEqual(
+            [row["props"] for row in user_rows],
+            [{"role": "user", **props} for props in user_props],
+        )
+        self.assertEqual(relationship_rows[0]["end_props"], user_props[0])
+        self.assertEqual(load_backup(backup_data["backup_dir"])["status"], "restored")
+        for query in (user_query, relationship_query):
+            self.assertNotRegex(query, r"SET \w+ = row\.")
+
+    def test_live_values_win_over_backup_values(self):
+        fake_db = FakeBackupDatabase(
+            [
+                [0, {"email": "a@test.local", "name": "Old", "phone": "111"}, ["User"]],
+                [1, {"email": "b@test.local", "name": "Deleted"}, ["User"]],
+            ],
+            [],
+        )
+        with mock.patch(
+            "api.services.matchers.matchers_neo4j_backup_restore_services.db",
+            fake_db,
+        ):
+            backup_data = perform_full_dynamic_backup(self.backup_config)
+            # Profile diubah setelah backup dibuat, user b terhapus oleh import
+            fake_db.live_users["a@test.local"] = {
+                "email": "a@test.local",
+                "name": "New",
+                "role": "admin",
+            }
+            self.assertTrue(perform_full_dynamic_restore_with_enrichment(backup_data))
+
+        self.assertEqual(
+            fake_db.live_users,
+            {
+                "a@test.local": {
+                    "email": "a@test.local",
+                    "name": "New",
+                    "role": "admin",
+                    "phone": "111",
+                },
+                "b@test.local": {
+                    "email": "b@test.local",
+                    "name": "Deleted",
+                    "role": "user",
+                },
+            },
+        )
+
+    def test_unwritable_backup_folder_raises(self):
+        backup_file = tempfile.NamedTemporaryFile()
+        self.addCleanup(backup_file.close)
+        fake_db = FakeBackupDatabase([], [])
+
+        with override_settings(NEO4J_BACKUP_DIR=backup_file.name), mock.patch(
+            "api.services.matchers.matchers_neo4j_backup_restore_services.db",
+            fake_db,
+        ):
+            with self.assertRaises(BackupError):
+                perform_full_dynamic_backup(self.backup_config)
+
+    @skipUnless(is_neo4j_available(), "Neo4j is not reachable")
+    def test_restore_keeps_live_properties(self):
+        self.addCleanup(
+            db.cypher_query, "MATCH (n:BackupTestUser|BackupTestTask) DETACH DELETE n"
+        )
+        db.cypher_query("""
+            CREATE (:BackupTestTask {uid: "task-0", status: "done"})
+                -[:BACKUP_TEST_TRIGGERED_BY]->
+                (:BackupTestUser {email: "user@test.local", name: "Old"})
+            """)
+        backup_data = perform_full_dynamic_backup(
+            {
+                "node_labels": ["BackupTestUser", "BackupTestTask"],
+                "relationship_types": ["BACKUP_TEST_TRIGGERED_BY"],
+                "nodes_with_relationships": [],
+            }
+        )
+        db.cypher_query("""
+            MATCH (u:BackupTestUser {email: "user@test.local"})
+            SET u.name = "New"
+            WITH u
+            MATCH (t:BackupTestTask)
+            DETACH DELETE t
+            """)
+
+        self.assertTrue(perform_full_dynamic_restore_with_enrichment(backup_data))
+
+        result, _ = db.cypher_query("""
+            MATCH (t:BackupTestTask)-[:BACKUP_TEST_TRIGGERED_BY]->(u:BackupTestUser)
+            RETURN t.status, u.name
+            """)
+        self.assertEqual(result, [["done", "New"]])
+
+
+class ImportAndCleanTest(SimpleTestCase):
+    def test_additional_skills_survive_failed_restore(self):
+        neo4j_services = "api.services.matchers.matchers_neo4j_services"
+        backup_restore = "api.services.matchers.matchers_neo4j_backup_restore_services"
+        for target in (
+            f"{neo4j_services}.import_to_neo4j_from_graph",
+            f"{neo4j_services}.fix_resource_nodes_to_skills",
+            f"{neo4j_services}.clean_up_neo4j",
+            f"{neo4j_services}.remove_all_resource_labels_and_uris",
+            f"{neo4j_services}.convert_match_labels_to_property",
+            f"{neo4j_services}.create_indexes",
+            f"{backup_restore}.perform_full_dynamic_backup",
+        ):
+            mock.patch(target).start()
+        self.addCleanup(mock.patch.stopall)
+        mock.patch(
+            f"{backup_restore}.recover_pending_backups", return_value=False
+        ).start()
+        mock.patch(
+            f"{backup_restore}.perform_full_dynamic_restore_with_enrichment",
+            return_value=False,
+        ).start()
+        add_skills = mock.patch(
+            f"{backup_restore}.enrich_job_additional_skills"
+        ).start()
+        db = mock.patch(f"{neo4j_services}.db").start()
+        missing_skills_map = {"https://test.local/jobs/0": ["skill yang tidak ada"]}
+
+        import_and_clean_neo4j_with_enrichment(
+            None, missing_skills_map=missing_skills_map
+        )
+
+        add_skills.assert_called_once_with(missing_skills_map)
+        self.assertEqual(db.begin.call_count, db.commit.call_count)
+
+
+class JobKeyTest(SimpleTestCase):
+    job_urls = [
+        "https://glints.com/id/opportunities/jobs/backend-engineer/1",
+        "https://glints.com/id/opportunities/jobs/backend-engineer/1/",
+        "https://GLINTS.com/id/opportunities/jobs/backend-engineer/1",
+        "https://glints.com/id/opportunities/jobs/backend-engineer/1#apply",
+    ]
+
+    def test_distinct_job_urls_never_share_job_key(self):
+        job_keys = [build_job_key(job_url) for job_url in self.job_urls]
+
+        self.assertEqual(len(set(job_keys)), len(self.job_urls))
+        self.assertEqual(job_keys[0], build_job_key(self.job_urls[0]))
+
+    def test_distinct_job_urls_are_separate_ontology_jobs(self):
+        graph, _ = import_all_jobs_to_ontology(
+            load_base_ontology(),
+            [
+                {"job_url": job_url, "required_skills": ["Python"]}
+                for job_url in self.job_urls
+            ],
+        )
+
+        self.assertEqual(
+            len(set(graph.subjects(RDF.type, TALENT_NAMESPACE["Job"]))),
+            len(self.job_urls),
+        )
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    SCRAPING_DOMAIN_MIN_INTERVAL=0,
+)
+class BrowserProfileTest(SimpleTestCase):
+    """Opsi Chrome untuk profil full (default) dan lean"""
+
+    def build_driver(self, lean_browser):
+        with override_settings(SCRAPING_LEAN_BROWSER=lean_browser), mock.patch.object(
+            helper.uc, "ChromeOptions", ChromeOptions
+        ), mock.patch.object(helper.uc, "Chrome") as chrome, mock.patch(
+            "api.services.admin.scrapers.helper.stealth"
+        ), mock.patch(
+            "api.services.admin.scrapers.helper.get_fake_user_agent",
+            return_value="test-agent",
+        ):
+            driver = helper.get_driver()
+
+        return driver, chrome.call_args.kwargs["options"]
+
+    def get_disabled_features(self, options):
+        (argument,) = [
+            argument
+            for argument in options.arguments
+            if argument.startswith("--disable-features=")
+        ]
+        return argument.split("=", 1)[1].split(",")
+
+    def test_full_profile_keeps_default_chrome(self):
+        driver, options = self.build_driver(lean_browser=False)
+
+        self.assertEqual(options.page_load_strategy, "normal")
+        self.assertNotIn("prefs", options.experimental_options)
+        for argument in helper.LEAN_BROWSER_ARGUMENTS:
+            self.assertNotIn(argument, options.arguments)
+        self.assertEqual(self.get_disabled_features(options), ["VizDisplayCompositor"])
+        driver.execute_cdp_cmd.assert_not_called()
+
+    def test_lean_profile_blocks_assets(self):
+        driver, options = self.build_driver(lean_browser=True)
+
+        self.assertEqual(options.page_load_strategy, "eager")
+        self.assertEqual(
+            options.experimental_options["prefs"][
+                "profile.managed_default_content_settings.images"
+            ],
+            2,
+        )
+        for argument in helper.LEAN_BROWSER_ARGUMENTS:
+            self.assertIn(argument, options.arguments)
+        self.assertEqual(
+            self.get_disabled_features(options),
+            ["VizDisplayCompositor"] + helper.LEAN_BROWSER_DISABLED_FEATURES,
+        )
+        driver.execute_cdp_cmd.assert_any_call(
+            "Network.setBlockedURLs", {"urls": helper.LEAN_BROWSER_BLOCKED_URLS}
+        )
+
+
+# Progress dan flag cancel scraping disimpan di cache, Redis tidak tersedia saat test
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class DriverPoolTest(SimpleTestCase):
+    def test_pool_reports_progress_from_bound_celery_task(self):
+        job_urls = [f"https://test.local/jobs/{i}" for i in range(6)]
+
+        job_details, progress = scrape_in_bound_task.apply(args=(job_urls,)).get()
+
+        self.assertEqual(job_details, [{"job_url": job_url} for job_url in job_urls])
+        self.assertEqual(progress, sorted(progress))
+        self.assertEqual(progress[-1], len(job_urls))
+
+
+GLINTS_JOB_MAIN = (
+    '<main><div><div><img srcset="a.png 100w, b.png 300w"></div>'
+    "<div><div><div><h1> Backend Dev </h1></div><div><div><a>ACME</a></div></div>"
+    "</div></div></div><div></div><div><div><div><span>IDR 5.000.000</span></div>"
+    "</div><div></div><div>Penuh Waktu · Kerja di kantor</div><div>Minimal S1</div>"
+    "<div>1 – 3 tahun pengalaman</div></div></main>"
+)
+GLINTS_JOB_PAGE = (
+    "<html><body><div></div><div><div><div><div></div><div><div></div><div><div>"
+    "<div><label></label><label></label><label><a>Jawa Barat</a></label>"
+    "<label><a>Bandung</a></label><label><a>Coblong</a></label></div></div>"
+    f"<div><div>{GLINTS_JOB_MAIN}</div></div></div></div></div></div></div>"
+    '<div class="Opportunitysc__SkillsContainer-sc-gb4ubh-10 jccjri">'
+    "<label>Python</label><label>SQL</label></div>"
+    '<div class="DraftjsReadersc__ContentContainer-sc-zm0o3p-0 pVRwR">'
+    "Hi &amp; <b>bold</b> tail</div></body></html>"
+)
+KALIBRR_JOB_HEADER = (
+    '<div><div><kb-company-logo><a><div><img src="/logo.png"></div></a>'
+    "</kb-company-logo><h1>Data Eng</h1><span><a><h2>Co</h2></a></span><ul>"
+    '<li><a><span itemprop="addressLocality"> Jakarta\n Selatan </span></a></li>'
+    '<li><a href="/job-board/sgt/1">Rp 10.000.000</a></li>'
+    '<li><a href="/job-board/t/full">Penuh waktu</a></li>'
+    '<li><a href="/x/y/h"><span>i</span><span>Hibrida</span></a></li></ul></div></div>'
+)
+KALIBRR_JOB_PAGE = (
+    "<html><body><kb-app-root><div><main><div><kb-job-full-page><div><div>"
+    f"<kb-job-page><div><div>{KALIBRR_JOB_HEADER}</div></div></kb-job-page>"
+    "</div></div></kb-job-full-page></div></main></div></kb-app-root>"
+    '<a href="/job-board/e/s1">Sarjana</a>'
+    '<div class="md:k-w-full md:k-pr-4 k-p-space"><h2>Deskripsi Pekerjaan</h2>'
+    "<div><p>Do</p></div><h2>Kualifikasi Minimum</h2><div><ul><li>X</li></ul></div>"
+    "</div></body></html>"
+)
+
+
+class JobDetailParserTest(SimpleTestCase):
+    """Parser lxml harus menghasilkan field yang sama dengan XPath Selenium"""
+
+    def parse(self, scraper, page_source, job_url):
+        job_detail = scraper.parse_job_details(page_source, job_url)
+        self.assertIn("scraped_at", job_detail)
+        return {k: v for k, v in job_detail.items() if k != "scraped_at"}
+
+    def test_glints_job_page(self):
+        self.assertEqual(
+            self.parse(glints_scraper, GLINTS_JOB_PAGE, "https://glints.com/job/1"),
+            {
+                "job_url": "https://glints.com/job/1",
+                "image_url": "b.png",
+                "job_title": "Backend Dev",
+                "company_name": "ACME",
+                "subdistrict": "Coblong",
+                "city": "Bandung",
+                "province": "Jawa Barat",
+                "salary": "IDR 5.000.000",
+                "employment_type": "Penuh Waktu",
+                "work_setup": "Kerja di kantor",
+                "minimum_education": "Minimal S1",
+                "minimum_experience": "1 – 3 tahun pengalaman",
+                "required_skills": ["Python", "SQL"],
+                "job_description": "Hi &amp; <b>bold</b> tail",
+            },
+        )
+
+    def test_kalibrr_job_page(self):
+        job_url = "https://www.kalibrr.com/c/a/jobs/1"
+        self.assertEqual(
+            self.parse(kalibrr_scraper, KALIBRR_JOB_PAGE, job_url),
+            {
+                "job_url": job_url,
+                "image_url": "https://www.kalibrr.com/logo.png",
+                "job_title": "Data Eng",
+                "company_name": "Co",
+                "subdistrict": None,
+                "city": "Jakarta Selatan",
+                "province": None,
+                "salary": "Rp 10.000.000",
+                "employment_type": "Penuh waktu",
+                "work_setup": "Hibrida",
+                "minimum_education": "Sarjana",
+                "minimum_experience": None,
+                "required_skills": None,
+                "job_description": "<h2>Deskripsi Pekerjaan</h2><p>Do</p>"
+                "<h2>Kualifikasi Minimum</h2><ul><li>X</li></ul>",
+            },
+        )
+
+    def test_page_without_job_has_no_title(self):
+        for scraper in (glints_scraper, kalibrr_scraper):
+            with self.subTest(scraper=scraper.__name__):
+                job_detail = self.parse(scraper, "<html></html>", "https://test.local")
+                self.assertIsNone(job_detail["job_title"])
+                self.assertTrue(job_detail["image_url"])
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    SCRAPING_DOMAIN_MIN_INTERVAL=0,
+)
+class HttpScraperTest(SimpleTestCase):
+    def test_fetches_corpus_pages_from_bound_celery_task(self):
+        corpus_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(corpus_dir.cleanup)
+        job_urls = [f"https://glints.com/id/opportunities/jobs/{i}" for i in range(4)]
+        for job_url in job_urls[:3]:
+            record_page(job_url, GLINTS_JOB_PAGE, corpus_dir.name)
+        server, base_url = start_corpus_server(corpus_dir.name)
+        self.addCleanup(server.shutdown)
+
+        with override_settings(SCRAPING_HTTP_BASE_URL=base_url):
+            job_details, failed_positions, progress = (
+                fetch_over_http_in_bound_task.apply(args=(job_urls,)).get()
+            )
+
+        self.assertEqual(sorted(job_details), [0, 1, 2])
+        self.assertEqual(job_details[1]["job_url"], job_urls[1])
+        self.assertEqual(job_details[1]["job_title"], "Backend Dev")
+        self.assertEqual(failed_positions, [3])
+        self.assertEqual(progress[-1], 3)
+
+    def test_replay_without_base_url_never_fetches_live_site(self):
+        corpus_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(corpus_dir.cleanup)
+        job_url = "https://glints.com/id/opportunities/jobs/0"
+        record_page(job_url, GLINTS_JOB_PAGE, corpus_dir.name)
+        self.addCleanup(self.shutdown_replay_server, corpus_dir.name)
+
+        session = create_http_session([])
+        self.addCleanup(session.close)
+        with override_settings(
+            SCRAPING_CORPUS_MODE="replay",
+            SCRAPING_CORPUS_DIR=corpus_dir.name,
+            SCRAPING_HTTP_BASE_URL="",
+        ), mock.patch.object(session, "get", wraps=session.get) as session_get:
+            page_source = fetch_page_source(session, job_url)
+            missing_page = fetch_page_source(session, f"{job_url}-missing")
+
+        self.assertEqual(page_source, GLINTS_JOB_PAGE)
+        self.assertIsNone(missing_page)
+        self.assertEqual(session_get.call_count, 2)
+        for call in session_get.call_args_list:
+            self.assertTrue(call.args[0].startswith("http://127.0.0.1:"))
+
+    def shutdown_replay_server(self, corpus_dir):
+        server, _ = scraper_corpus._replay_servers.pop(corpus_dir)
+        server.shutdown()
+        server.server_close()
+
+
+class SkillTaxonomyTest(SimpleTestCase):
+    """Index taxonomy, similarity matrix dan lexicon vs jalur SPARQL asli"""
+
+    def setUp(self):
+        self.taxonomy = get_skill_taxonomy()
+        self.skill_uris = random.Random(0).sample(self.taxonomy["skill_uris"], 25)
+
+    def test_ancestors_match_get_limited_ancestors(self):
+        graph = load_base_ontology()
+        for skill_uri in self.skill_uris:
+            with self.subTest(skill=skill_uri):
+                self.assertEqual(
+                    set(self.taxonomy["ancestors"][skill_uri]),
+                    get_limited_ancestors(graph, skill_uri),
+                )
+
+    def test_similarity_matrix_matches_pairwise_sanchez(self):
+        similarity_matrix = get_skill_similarity_matrix()
+        ancestors = self.taxonomy["ancestors"]
+        skill_index = self.taxonomy["skill_index"]
+
+        self.assertEqual(similarity_matrix.dtype, np.float32)
+        for skill_a in self.skill_uris:
+            for skill_b in self.skill_uris:
+                self.assertAlmostEqual(
+                    float(
+                        similarity_matrix[skill_index[skill_a], skill_index[skill_b]]
+                    ),
+                    sanchez_similarity(ancestors[skill_a], ancestors[skill_b]),
+                    places=6,
+                )
+
+    def test_lexicon_resolves_names_like_importer(self):
+        lexicon = get_skill_lexicon()
+        skill_name = get_skill_name(self.skill_uris[0])
+        skill_id = self.taxonomy["skill_index"][self.skill_uris[0]]
+
+        skill_ids, missing_skills = resolve_skill_ids(
+            lexicon,
+            [skill_name, f"  {skill_name.upper()} ", "skill yang tidak ada"],
+        )
+
+        self.assertEqual(skill_ids, [skill_id])
+        self.assertEqual(missing_skills, ["skill yang tidak ada"])
+
+    def test_lexicon_special_cases(self):
+        lexicon = get_skill_lexicon()
+        for skill_name, ontology_name in (("C#", "cs"), ("CI/CD", "ci cd")):
+            with self.subTest(skill=skill_name):
+                self.assertTrue(resolve_skill_ids(lexicon, [ontology_name])[0])
+                self.assertEqual(
+                    resolve_skill_ids(lexicon, [skill_name])[0],
+                    resolve_skill_ids(lexicon, [ontology_name])[0],
+                )
+
+
+class MatchCategoryBinsTest(SimpleTestCase):
+    """Bin searchsorted harus sama dengan evaluate_rule per score"""
+
+    def test_bins_match_rules_on_edges_and_random_scores(self):
+        rules = get_match_category_rules()
+        self.assertTrue(rules)
+
+        edges = sorted(
+            float(rule[key])
+            for rule in rules.values()
+            for key in ("threshold", "min_threshold", "max_threshold")
+            if key in rule
+        )
+        scores = [0.0, 1.0, -0.5, 1.5]
+        for edge in edges:
+            scores.extend(
+                [edge, np.nextafter(edge, -np.inf), np.nextafter(edge, np.inf)]
+            )
+        scores.extend(random.Random(0).random() for _ in range(200))
+
+        self.assertEqual(
+            categorize_similarity_scores(scores),
+            [categorize_similarity_score(score, rules) for score in scores],
+        )
+
+
+class MatchingScoreFormulaTest(SimpleTestCase):
+    """
+    Endpoint single-user memakai top len(job skills), engine batch memakai
+    rata-rata semua skill user; kedua rumus ada di aggregate_skill_similarities
+    """
+
+    def setUp(self):
+        skill_names = get_ontology_skill_names()
+        lexicon = get_skill_lexicon()
+        self.user_skills = skill_names[:3]
+        self.job_skills = skill_names[:1]
+        similarity_matrix = get_skill_similarity_matrix()
+        job_skill_id = resolve_skill_ids(lexicon, self.job_skills)[0][0]
+        self.best_matches = [
+            float(similarity_matrix[user_skill_id, job_skill_id])
+            for user_skill_id in resolve_skill_ids(lexicon, self.user_skills)[0]
+        ]
+        self.jobs_data = [
+            {"job_url": "https://test.local/jobs/0", "required_skills": self.job_skills}
+        ]
+
+    def test_formulas_differ_when_user_has_extra_skills(self):
+        self.assertEqual(
+            aggregate_skill_similarities(self.best_matches, job_skill_count=1), 1.0
+        )
+        self.assertLess(aggregate_skill_similarities(self.best_matches), 1.0)
+
+    @override_settings(MATCHING_TOP_K=0, MATCHING_MIN_SCORE=0.0)
+    def test_single_user_path_uses_top_job_skill_count(self):
+        matches = calculate_categorized_matches_for_user_skills(
+            self.user_skills, self.jobs_data
+        )
+
+        self.assertEqual(len(matches), 1)
+        self.assertAlmostEqual(
+            matches[0]["similarity"],
+            aggregate_skill_similarities(self.best_matches, job_skill_count=1),
+        )
+
+    def test_batch_engine_uses_mean_over_user_skills(self):
+        matches = score_users_against_jobs(
+            [{"email": "user@test.local", "skills": self.user_skills}],
+            self.jobs_data,
+        )
+
+        self.assertEqual(len(matches), 1)
+        self.assertAlmostEqual(
+            matches[0]["similarity"],
+            aggregate_skill_similarities(self.best_matches),
+            places=6,
+        )
+
+
+class TopKMatchesTest(SimpleTestCase):
+    """Heap top-K harus sama dengan sort penuh, seri dimenangkan job paling awal"""
+
+    def test_heap_keeps_best_matches_in_job_order(self):
+        rng = random.Random(0)
+        similarities = [rng.choice([0.25, 0.5, 0.75, 0.9]) for _ in range(50)]
+
+        for top_k in (0, 1, 5, 50, 80):
+            with self.subTest(top_k=top_k):
+                heap = []
+                for position, similarity in enumerate(similarities):
+                    push_top_k_match(
+                        heap, top_k, similarity, position, {"position": position}
+                    )
+
+                ranked = sorted(
+                    range(len(similarities)),
+                    key=lambda position: (-similarities[position], position),
+                )
+                expected = sorted(ranked[:top_k] if top_k > 0 else ranked)
+                self.assertEqual(
+                    [match["position"] for match in pop_top_k_matches(heap)],
+                    expected,
+                )
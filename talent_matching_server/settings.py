@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 
 import datetime
 import os
+import sys
 from pathlib import Path
 
 from neomodel import config
@@ -175,7 +176,8 @@ config.DATABASE_URL = NEOMODEL_NEO4J_BOLT_URL
 REDIS_URL = os.getenv(
     "REDIS_URL", "redis://redis:6379/0"
 )  # Pastikan fallback ke localhost
-print(f"🔗 Using REDIS_URL: {REDIS_URL}")
+# Banner ke stderr agar stdout management command (JSON) tetap bersih
+print(f"🔗 Using REDIS_URL: {REDIS_URL}", file=sys.stderr)
 
 CACHES = {
     "default": {
@@ -192,14 +194,71 @@ CELERY_REDIS_HOST = os.getenv("CELERY_REDIS_HOST", "redis")
 CELERY_REDIS_PORT = int(os.getenv("CELERY_REDIS_PORT", "6379"))
 CELERY_REDIS_DB = int(os.getenv("CELERY_REDIS_DB", "0"))
 
-print(f"⚡ Celery Broker: {CELERY_BROKER_URL}")
-print(f"📦 Cache Location: {CACHES['default']['LOCATION']}")
+print(f"⚡ Celery Broker: {CELERY_BROKER_URL}", file=sys.stderr)
+print(f"📦 Cache Location: {CACHES['default']['LOCATION']}", file=sys.stderr)
 
 CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 
 CELERY_IMPORTS = ("api.tasks",)
 
+# Matching configuration
+# "python" (loop per user/job) atau "numpy" (batch vectorized, hasil sama)
+MATCHING_ENGINE = os.getenv("MATCHING_ENGINE", "python")
+MATCHING_USER_BLOCK_SIZE = int(os.getenv("MATCHING_USER_BLOCK_SIZE", "256"))
+# Jumlah process untuk matching setelah scraping (1 = tanpa process pool).
+# Pool dibuat dengan billiard sehingga jalan di worker Celery prefork (default)
+MATCHING_WORKERS = int(os.getenv("MATCHING_WORKERS", "1"))
+# "full" (import ulang semua job) atau "incremental" (hanya job baru/berubah)
+MATCHING_MODE = os.getenv("MATCHING_MODE", "full")
+# Hanya simpan top-K job per user (0 = semua) dengan similarity minimal MATCHING_MIN_SCORE
+MATCHING_TOP_K = int(os.getenv("MATCHING_TOP_K", "0"))
+MATCHING_MIN_SCORE = float(os.getenv("MATCHING_MIN_SCORE", "0"))
+# "n10s" (serialize Turtle + neosemantics), "chunked" (neosemantics per batch
+# N-Triples), "native" (UNWIND batch langsung) atau "staged" (native + flip
+# generation tanpa maintenance mode)
+NEO4J_IMPORT_MODE = os.getenv("NEO4J_IMPORT_MODE", "n10s")
+NEO4J_IMPORT_BATCH_SIZE = int(os.getenv("NEO4J_IMPORT_BATCH_SIZE", "1000"))
+# Jumlah triple per panggilan n10s.rdf.import.inline pada mode "chunked"
+NEO4J_IMPORT_CHUNK_SIZE = int(os.getenv("NEO4J_IMPORT_CHUNK_SIZE", "5000"))
+# Batas tunggu index (jobKey, email, ...) online sebelum batch import pertama (detik)
+NEO4J_INDEX_AWAIT_TIMEOUT = int(os.getenv("NEO4J_INDEX_AWAIT_TIMEOUT", "300"))
+# Backup node User/task sebelum import n10s (NDJSON gzip + manifest per backup)
+NEO4J_BACKUP_DIR = os.getenv("NEO4J_BACKUP_DIR", os.path.join(BASE_DIR, "backups"))
+# Jumlah record per query saat backup, menjaga memory tetap konstan
+NEO4J_BACKUP_FETCH_SIZE = int(os.getenv("NEO4J_BACKUP_FETCH_SIZE", "1000"))
+# Jumlah backup yang sudah di-restore yang tetap disimpan
+NEO4J_BACKUP_KEEP = int(os.getenv("NEO4J_BACKUP_KEEP", "3"))
+
+# Scraping configuration
+# Jumlah Chrome driver yang scrape detail job bersamaan per website
+# (1 = satu driver, naikkan lewat env untuk driver pool)
+SCRAPING_WORKERS = int(os.getenv("SCRAPING_WORKERS", "1"))
+# Politeness per domain: maksimal request bersamaan dan jarak minimal (detik)
+# antar request ke domain yang sama
+SCRAPING_DOMAIN_MAX_CONCURRENCY = int(
+    os.getenv("SCRAPING_DOMAIN_MAX_CONCURRENCY", "2")
+)
+SCRAPING_DOMAIN_MIN_INTERVAL = float(os.getenv("SCRAPING_DOMAIN_MIN_INTERVAL", "1.0"))
+# "selenium" (semua halaman lewat Chrome) atau "http" (requests dengan cookies
+# login, Chrome hanya untuk login dan fallback halaman yang gagal)
+SCRAPING_BACKEND = os.getenv("SCRAPING_BACKEND", "selenium")
+SCRAPING_HTTP_WORKERS = int(os.getenv("SCRAPING_HTTP_WORKERS", "4"))
+SCRAPING_HTTP_TIMEOUT = float(os.getenv("SCRAPING_HTTP_TIMEOUT", "15"))
+# Base URL server lokal yang menyajikan halaman rekaman (kosong = website asli)
+SCRAPING_HTTP_BASE_URL = os.getenv("SCRAPING_HTTP_BASE_URL", "")
+# "record" (simpan semua halaman dan cookies yang diambil ke corpus gzip),
+# "replay" (pakai corpus tanpa login/website asli) atau kosong
+SCRAPING_CORPUS_MODE = os.getenv("SCRAPING_CORPUS_MODE", "")
+SCRAPING_CORPUS_DIR = os.getenv(
+    "SCRAPING_CORPUS_DIR", os.path.join(BASE_DIR, "scraper_corpus")
+)
+# Lean browser: page load eager, blokir gambar/media/font/analytics/iklan lewat
+# DevTools. Opt-in karena eager load dan request yang diblokir bisa mengubah
+# halaman yang dirender (konten lazy-load, deteksi bot); aktifkan dengan "true"
+# setelah log_page_load_timings dan hasil scraping dibandingkan dengan Chrome penuh
+SCRAPING_LEAN_BROWSER = os.getenv("SCRAPING_LEAN_BROWSER", "false").lower() == "true"
+
 # Media files configuration
 MEDIA_URL = "/media/"
 MEDIA_ROOT = os.path.join(BASE_DIR, "uploaded_files")